@@ -4,29 +4,14 @@ Kee Credit Risk Model - Visual UI for Client Presentation
 Shows the complete journey from data ingestion to model serving
 """
 
+from startup_profiler import get_profiler
+from contextlib import nullcontext
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime
-import json
-import numpy as np
-from credit_officer_enhanced_section import render_credit_officer_dashboard
-import os
 
+# Stage modules (and plotly) are imported lazily by render_stage()
+from stages import STAGES, load_stage, render_stage
+from metrics import format_duration, format_ms, get_registry, start_metrics_server, timed
 
-# Load real customer data
-@st.cache_data
-def load_customer_data():
-    """Load real customer data from CSV file"""
-    try:
-        df = pd.read_csv('dashboard_data.csv')
-        return df
-    except:
-        return None
-
-# Get customer data
-customer_df = load_customer_data()
 
 # Page configuration
 st.set_page_config(
@@ -36,6 +21,18 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Local Prometheus endpoint (KEE_METRICS_PORT), started once per process
+start_metrics_server()
+
+# Startup profiling (KEE_PROFILE_STARTUP=1) - first script run of the process only
+profiler = get_profiler()
+profiling = profiler is not None and not profiler.finished
+if profiling:
+    profiler.import_modules()
+    from customer_data import load_customer_data
+    with profiler.span("data", "load_customer_data"):
+        load_customer_data()
+
 # Custom CSS for Professional Styling
 st.markdown("""
 <style>
@@ -181,16 +178,7 @@ with st.sidebar:
     # Stage Selection with custom styling
     stage = st.radio(
         "Select Stage",
-        [
-            "🏠 Overview",
-            "📥 1. Data Ingestion",
-            "📊 2. EDA & Data Profiling",
-            "🔧 3. Feature Engineering",
-            "🤖 4. Model Training",
-            "🚀 5. Model Deployment",
-            "📈 6. Dashboards",
-            "💬 AI Assistant"
-        ],
+        list(STAGES),
         label_visibility="collapsed"
     )
     
@@ -293,14 +281,25 @@ with st.sidebar:
     </div>
     """, unsafe_allow_html=True)
     
-    st.markdown("""
-    <div style='background: #d4edda; padding: 10px 12px; border-radius: 8px; border-left: 3px solid #28a745;'>
+    # Measured in-process: stage render success rate and latency since start
+    registry = get_registry()
+    renders = registry.overall("stage_render_seconds")
+    render_errors = registry.counter("stage_render_errors_total")
+    success_rate = 100.0 * (1 - render_errors / renders["count"]) if renders["count"] else 100.0
+    if success_rate >= 99.0:
+        health_bg, health_fg, health_accent, health_label, health_icon = "#d4edda", "#155724", "#28a745", "All Systems Operational", "✓"
+    else:
+        health_bg, health_fg, health_accent, health_label, health_icon = "#fff3cd", "#856404", "#ffc107", "Degraded Performance", "⚠"
+    
+    st.markdown(f"""
+    <div style='background: {health_bg}; padding: 10px 12px; border-radius: 8px; border-left: 3px solid {health_accent};'>
         <div style='display: flex; align-items: center; justify-content: space-between;'>
             <div>
-                <div style='color: #155724; font-size: 0.75rem; font-weight: 600;'>All Systems Operational</div>
-                <div style='color: #155724; font-size: 0.65rem; margin-top: 2px;'>Uptime: 99.97%</div>
+                <div style='color: {health_fg}; font-size: 0.75rem; font-weight: 600;'>{health_label}</div>
+                <div style='color: {health_fg}; font-size: 0.65rem; margin-top: 2px;'>Uptime: {format_duration(registry.uptime_seconds())} · {success_rate:.2f}% OK</div>
+                <div style='color: {health_fg}; font-size: 0.65rem; margin-top: 2px;'>P95 render: {format_ms(renders["p95"])}</div>
             </div>
-            <div style='color: #28a745; font-size: 1.5rem;'>✓</div>
+            <div style='color: {health_accent}; font-size: 1.5rem;'>{health_icon}</div>
         </div>
     </div>
     """, unsafe_allow_html=True)
@@ -309,2133 +308,16 @@ with st.sidebar:
     
     # Footer info
 
-# AI Assistant Response Generator
-def generate_ai_response(query):
-    """Generate intelligent responses based on user queries"""
-    query_lower = query.lower()
-    
-    # High-risk customers query
-    if "high risk" in query_lower or "high-risk" in query_lower:
-        return """
-### 🔴 High-Risk Customers Analysis
-
-Based on our credit risk model, here are the key findings:
-
-**High-Risk Customer Profile:**
-- **Count**: 150 customers (3.3% of total)
-- **Average Kee Score**: 0.78 (High Risk)
-- **Total Exposure**: AED 2.4M
-
-**Key Risk Factors:**
-1. **High Volatility** (avg: 0.82) - Inconsistent purchasing patterns
-2. **Days Since Last Order** (avg: 145 days) - Long periods of inactivity
-3. **Low GMV Slope** (avg: -0.15) - Declining sales trend
-4. **AECB Credit Score** (avg: 580) - Below acceptable threshold
-5. **High Bounce Rate** (avg: 8.5%) - Payment issues
-
-**Recommended Actions:**
-- ✅ Implement stricter credit limits
-- ✅ Require additional collateral or guarantors
-- ✅ Increase monitoring frequency
-- ✅ Consider credit insurance
-
-**Sample High-Risk Customers:**
-- Customer 8234: Kee Score 0.85, GMV AED 45K, Volatility 0.91
-- Customer 9156: Kee Score 0.82, GMV AED 32K, 180 days inactive
-- Customer 7421: Kee Score 0.79, GMV AED 28K, AECB Score 545
-"""
-    
-    # Customer profile analysis
-    elif "customer" in query_lower and ("8697" in query or "profile" in query_lower):
-        return """
-### 👤 Customer Profile Analysis - ID: 8697
-
-**Risk Assessment:**
-- **Kee Score**: 0.23 (Very Low Risk) ✅
-- **Risk Category**: Premium Low-Risk Customer
-- **Credit Limit Recommendation**: AED 250,000
-
-**Financial Metrics:**
-- **Total GMV**: AED 156,420 (Top 5%)
-- **Monthly Average**: AED 13,035
-- **Active Months**: 34 out of 36
-- **Total Orders**: 287
-
-**Behavioral Indicators:**
-- **Volatility**: 0.18 (Very Stable) ✅
-- **GMV Slope**: +0.42 (Strong Growth) ✅
-- **Days Since Last Order**: 3 days (Highly Active) ✅
-- **Order Frequency**: 8.5 orders/month
-
-**External Data:**
-- **AECB Credit Score**: 745 (Excellent) ✅
-- **Bank Balance**: AED 85,000 (avg)
-- **Payment Partner Score**: 82/100 (Low Risk)
-- **LOS Income**: AED 12,500/month
-- **DEWA Payment Rate**: 100% (Perfect)
-
-**Top Risk Drivers (SHAP Analysis):**
-1. Low Volatility → -0.15 (Reduces Risk)
-2. High GMV → -0.12 (Reduces Risk)
-3. Recent Activity → -0.08 (Reduces Risk)
-4. Strong AECB Score → -0.06 (Reduces Risk)
-
-**Recommendation**: ✅ **APPROVE** - Excellent candidate for credit extension
-"""
-    
-    # Premium customers query
-    elif "premium" in query_lower and "low risk" in query_lower:
-        return """
-### 💎 Premium Low-Risk Customers
-
-**Overview:**
-- **Total Count**: 38 customers
-- **Combined GMV**: AED 8.2M (18% of total)
-- **Average Kee Score**: 0.19 (Very Low Risk)
-- **Average GMV**: AED 215,789
-
-**Characteristics:**
-- ✅ Consistent high-value transactions
-- ✅ Low volatility (avg: 0.21)
-- ✅ Strong growth trajectory (avg slope: +0.38)
-- ✅ Excellent credit scores (avg AECB: 728)
-- ✅ Perfect payment history
-
-**Top 5 Premium Customers:**
-
-1. **Customer 8697** - GMV: AED 156K, Risk: 0.23
-2. **Customer 12453** - GMV: AED 342K, Risk: 0.18
-3. **Customer 9821** - GMV: AED 289K, Risk: 0.21
-4. **Customer 15678** - GMV: AED 267K, Risk: 0.19
-5. **Customer 11234** - GMV: AED 245K, Risk: 0.22
-
-**Business Opportunities:**
-- 💰 Offer premium credit lines (AED 200K-500K)
-- 🎁 Loyalty rewards program
-- 📈 Cross-sell additional products
-- 🤝 VIP relationship management
-
-**Retention Strategy:**
-- Dedicated account managers
-- Preferential pricing
-- Extended payment terms
-- Priority support
-"""
-    
-    # Risk trends query
-    elif "trend" in query_lower or "pattern" in query_lower:
-        return """
-### 📈 Credit Risk Trends Analysis
-
-**Overall Portfolio Health:**
-- **Very Low Risk**: 70.9% (3,210 customers) ✅
-- **Low Risk**: 18.7% (845 customers) ✅
-- **Medium Risk**: 7.1% (320 customers) ⚠️
-- **High Risk**: 2.5% (115 customers) 🔴
-- **Very High Risk**: 0.8% (35 customers) 🔴
-
-**Key Trends Identified:**
-
-**1. Positive Trends** ✅
-- 15% increase in low-risk customers (last 6 months)
-- Average AECB scores improving (+12 points)
-- Payment consistency up 8%
-- Customer engagement increasing
-
-**2. Areas of Concern** ⚠️
-- 3.2% of customers showing declining GMV
-- 125 inactive customers (no orders in 90+ days)
-- Seasonal volatility in Q4
-- 5.8% delinquency rate in AECB data
-
-**3. Emerging Patterns** 🔍
-- Strong correlation between DEWA payment consistency and credit risk
-- LOS employment tenure is a key predictor
-- Payment Partner velocity scores highly predictive
-- Multi-source data improves accuracy by 15.7%
-
-**Risk Concentration:**
-- Top 10% customers = 45% of total exposure
-- Geographic concentration in Dubai (68%)
-- Industry concentration in retail (42%)
-
-**Recommendations:**
-1. Diversify portfolio to reduce concentration risk
-2. Implement early warning system for declining customers
-3. Enhance monitoring of medium-risk segment
-4. Develop re-engagement program for inactive customers
-"""
-    
-    # Feature importance query
-    elif "feature" in query_lower and "important" in query_lower:
-        return """
-### 🎯 Feature Importance Analysis
-
-**Top 15 Most Important Features:**
-
-**Behavioral Features:**
-1. **Volatility** (15.6%) - Consistency of purchasing behavior
-2. **Days Since Last Order** (14.2%) - Recency of activity
-3. **Order Frequency** (4.2%) - Engagement level
-
-**Financial Features:**
-4. **GMV Slope** (12.8%) - Growth trajectory
-5. **Sales 12M** (11.5%) - Long-term value
-6. **Sales 6M** (9.8%) - Medium-term value
-7. **Sales 3M** (8.7%) - Short-term value
-8. **Monthly GMV** (7.6%) - Current spending level
-
-**External Credit Data:**
-9. **AECB Credit Score** (6.5%) - Credit bureau score
-10. **Payment Partner Kee Score** (5.4%) - Payment behavior
-11. **Bank Bounce Rate** (4.8%) - Payment reliability
-12. **LOS Debt-to-Income** (4.2%) - Financial capacity
-
-**Stability Indicators:**
-13. **Active Months** (6.5%) - Tenure and consistency
-14. **Consistency Score** (5.4%) - Pattern stability
-15. **DEWA Payment Rate** (3.8%) - Utility payment behavior
-
-**Key Insights:**
-
-📊 **Behavioral features** (volatility, recency, frequency) account for **34%** of model decisions
-
-💰 **Financial metrics** (GMV, sales trends) contribute **50%** to risk assessment
-
-🏦 **External data** (AECB, bank, LOS, DEWA) provides **16%** additional predictive power
-
-**Feature Interactions:**
-- Volatility + GMV Slope = Strong risk indicator
-- AECB Score + Bank Bounce Rate = Credit reliability
-- Days Since Last Order + Order Frequency = Engagement score
-
-**Model Performance:**
-- ROC AUC: 98.7%
-- Precision: 96.2%
-- Recall: 94.8%
-- F1 Score: 95.5%
-"""
-    
-    # Compare customers query
-    elif "compare" in query_lower:
-        return """
-### 🔄 Customer Comparison Analysis
-
-**Comparing: Customer 8697 vs Customer 12345**
-
-| Metric | Customer 8697 | Customer 12345 | Winner |
-|--------|---------------|----------------|--------|
-| **Kee Score** | 0.23 (Low) | 0.67 (High) | 🟢 8697 |
-| **Total GMV** | AED 156K | AED 45K | 🟢 8697 |
-| **Volatility** | 0.18 (Stable) | 0.78 (Volatile) | 🟢 8697 |
-| **GMV Slope** | +0.42 (Growing) | -0.23 (Declining) | 🟢 8697 |
-| **Days Since Last Order** | 3 days | 87 days | 🟢 8697 |
-| **AECB Score** | 745 | 598 | 🟢 8697 |
-| **Active Months** | 34/36 | 18/36 | 🟢 8697 |
-| **Order Frequency** | 8.5/month | 2.1/month | 🟢 8697 |
-
-**Key Differences:**
-
-**Customer 8697** ✅
-- Consistent high-value customer
-- Strong growth trajectory
-- Excellent credit history
-- Highly engaged
-- **Recommendation**: Approve credit up to AED 250K
-
-**Customer 12345** ⚠️
-- Declining sales trend
-- Irregular purchasing pattern
-- Below-average credit score
-- Reduced engagement
-- **Recommendation**: Limit credit to AED 25K with monitoring
-
-**Risk Factors Comparison:**
-
-**8697 Strengths:**
-- Low volatility reduces risk by 15%
-- High GMV reduces risk by 12%
-- Recent activity reduces risk by 8%
-
-**12345 Concerns:**
-- High volatility increases risk by 18%
-- Declining GMV increases risk by 14%
-- Inactivity increases risk by 11%
-"""
-    
-    # Default response
-    else:
-        return f"""
-### 🤖 AI Assistant Response
-
-I understand you're asking about: **"{query}"**
-
-I can help you with various credit risk analysis tasks:
-
-**Available Queries:**
-- 🔍 **Customer Analysis**: "Analyze customer profile for ID [number]"
-- 📊 **Risk Segmentation**: "Show high-risk customers" or "Find premium customers"
-- 📈 **Trends**: "What are the risk trends?"
-- 🎯 **Features**: "Which features are most important?"
-- 🔄 **Comparisons**: "Compare customers [ID1] and [ID2]"
-- 💰 **Financial**: "Show customers by GMV" or "Analyze payment patterns"
-- 🏦 **Credit Decisions**: "Should we approve credit for customer [ID]?"
-
-**Example Queries:**
-- "Find all high-risk customers with GMV over 50K"
-- "Analyze the risk profile for customer 8697"
-- "What are the top risk factors in our portfolio?"
-- "Show me premium customers with excellent AECB scores"
-- "Compare risk profiles of customers 8697 and 12345"
-
-Please try one of the example buttons above or ask a specific question!
-"""
-
-# Helper function to create journey flow diagram
-def create_journey_flow():
-    """Create a visual journey flow using Streamlit columns instead of plotly"""
-    # This function now returns None and we'll use Streamlit columns directly
-    return None
-
-# Main content based on selected stage
-if stage == "🏠 Overview":
-    st.markdown('<div class="main-header">Kee Credit Risk Model</div>', unsafe_allow_html=True)
-    st.markdown("### End-to-End ML Pipeline for Credit Risk Assessment")
-    
-    # Journey flow diagram - Card-based visual
-    st.markdown("#### 🔄 ML Pipeline Journey")
-    
-    # Create 6 columns for the journey stages
-    cols = st.columns(6)
-    
-    stages = [
-        ("📥", "Data\nIngestion", "#e3f2fd"),
-        ("📊", "EDA &\n Data Profiling", "#f3e5f5"),
-        ("🔧", "Feature\nEngineering", "#e8f5e9"),
-        ("🤖", "Model\nTraining", "#fff3e0"),
-        ("🚀", "Model\nDeployment", "#fce4ec"),
-        ("📈", "Dashboards\n", "#e0f2f1")
-    ]
-    
-    for i, (col, (icon, name, color)) in enumerate(zip(cols, stages)):
-        with col:
-            st.markdown(f"""
-            <div style='
-                background-color: {color};
-                padding: 20px 10px;
-                border-radius: 10px;
-                text-align: center;
-                border: 2px solid #1f77b4;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                height: 120px;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-            '>
-                <div style='font-size: 32px; margin-bottom: 8px;'>{icon}</div>
-                <div style='font-size: 13px; font-weight: bold; color: #333; line-height: 1.3;'>{name}</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Add arrow except for last column
-            if i < 5:
-                st.markdown("<div style='text-align: center; font-size: 24px; color: #1f77b4; margin-top: -10px;'>→</div>", unsafe_allow_html=True)
-    
-    # Overview metrics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Data Sources", "6", help="Distribution Partner, Payment Partner, Bank, AECB")
-    with col2:
-        st.metric("Total Records", "24,350", help="Unique customers analyzed")
-    with col3:
-        st.metric("Features Engineered", "58", help="Advanced risk indicators")
-    with col4:
-        st.metric("Model Accuracy", "98.7%", help="Logistic Regression performance")
-    
-    st.markdown("---")
-    
-    # Journey stages overview
-    st.markdown("### 📋 Stages")
-    
-    stages_data = {
-        "Stage": ["1. Data Ingestion", "2. EDA & Profiling", "3. Feature Engineering", 
-                  "4. Model Training", "5. Model Deployment", "6. Dashboards"],
-        "Status": ["✅ Complete", "✅ Complete", "✅ Complete", "✅ Complete", "✅ Complete", "✅ Complete"],
-        # "Duration": ["2 hours", "4 hours", "6 hours", "3 hours", "2 hours", "Ongoing"],
-        "Key Output": [
-            "Unified dataset (4,525 customers)",
-            "Data quality report & insights",
-            "58 engineered features",
-            "Trained LR model (98.7% ROC AUC)",
-            "REST API + Batch predictions",
-            "4 persona-specific dashboards"
-        ]
-    }
-    
-    df_stages = pd.DataFrame(stages_data)
-    st.dataframe(df_stages, use_container_width=True, hide_index=True)
-    
-    st.markdown("---")
-    
-    # Key Insights
-    # st.markdown("### 💡 Key Insights")
-    
-    # col1, col2, col3 = st.columns(3)
-    
-    # with col1:
-    #     st.markdown("""
-    #     **Data Integration**
-    #     - ✅ Integrated 6 diverse data sources
-    #     - ✅ Processed 4,525 unique customers
-    #     - ✅ 96.8% data completeness
-    #     - ✅ Real-time data pipeline
-    #     """)
-    
-    # with col2:
-    #     st.markdown("""
-    #     **Model Performance**
-    #     - ✅ 98.7% model ROC AUC
-    #     - ✅ 58 engineered features
-    #     - ✅ Full explainability with SHAP
-    #     - ✅ Production-ready deployment
-    #     """)
-    
-    # with col3:
-    #     st.markdown("""
-    #     **Business Value**
-    #     - ✅ Real-time risk assessment
-    #     - ✅ 4 persona-specific dashboards
-    #     - ✅ Automated decision support
-    #     - ✅ Scalable architecture
-    #     """)
-
-elif stage == "📥 1. Data Ingestion":
-    st.markdown('<div class="stage-header">📥 Stage 1: Data Ingestion</div>', unsafe_allow_html=True)
-    st.markdown("### Multi-Source Data Integration Pipeline")
-    
-    # Data sources overview
-    st.markdown("#### 📊 Data Sources")
-    
-    col1, col2 = st.columns([1, 2])
-    
-    with col1:
-        sources_data = {
-            "Source": ["Distribution Partner Data", "Payment Partner", "Bank Transactions", "AECB Data", "LOS Data", "Dewa Bills"],
-            "Records": ["4,525", "4,525", "3,200", "4,100", "4,200", "3,800"],
-            "Status": ["✅", "✅", "✅", "✅", "✅", "✅"]
-        }
-        st.dataframe(pd.DataFrame(sources_data), use_container_width=True, hide_index=True)
-    
-    # with col2:
-    #     # Data source pie chart
-    #     fig = go.Figure(data=[go.Pie(
-    #         labels=["Distribution Partner", "Payment Partner", "Bank", "AECB"],
-    #         values=[4525, 4525, 3200, 4100],
-    #         hole=0.4,
-    #         marker_colors=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
-    #     )])
-    #     fig.update_layout(title="Data Source Coverage", height=300)
-    #     st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("---")
-    
-    # Detailed data source information
-    st.markdown("#### 📋 Data Source Details")
-    
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["🏢 Distribution Partner Data", "💳 Payment Partner", "🏦 Bank Transactions", "📊 AECB Data", "🏢 LOS Data", "⚡ Dewa Bills"])
-    
-    with tab1:
-        st.markdown("**Distribution Partner Transactional Data**")
-        st.markdown("""
-        - **Source**: Internal transaction database
-        - **Records**: 4,525 unique customers
-        - **Time Period**: Last 36 months
-        - **Key Fields**:
-          - Customer ID, Outlet Name
-          - Order history (dates, amounts, SKUs)
-          - GMV (Gross Merchandise Value)
-          - Order frequency and recency
-          - Product categories and diversity
-        - **Update Frequency**: Real-time
-        - **Data Quality**: 99.8% complete
-        """)
-        
-        # conektr_metrics = {
-        #     "Metric": ["Total Customers", "Total Orders", "Total GMV", "Avg Orders/Customer", "Data Completeness"],
-        #     "Value": ["4,525", "125,430", "AED 58.4M", "27.7", "99.8%"]
-        # }
-        # st.dataframe(pd.DataFrame(conektr_metrics), use_container_width=True, hide_index=True)
-    
-    with tab2:
-        st.markdown("**Payment Partner (Kee Score & Payment Intelligence)**")
-        st.markdown("""
-        - **Source**: Payment Partner API integration
-        - **Records**: 4,525 customers (matched)
-        - **Key Fields**:
-          - Payment behavior scores
-          - Transaction velocity indicators
-          - Fraud risk indicators
-          - Spending patterns
-          - Credit utilization metrics
-        - **Update Frequency**: Weekly
-        - **Match Rate**: 100% (all Distribution Partner customers matched)
-        """)
-        
-        # mc_metrics = {
-        #     "Metric": ["Matched Customers", "Avg Kee Score", "High Risk %", "Medium Risk %", "Low Risk %"],
-        #     "Value": ["4,525", "72.3/100", "8.2%", "23.5%", "68.3%"]
-        # }
-        # st.dataframe(pd.DataFrame(mc_metrics), use_container_width=True, hide_index=True)
-    
-    with tab3:
-        st.markdown("**Bank Transaction Data**")
-        st.markdown("""
-        - **Source**: Bank statement parsing (PDF/CSV)
-        - **Records**: 3,200 customers (70.7% coverage)
-        - **Time Period**: Last 12 months
-        - **Key Fields**:
-          - Account balance trends
-          - Cash flow patterns
-          - Income stability
-          - Expense categories
-          - Bounce/NSF incidents
-        - **Update Frequency**: Monthly
-        - **Data Quality**: 95.2% complete
-        """)
-        
-        # bank_metrics = {
-        #     "Metric": ["Customers with Data", "Avg Monthly Balance", "Avg Monthly Income", "Bounce Rate", "Coverage"],
-        #     "Value": ["3,200", "AED 45,230", "AED 12,450", "2.3%", "70.7%"]
-        # }
-        # st.dataframe(pd.DataFrame(bank_metrics), use_container_width=True, hide_index=True)
-    
-    with tab4:
-        st.markdown("**AECB (Al Etihad Credit Bureau) Data**")
-        st.markdown("""
-        - **Source**: AECB API integration
-        - **Records**: 4,100 customers (90.6% coverage)
-        - **Key Fields**:
-          - Credit score
-          - Credit history length
-          - Active loans and credit cards
-          - Payment history
-          - Delinquency records
-          - Credit inquiries
-        - **Update Frequency**: Monthly
-        - **Match Rate**: 90.6%
-        """)
-        
-        # aecb_metrics = {
-        #     "Metric": ["Customers with Data", "Avg Credit Score", "Active Loans %", "Delinquency Rate", "Coverage"],
-        #     "Value": ["4,100", "685", "45.2%", "5.8%", "90.6%"]
-        # }
-        # st.dataframe(pd.DataFrame(aecb_metrics), use_container_width=True, hide_index=True)
-    
-    with tab5:
-        st.markdown("**LOS (Loan Origination System) Data**")
-        st.markdown("""
-        - **Source**: Internal LOS system integration
-        - **Records**: 4,200 loan applications (matched)
-        - **Key Fields**:
-          - Loan amount requested and approved
-          - Employment details and tenure
-          - Monthly income and obligations
-          - Loan purpose and risk category
-          - Collateral and guarantor information
-          - Application status and decision timeline
-        - **Update Frequency**: Real-time
-        - **Match Rate**: 92.8% (4,200 out of 4,525 customers)
-        """)
-        # los_metrics = {
-        #     "Metric": ["Matched Customers", "Avg Loan Amount", "Approval Rate", "Avg Income", "Employment Rate"],
-        #     "Value": ["4,200", "AED 125K", "68%", "AED 8,500", "94%"]
-        # }
-        # st.dataframe(pd.DataFrame(los_metrics), use_container_width=True, hide_index=True)
-    
-    with tab6:
-        st.markdown("**Dewa Bills (Utility Payment History)**")
-        st.markdown("""
-        - **Source**: DEWA API integration
-        - **Records**: 3,800 customers (matched)
-        - **Key Fields**:
-          - Monthly electricity bill amounts
-          - Payment consistency and timeliness
-          - Late payment incidents and patterns
-          - Account age and history length
-          - Seasonal consumption patterns
-          - Disconnection/reconnection history
-        - **Update Frequency**: Monthly
-        - **Match Rate**: 84.0% (3,800 out of 4,525 customers)
-        """)
-        # dewa_metrics = {
-        #     "Metric": ["Matched Customers", "Avg Monthly Bill", "Payment Rate", "Late Payments", "Avg Account Age"],
-        #     "Value": ["3,800", "AED 285", "96.5%", "2.1%", "4.2 years"]
-        # }
-        # st.dataframe(pd.DataFrame(dewa_metrics), use_container_width=True, hide_index=True)
-    
-    st.markdown("---")
-    
-    # Data integration process
-    st.markdown("#### 🔄 Data Integration Process")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Integration Steps**")
-        st.markdown("""
-        1. **Extract**: Pull data from 6 sources
-        2. **Transform**: Standardize formats and schemas
-        3. **Match**: Link records using customer IDs
-        4. **Validate**: Check data quality and completeness
-        5. **Load**: Store in unified data warehouse
-        6. **Audit**: Log all transformations
-        """)
-    
-    with col2:
-        st.markdown("**Data Quality Checks**")
-        st.markdown("""
-        - ✅ Duplicate detection and removal
-        - ✅ Missing value imputation
-        - ✅ Outlier detection and handling
-        - ✅ Schema validation
-        - ✅ Referential integrity checks
-        - ✅ Temporal consistency validation
-        """)
-    
-    # Final unified dataset
-    st.markdown("---")
-    st.markdown("#### 📦 Unified Dataset")
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Customers", "4,525")
-    with col2:
-        st.metric("Total Fields", "156")
-    with col3:
-        st.metric("Data Completeness", "96.8%")
-    # with col4:
-    #     st.metric("Processing Time", "2 hours")
-
-elif stage == "📊 2. EDA & Data Profiling":
-    st.markdown('<div class="stage-header">📊 Stage 2: EDA & Data Profiling</div>', unsafe_allow_html=True)
-    st.markdown("### Exploratory Data Analysis & Quality Assessment")
-    
-    # Data profile summary
-    st.markdown("#### 📋 Data Profile Summary")
-    
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("Customers", "4,525")
-    with col2:
-        st.metric("Features", "156")
-    with col3:
-        st.metric("Completeness", "96.8%")
-    with col4:
-        st.metric("Outliers", "3.2%")
-    with col5:
-        st.metric("Duplicates", "0")
-    
-    st.markdown("---")
-    
-    # Key distributions
-    st.markdown("#### 📈 Key Data Distributions")
-    
-    tab1, tab3, tab4 = st.tabs(["GMV Distribution",  "Customer Segments", "Temporal Patterns"])
-    
-    with tab1:
-        # GMV distribution
-        gmv_data = np.random.lognormal(9, 1.5, 4525)
-        fig = px.histogram(x=gmv_data, nbins=50, title="Customer GMV Distribution")
-        fig.update_layout(
-            xaxis_title="GMV (AED)", 
-            yaxis_title="Number of Customers", 
-            height=400,
-            showlegend=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Mean GMV", "AED 12,912")
-        with col2:
-            st.metric("Median GMV", "AED 1,606")
-        with col3:
-            st.metric("Max GMV", "AED 1.9M")
-    
-    # with tab2:
-    #     # Risk categories
-    #     risk_data = pd.DataFrame({
-    #         "Risk Category": ["Very Low Risk", "Low Risk", "Medium Risk", "High Risk", "Very High Risk"],
-    #         "Count": [3210, 845, 320, 115, 35],
-    #         "Percentage": [70.9, 18.7, 7.1, 2.5, 0.8]
-    #     })
-        
-    #     fig = px.bar(risk_data, x="Risk Category", y="Count", 
-    #                  title="Risk Category Distribution",
-    #                  color="Risk Category",
-    #                  color_discrete_map={
-    #                      "Very Low Risk": "#28a745",
-    #                      "Low Risk": "#90ee90",
-    #                      "Medium Risk": "#ffc107",
-    #                      "High Risk": "#ff7f0e",
-    #                      "Very High Risk": "#dc3545"
-    #                  })
-    #     fig.update_layout(height=400)
-    #     st.plotly_chart(fig, use_container_width=True)
-        
-    #     st.dataframe(risk_data, use_container_width=True, hide_index=True)
-    
-    with tab3:
-        # Customer segments
-        segment_data = pd.DataFrame({
-            "Segment": ["Premium", "Standard", "Growing", "At-Risk", "Inactive"],
-            "Count": [450, 2100, 1200, 650, 125],
-            "Avg GMV": [85000, 15000, 8000, 5000, 2000]
-        })
-        
-        fig = px.pie(segment_data, values="Count", names="Segment", 
-                     title="Customer Segmentation",
-                     hole=0.4)
-        fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
-        
-        st.dataframe(segment_data, use_container_width=True, hide_index=True)
-    
-    with tab4:
-        # Temporal patterns
-        months = pd.date_range('2022-01-01', '2025-06-01', freq='M')
-        orders = np.random.poisson(3500, len(months)) + np.linspace(3000, 4500, len(months))
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=months, y=orders, mode='lines+markers', name='Monthly Orders'))
-        fig.update_layout(title="Order Volume Trend", xaxis_title="Month", yaxis_title="Orders", height=400)
-        st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("---")
-    
-    # Data quality metrics
-    st.markdown("#### ✅ Data Quality Metrics")
-    
-    quality_data = {
-        "Metric": [
-            "Completeness",
-            "Accuracy",
-            "Consistency",
-            "Timeliness",
-            "Validity",
-            "Uniqueness"
-        ],
-        "Score": [96.8, 98.2, 97.5, 99.1, 95.8, 100.0],
-        "Status": ["✅ Pass", "✅ Pass", "✅ Pass", "✅ Pass", "✅ Pass", "✅ Pass"],
-        "Issues": [
-            "3.2% missing values",
-            "1.8% potential errors",
-            "2.5% inconsistencies",
-            "0.9% delayed updates",
-            "4.2% invalid formats",
-            "0 duplicates"
-        ]
-    }
-    
-    df_quality = pd.DataFrame(quality_data)
-    st.dataframe(df_quality, use_container_width=True, hide_index=True)
-    
-    st.markdown("---")
-    
-    # Key insights
-    # st.markdown("#### 💡 Key Insights from EDA")
-    
-    col1, col2 = st.columns(2)
-    
-    # with col1:
-    #     st.markdown("**Positive Findings**")
-    #     st.markdown("""
-    #     - ✅ 70.9% customers are Very Low Risk
-    #     - ✅ Strong data quality (96.8% complete)
-    #     - ✅ No duplicate records
-    #     - ✅ Clear segmentation patterns
-    #     - ✅ Positive growth trend in orders
-    #     - ✅ High AECB coverage (90.6%)
-    #     """)
-    
-    # with col2:
-    #     st.markdown("**Areas for Improvement**")
-    #     st.markdown("""
-    #     - ⚠️ Bank data coverage at 70.7%
-    #     - ⚠️ High GMV variance (skewed distribution)
-    #     - ⚠️ 3.2% outliers need investigation
-    #     - ⚠️ Some missing AECB scores
-    #     - ⚠️ Seasonal patterns in order volume
-    #     - ⚠️ 125 inactive customers
-    #     """)
-
-elif stage == "🔧 3. Feature Engineering":
-    st.markdown('<div class="stage-header">🔧 Stage 3: Feature Engineering</div>', unsafe_allow_html=True)
-    st.markdown("### Advanced Feature Creation & Selection")
-    
-    # Feature engineering overview
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Raw Features", "156")
-    with col2:
-        st.metric("Engineered Features", "58")
-    with col3:
-        st.metric("Feature Reduction", "62.8%")
-    # with col4:
-    #     st.metric("Model Performance", "+15.7%")
-    
-    st.markdown("---")
-    
-    # Feature categories
-    st.markdown("#### 📊 Feature Categories")
-    
-    feature_categories = pd.DataFrame({
-        "Category": [
-            "Behavioral Features",
-            "Financial Features",
-            "Temporal Features",
-            "Engagement Features",
-            "Stability Features",
-            "Growth Features"
-        ],
-        "Count": [8, 7, 6, 5, 4, 2],
-        "Examples": [
-            "volatility, recency, frequency",
-            "GMV, sales_3m, sales_6m, sales_12m",
-            "days_since_last_order, active_months",
-            "total_orders, order_frequency",
-            "volatility, consistency_score",
-            "gmv_slope, mom_growth_3m"
-        ]
-    })
-    
-    st.dataframe(feature_categories, use_container_width=True, hide_index=True)
-    
-    st.markdown("---")
-    
-    # Detailed feature list
-    st.markdown("#### 📋 Complete Feature List (58 Features)")
-    
-    st.markdown("""
-    <div style='background: #f8f9fa; padding: 15px; border-radius: 10px; margin-bottom: 15px;'>
-        <p style='color: #666; margin: 0; font-size: 0.9rem;'>
-            Features engineered from <strong>6 data sources</strong>: Distribution Partner, Payment Partner, 
-            Bank Transactions, AECB Credit Bureau, LOS (Loan Origination), and Dewa Bills
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    features_data = {
-        "Feature Name": [
-            # Distribution Partner Features (12)
-            "volatility", "gmv_slope", "days_since_last_order", "active_months",
-            "total_orders", "total_gmv", "monthly_gmv", "sales_3m",
-            "sales_6m", "sales_12m", "mom_growth_3m", "top3_sku_share",
-            
-            # Payment Partner Features (10)
-            "rspi_risk_score", "payment_velocity", "transaction_frequency", "avg_transaction_amount",
-            "payment_consistency", "fraud_indicator_score", "spending_trend_3m", "credit_utilization_ratio",
-            "payment_method_diversity", "cross_border_txn_ratio",
-            
-            # Bank Transaction Features (10)
-            "avg_monthly_balance", "balance_volatility", "income_stability_score", "cash_flow_ratio",
-            "bounce_rate", "nsf_incidents", "deposit_frequency", "withdrawal_pattern_score",
-            "savings_ratio", "overdraft_frequency",
-            
-            # AECB Credit Bureau Features (10)
-            "aecb_credit_score", "credit_history_length", "active_loans_count", "total_credit_limit",
-            "credit_utilization", "delinquency_count", "payment_history_score", "credit_inquiry_count_6m",
-            "debt_to_income_ratio", "longest_delinquency_days",
-            
-            # LOS (Loan Origination) Features (8)
-            "loan_amount_requested", "loan_purpose_risk_score", "employment_tenure_months", "monthly_income",
-            "existing_obligations", "loan_to_income_ratio", "collateral_value", "guarantor_score",
-            
-            # Dewa Bills Features (5)
-            "avg_monthly_dewa_bill", "dewa_payment_consistency", "dewa_bill_trend", "late_payment_count_dewa",
-            "dewa_account_age_months",
-            
-            # Derived & Interaction Features (3)
-            "multi_source_risk_score", "financial_health_index", "risk_indicator"
-        ],
-        "Data Source": [
-            # Distribution Partner
-            "Distribution Partner", "Distribution Partner", "Distribution Partner", "Distribution Partner",
-            "Distribution Partner", "Distribution Partner", "Distribution Partner", "Distribution Partner",
-            "Distribution Partner", "Distribution Partner", "Distribution Partner", "Distribution Partner",
-            
-            # Payment Partner (RSPI)
-            "Payment Partner", "Payment Partner", "Payment Partner", "Payment Partner",
-            "Payment Partner", "Payment Partner", "Payment Partner", "Payment Partner",
-            "Payment Partner", "Payment Partner",
-            
-            # Bank
-            "Bank", "Bank", "Bank", "Bank",
-            "Bank", "Bank", "Bank", "Bank",
-            "Bank", "Bank",
-            
-            # AECB
-            "AECB", "AECB", "AECB", "AECB",
-            "AECB", "AECB", "AECB", "AECB",
-            "AECB", "AECB",
-            
-            # LOS
-            "LOS", "LOS", "LOS", "LOS",
-            "LOS", "LOS", "LOS", "LOS",
-            
-            # Dewa
-            "Dewa Bills", "Dewa Bills", "Dewa Bills", "Dewa Bills",
-            "Dewa Bills",
-            
-            # Derived
-            "Multi-Source", "Multi-Source", "Target"
-        ],
-        "Type": [
-            # Distribution Partner
-            "Behavioral", "Growth", "Temporal", "Engagement",
-            "Engagement", "Financial", "Financial", "Financial",
-            "Financial", "Financial", "Growth", "Behavioral",
-            
-            # Payment Partner
-            "Kee Score", "Behavioral", "Engagement", "Financial",
-            "Stability", "Kee Score", "Growth", "Financial",
-            "Behavioral", "Behavioral",
-            
-            # Bank
-            "Financial", "Stability", "Financial", "Financial",
-            "Risk Indicator", "Risk Indicator", "Behavioral", "Behavioral",
-            "Financial", "Risk Indicator",
-            
-            # AECB
-            "Credit Score", "Temporal", "Financial", "Financial",
-            "Financial", "Risk Indicator", "Credit Score", "Behavioral",
-            "Financial", "Risk Indicator",
-            
-            # LOS
-            "Financial", "Kee Score", "Temporal", "Financial",
-            "Financial", "Financial", "Financial", "Kee Score",
-            
-            # Dewa
-            "Financial", "Stability", "Growth", "Risk Indicator",
-            "Temporal",
-            
-            # Derived
-            "Composite", "Composite", "Target"
-        ],
-        "Importance": [
-            # Distribution Partner
-            "High", "High", "High", "Medium",
-            "Medium", "High", "High", "High",
-            "High", "Medium", "Medium", "Medium",
-            
-            # Payment Partner
-            "Very High", "High", "High", "Medium",
-            "High", "High", "Medium", "High",
-            "Medium", "Low",
-            
-            # Bank
-            "High", "High", "High", "High",
-            "Very High", "Very High", "Medium", "Medium",
-            "Medium", "High",
-            
-            # AECB
-            "Very High", "High", "High", "Medium",
-            "Very High", "Very High", "High", "Medium",
-            "Very High", "High",
-            
-            # LOS
-            "High", "High", "Medium", "Very High",
-            "High", "Very High", "Medium", "Medium",
-            
-            # Dewa
-            "Medium", "High", "Low", "High",
-            "Low",
-            
-            # Derived
-            "Very High", "Very High", "Target"
-        ]
-    }
-    
-    df_features = pd.DataFrame(features_data)
-    
-    # Filter by category
-    category_filter = st.selectbox(
-        "Filter by Category",
-        ["All"] + list(df_features["Type"].unique())
-    )
-    
-    if category_filter != "All":
-        df_filtered = df_features[df_features["Type"] == category_filter]
-    else:
-        df_filtered = df_features
-    
-    st.dataframe(df_filtered, use_container_width=True, hide_index=True)
-    
-    st.markdown("---")
-    
-    # Feature importance
-    st.markdown("#### 🎯 Top 15 Most Important Features")
-    
-    importance_data = pd.DataFrame({
-        "Rank": range(1, 16),
-        "Feature": [
-            "volatility", "days_since_last_order", "gmv_slope", "sales_12m",
-            "sales_6m", "sales_3m", "monthly_gmv", "active_months",
-            "consistency_score", "recency_score", "total_orders", "mom_growth_3m",
-            "engagement_score", "order_frequency", "top3_sku_share"
-        ],
-        "Importance Score": [
-            0.156, 0.142, 0.128, 0.115,
-            0.098, 0.087, 0.076, 0.065,
-            0.054, 0.048, 0.042, 0.038,
-            0.035, 0.031, 0.028
-        ],
-        "Impact": [
-            "↑ Higher = Higher Risk", "↑ Higher = Higher Risk", "↑ Higher = Lower Risk",
-            "↑ Higher = Lower Risk", "↑ Higher = Lower Risk", "↑ Higher = Lower Risk",
-            "↑ Higher = Lower Risk", "↑ Higher = Lower Risk", "↑ Higher = Lower Risk",
-            "↑ Higher = Lower Risk", "↑ Higher = Lower Risk", "↑ Higher = Lower Risk",
-            "↑ Higher = Lower Risk", "↑ Higher = Lower Risk", "↑ Higher = Lower Risk"
-        ]
-    })
-    
-    fig = px.bar(importance_data, x="Importance Score", y="Feature", 
-                 orientation='h', title="Feature Importance Ranking",
-                 color="Importance Score", color_continuous_scale="Blues")
-    fig.update_layout(height=500, yaxis={'categoryorder':'total ascending'})
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.dataframe(importance_data, use_container_width=True, hide_index=True)
-    
-    # st.markdown("---")
-    
-    # Feature engineering techniques
-    # st.markdown("#### 🛠️ Feature Engineering Techniques Applied")
-    
-    # col1, col2 = st.columns(2)
-    
-    # with col1:
-    #     st.markdown("**Transformation Techniques**")
-    #     st.markdown("""
-    #     1. **Log Transformation**: For skewed distributions
-    #        - `sales_3m_log = log(1 + sales_3m)`
-    #     2. **Polynomial Features**: Capture non-linear relationships
-    #        - `gmv_slope_squared = gmv_slope²`
-    #     3. **Interaction Features**: Combine related features
-    #        - `volatility_x_recency = volatility * days_since_last_order`
-    #     4. **Normalization**: Scale features to [0, 1]
-    #        - StandardScaler for all numeric features
-    #     5. **Binning**: Discretize continuous variables
-    #        - Risk categories from continuous scores
-    #     """)
-    
-    # with col2:
-    #     st.markdown("**Domain-Specific Features**")
-    #     st.markdown("""
-    #     1. **Recency Score**: `1 / (1 + days_since_last_order)`
-    #     2. **Consistency Score**: `1 - volatility`
-    #     3. **Engagement Score**: Composite of orders, frequency, recency
-    #     4. **Growth Score**: Weighted average of MoM growth rates
-    #     5. **Volatility**: `Std(orders) / Mean(orders)`
-    #     6. **GMV Slope**: Linear regression coefficient
-    #     """)
-
-
-elif stage == "🤖 4. Model Training":
-    st.markdown('<div class="stage-header">🤖 Stage 4: Model Training</div>', unsafe_allow_html=True)
-    st.markdown("### Machine Learning Model Development & Evaluation")
-    
-    # Model overview
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Model Type", "Logistic Regression")
-    # with col2:
-    #     st.metric("ROC AUC", "98.7%")
-    with col4:
-        st.metric("AUC-ROC", "0.987")
-    # with col4:
-    #     st.metric("Training Time", "3 hours")
-    
-    st.markdown("---")
-    
-    # Model selection
-    st.markdown("#### 🔍 Model Selection Process")
-    
-    model_comparison = pd.DataFrame({
-        "Model": [
-            "Logistic Regression",
-            "Random Forest",
-            "XGBoost",
-            "Neural Network",
-            "SVM"
-        ],
-        "ROC AUC": [98.7, 96.4, 96.4, 94.2, 92.8],
-        "AUC-ROC": [0.987, 0.964, 0.964, 0.960, 0.940],
-        "Training Time": ["3 hours", "8 hours", "6 hours", "12 hours", "5 hours"],
-        "Interpretability": ["High", "Medium", "Medium", "Low", "Low"],
-        "Selected": ["✅", "❌", "❌", "❌", "❌"]
-    })
-    
-    st.dataframe(model_comparison, use_container_width=True, hide_index=True)
-    
-    st.markdown("""
-    **Why Logistic Regression?**
-    - ✅ Best ROC AUC (98.7%)
-    - ✅ Highest AUC-ROC (0.987)
-    - ✅ Fast training (3 hours)
-    - ✅ High interpretability (regulatory requirement)
-    - ✅ Easy to explain to stakeholders
-    - ✅ Stable and reliable predictions
-    """)
-    
-    st.markdown("---")
-    
-    # Model performance
-    st.markdown("#### 📊 Model Performance Metrics")
-    
-    tab1, tab2, tab3, tab4 = st.tabs(["Confusion Matrix", "ROC Curve", "Precision-Recall", "Feature Importance"])
-    
-    with tab1:
-        # Confusion matrix
-        cm = np.array([[850, 45], [35, 3595]])
-        
-        fig = go.Figure(data=go.Heatmap(
-            z=cm,
-            x=['Predicted Low Risk', 'Predicted High Risk'],
-            y=['Actual Low Risk', 'Actual High Risk'],
-            text=cm,
-            texttemplate='%{text}',
-            colorscale='Blues'
-        ))
-        fig.update_layout(title="Confusion Matrix", height=400)
-        st.plotly_chart(fig, use_container_width=True)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("True Positives", "3,595")
-        with col2:
-            st.metric("True Negatives", "850")
-        with col3:
-            st.metric("False Positives", "45")
-        with col4:
-            st.metric("False Negatives", "35")
-    
-    with tab2:
-        # ROC curve
-        fpr = np.linspace(0, 1, 100)
-        tpr = 1 - (1 - fpr) ** 3
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=fpr, y=tpr, mode='lines', name='ROC Curve', line=dict(color='blue', width=3)))
-        fig.add_trace(go.Scatter(x=[0, 1], y=[0, 1], mode='lines', name='Random', line=dict(color='red', dash='dash')))
-        fig.update_layout(
-            title="ROC Curve (AUC = 0.96)",
-            xaxis_title="False Positive Rate",
-            yaxis_title="True Positive Rate",
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        st.metric("AUC-ROC Score", "0.96", help="Area Under the ROC Curve")
-    
-    with tab3:
-        # Precision-Recall curve
-        recall = np.linspace(0, 1, 100)
-        precision = 1 - recall * 0.1
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=recall, y=precision, mode='lines', name='PR Curve', line=dict(color='green', width=3)))
-        fig.update_layout(
-            title="Precision-Recall Curve",
-            xaxis_title="Recall",
-            yaxis_title="Precision",
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Precision", "98.8%")
-        with col2:
-            st.metric("Recall", "99.0%")
-        with col3:
-            st.metric("F1-Score", "98.9%")
-    
-    with tab4:
-        # Feature importance (already shown in feature engineering)
-        st.markdown("**Top 10 Features by Model Coefficients**")
-        
-        coef_data = pd.DataFrame({
-            "Feature": [
-                "volatility", "days_since_last_order", "gmv_slope",
-                "sales_12m", "sales_6m", "consistency_score",
-                "recency_score", "monthly_gmv", "active_months", "total_orders"
-            ],
-            "Coefficient": [2.34, 1.89, -1.67, -1.45, -1.23, -1.12, -0.98, -0.87, -0.76, -0.65],
-            "Impact": [
-                "↑ Increases Risk", "↑ Increases Risk", "↓ Decreases Risk",
-                "↓ Decreases Risk", "↓ Decreases Risk", "↓ Decreases Risk",
-                "↓ Decreases Risk", "↓ Decreases Risk", "↓ Decreases Risk", "↓ Decreases Risk"
-            ]
-        })
-        
-        fig = px.bar(coef_data, x="Coefficient", y="Feature", orientation='h',
-                     title="Model Coefficients", color="Coefficient",
-                     color_continuous_scale="RdYlGn")
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("---")
-    
-    # Model validation
-    st.markdown("#### ✅ Model Validation")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Cross-Validation Results**")
-        cv_data = pd.DataFrame({
-            "Fold": [1, 2, 3, 4, 5, "Mean", "Std"],
-            "ROC AUC": [98.8, 98.5, 98.7, 98.9, 98.6, 98.7, 0.15],
-            "AUC": [0.97, 0.95, 0.96, 0.96, 0.95, 0.96, 0.01]
-        })
-        st.dataframe(cv_data, use_container_width=True, hide_index=True)
-    
-    with col2:
-        st.markdown("**Holdout Test Set Results**")
-        test_metrics = {
-            "Metric": ["ROC AUC", "Accuracy", "Precision", "Recall", "F1-Score"],
-            "Train": [98.7, 95.0, 94.0, 96.0, 95.0],
-            "Test": [98.5, 94.8, 93.8, 95.8, 94.8]
-        }
-        st.dataframe(pd.DataFrame(test_metrics), use_container_width=True, hide_index=True)
-    
-    st.markdown("---")
-    
-    # Model hyperparameters
-    st.markdown("#### ⚙️ Model Hyperparameters")
-    
-    hyperparams = {
-        "Parameter": [
-            "Solver", "Penalty", "C (Regularization)", "Max Iterations",
-            "Class Weight", "Random State", "Convergence Tolerance"
-        ],
-        "Value": [
-            "lbfgs", "l2", "1.0", "1000", "balanced", "42", "1e-4"
-        ],
-        "Description": [
-            "Optimization algorithm",
-            "Regularization type",
-            "Inverse regularization strength",
-            "Maximum iterations for convergence",
-            "Handle imbalanced classes",
-            "Reproducibility seed",
-            "Stopping criterion"
-        ]
-    }
-    
-    st.dataframe(pd.DataFrame(hyperparams), use_container_width=True, hide_index=True)
-
-elif stage == "🚀 5. Model Deployment":
-    st.markdown('<div class="stage-header">🚀 Stage 5: Model Deployment</div>', unsafe_allow_html=True)
-    
-    # Professional header with description
-    st.markdown("""
-    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-        <h3 style='color: white; margin: 0 0 10px 0;'>Production Deployment & Serving Infrastructure</h3>
-        <p style='color: #f0f0f0; margin: 0; font-size: 0.95rem;'>Enterprise-grade ML deployment with real-time and batch prediction capabilities</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Key metrics with enhanced styling
-    st.markdown("#### 📊 Deployment Metrics")
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.markdown("""
-        <div style='background: #e3f2fd; padding: 20px; border-radius: 10px; border-left: 4px solid #2196F3;'>
-            <p style='color: #666; margin: 0; font-size: 0.85rem;'>Deployment Type</p>
-            <h2 style='color: #2196F3; margin: 5px 0 0 0;'>REST API + Batch</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    with col2:
-        st.markdown("""
-        <div style='background: #e8f5e9; padding: 20px; border-radius: 10px; border-left: 4px solid #4CAF50;'>
-            <p style='color: #666; margin: 0; font-size: 0.85rem;'>Avg Latency</p>
-            <h2 style='color: #4CAF50; margin: 5px 0 0 0;'>< 100ms</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    with col3:
-        st.markdown("""
-        <div style='background: #fff3e0; padding: 20px; border-radius: 10px; border-left: 4px solid #FF9800;'>
-            <p style='color: #666; margin: 0; font-size: 0.85rem;'>Throughput</p>
-            <h2 style='color: #FF9800; margin: 5px 0 0 0;'>1000 req/s</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    with col4:
-        st.markdown("""
-        <div style='background: #f3e5f5; padding: 20px; border-radius: 10px; border-left: 4px solid #9C27B0;'>
-            <p style='color: #666; margin: 0; font-size: 0.85rem;'>Uptime SLA</p>
-            <h2 style='color: #9C27B0; margin: 5px 0 0 0;'>99.9%</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    # Deployment Architecture with professional cards
-    # st.markdown("#### 🏗️ Deployment Architecture")
-    
-    # # Architecture layers
-    # arch_layers = [
-    #     ("🌐 Client Layer", "Web Dashboard • Mobile App • Credit Officer Portal", "#e3f2fd", "#2196F3"),
-    #     ("🔐 API Gateway", "Authentication • Rate Limiting • Load Balancing • Logging", "#fff3e0", "#FF9800"),
-    #     ("⚡ Serving Layer", "Real-time API (Flask) • Batch Pipeline (Airflow)", "#e8f5e9", "#4CAF50"),
-    #     ("🤖 Model Layer", "MLflow Registry • Version Control • A/B Testing", "#f3e5f5", "#9C27B0"),
-    #     ("💾 Data Layer", "Feature Store (Delta Lake) • Caching (Redis)", "#e1f5fe", "#03A9F4"),
-    #     ("📊 Monitoring", "Prometheus • Grafana • Alerting • Logging", "#fce4ec", "#E91E63")
-    # ]
-    
-    # for title, desc, bg_color, border_color in arch_layers:
-    #     st.markdown(f"""
-    #     <div style='background: {bg_color}; padding: 15px 20px; border-radius: 8px; border-left: 4px solid {border_color}; margin-bottom: 10px;'>
-    #         <h4 style='color: {border_color}; margin: 0 0 5px 0; font-size: 1.1rem;'>{title}</h4>
-    #         <p style='color: #666; margin: 0; font-size: 0.9rem;'>{desc}</p>
-    #     </div>
-    #     """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Deployment modes with enhanced tabs
-    st.markdown("#### 🔄 Deployment Modes")
-    
-    tab1, tab2 = st.tabs(["⚡ Real-time API", "📦 Batch Processing"])
-    
-    with tab1:
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            st.markdown("""
-            <div style='background: #f8f9fa; padding: 20px; border-radius: 10px; height: 100%;'>
-                <h4 style='color: #2196F3; margin-top: 0;'>🎯 Real-time Prediction API</h4>
-                <p style='color: #666; font-size: 0.9rem;'><strong>Endpoint:</strong> <code>POST /api/v1/predict</code></p>
-                <p style='color: #666; font-size: 0.9rem;'><strong>Authentication:</strong> Bearer Token (JWT)</p>
-                <p style='color: #666; font-size: 0.9rem;'><strong>Rate Limit:</strong> 1000 requests/minute</p>
-                <p style='color: #666; font-size: 0.9rem;'><strong>Response Time:</strong> < 100ms (P95)</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("**Request Example:**")
-            st.code("""
-{
-  "customer_id": "12345",
-  "features": {
-    "volatility": 0.25,
-    "days_since_last_order": 5,
-    "gmv_slope": 1234.5,
-    "sales_12m": 50000
-  }
-}
-            """, language="json")
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Performance metrics
-        perf_col1, perf_col2, perf_col3, perf_col4 = st.columns(4)
-        with perf_col1:
-            st.metric("Avg Latency", "85ms", "-5ms")
-        with perf_col2:
-            st.metric("P95 Latency", "120ms", "-8ms")
-        with perf_col3:
-            st.metric("P99 Latency", "180ms", "-12ms")
-        with perf_col4:
-            st.metric("Success Rate", "99.95%", "+0.02%")
-    
-    with tab2:
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            st.markdown("""
-            <div style='background: #f8f9fa; padding: 20px; border-radius: 10px;'>
-                <h4 style='color: #4CAF50; margin-top: 0;'>📊 Batch Prediction Pipeline</h4>
-                <p style='color: #666; font-size: 0.9rem;'><strong>Schedule:</strong> Daily at 2:00 AM UTC</p>
-                <p style='color: #666; font-size: 0.9rem;'><strong>Orchestration:</strong> Apache Airflow</p>
-                <p style='color: #666; font-size: 0.9rem;'><strong>Processing:</strong> Spark on SparQ</p>
-                <p style='color: #666; font-size: 0.9rem;'><strong>Output:</strong> Delta Lake Tables</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("**Pipeline Steps:**")
-            steps = [
-                "1️⃣ Extract customer data from warehouse",
-                "2️⃣ Compute features for all customers",
-                "3️⃣ Load latest model from MLflow",
-                "4️⃣ Generate predictions (4,525 customers)",
-                "5️⃣ Store results in Delta Lake",
-                "6️⃣ Update dashboards and reports",
-                "7️⃣ Send alerts for high-risk customers"
-            ]
-            for step in steps:
-                st.markdown(f"<p style='margin: 5px 0; color: #666;'>{step}</p>", unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Batch metrics
-        batch_col1, batch_col2, batch_col3, batch_col4 = st.columns(4)
-        with batch_col1:
-            st.metric("Processing Time", "15 min", "-2 min")
-        with batch_col2:
-            st.metric("Customers", "4,525", "+125")
-        with batch_col3:
-            st.metric("Success Rate", "99.8%", "+0.1%")
-        with batch_col4:
-            st.metric("Data Quality", "98.5%", "+0.3%")
-    
-    st.markdown("---")
-    
-    # Model versioning with enhanced table
-    st.markdown("#### 📦 Model Versioning & Registry")
-    
-    st.markdown("""
-    <div style='background: #f8f9fa; padding: 15px; border-radius: 10px; margin-bottom: 15px;'>
-        <p style='color: #666; margin: 0; font-size: 0.9rem;'>
-            <strong>MLflow Model Registry</strong> manages all model versions with full lineage tracking, 
-            automated testing, and seamless promotion from staging to production.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    versions_data = pd.DataFrame({
-        "Version": ["v1.0.0", "v1.1.0", "v1.2.0", "v2.0.0"],
-        "Date": ["2025-09-20", "2025-10-01", "2025-10-25", "2025-11-01"],
-        "ROC AUC": ["95.2%", "96.8%", "97.5%", "98.7%"],
-        "Status": ["📦 Archived", "📦 Archived", "🧪 Staging", "✅ Production"],
-        "Notes": [
-            "Initial release",
-            "Added cross connect features",
-            "Improved feature engineering",
-            "Current  model"
-        ]
-    })
-    
-    st.dataframe(versions_data, use_container_width=True, hide_index=True)
-    
-    st.markdown("---")
-    
-    # Monitoring with professional cards
-    st.markdown("#### 📊 Monitoring & Observability")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; color: white;'>
-            <h4 style='margin: 0 0 15px 0; color: white;'>✅ Performance Monitoring</h4>
-            <ul style='margin: 0; padding-left: 20px;'>
-                <li>Prediction accuracy tracking</li>
-                <li>Latency monitoring (P50, P95, P99)</li>
-                <li>Throughput & QPS tracking</li>
-                <li>Error rate monitoring</li>
-                <li>Model drift detection</li>
-                <li>Feature drift detection</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 20px; border-radius: 10px; color: white;'>
-            <h4 style='margin: 0 0 15px 0; color: white;'>🚨 Alerting Rules</h4>
-            <ul style='margin: 0; padding-left: 20px;'>
-                <li>ROC AUC drops below 95%</li>
-                <li>Latency exceeds 200ms (P95)</li>
-                <li>Error rate > 1%</li>
-                <li>Data drift detected (PSI > 0.2)</li>
-                <li>Model drift detected</li>
-                <li>API downtime > 1 minute</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Infrastructure with enhanced styling
-    st.markdown("#### 🖥️ Infrastructure & Resources")
-    
-    infra_data = pd.DataFrame({
-        "Component": [
-            "🌐 API Server",
-            "�� Model Serving",
-            "💾 Feature Store",
-            "🗄️ Database",
-            # "⚡ Cache Layer",
-            "📊 Monitoring"
-        ],
-        "Technology": [
-            "Flask + Gunicorn + Nginx",
-            "MLflow Model Serving",
-            "Delta Lake + Spark",
-            "PostgreSQL 14",
-            # "Redis 7.0",
-            "Prometheus + Grafana"
-        ],
-        "Resources": [
-            "4 vCPU, 8GB RAM",
-            "2 vCPU, 4GB RAM",
-            "Elastic (S3 + Spark)",
-            "4 vCPU, 16GB RAM",
-            # "2 vCPU, 4GB RAM",
-            "2 vCPU, 4GB RAM"
-        ]
-        # ,
-        # "Scaling": [
-        #     "Auto (2-10 instances)",
-        #     "Fixed (2 instances)",
-        #     "Elastic",
-        #     "Fixed",
-        #     "Fixed",
-        #     "Fixed"
-        # ],
-        # "Cost/Month": [
-        #     "$240",
-        #     "$80",
-        #     "$150",
-        #     "$160",
-        #     "$80",
-        #     "$80"
-        # ]
-    })
-    
-    st.dataframe(infra_data, use_container_width=True, hide_index=True)
-    
-    # Total cost
-    # st.markdown("""
-    # <div style='background: #e8f5e9; padding: 15px 20px; border-radius: 10px; border-left: 4px solid #4CAF50; margin-top: 15px;'>
-    #     <p style='color: #666; margin: 0;'><strong>Total Infrastructure Cost:</strong> <span style='color: #4CAF50; font-size: 1.2rem; font-weight: bold;'>$790/month</span></p>
-    # </div>
-    # """, unsafe_allow_html=True)
-
-elif stage == "📈 6. Dashboards":
-    st.markdown('<div class="stage-header">📈 Stage 6: Dashboards</div>', unsafe_allow_html=True)
-    st.markdown("### Role-Based Dashboards")
-    
-    # Dashboard selection
-    dashboard_type = st.selectbox(
-        "Select Dashboard to Preview",
-        [
-            "🎯 Executive Dashboard",
-            "🔬 Technical Dashboard",
-            "💼 Credit Officer Dashboard"
-        ]
-    )
-    
-    if dashboard_type == "🎯 Executive Dashboard":
-        # Executive Dashboard Implementation
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-            <h3 style='color: white; margin: 0;'>🎯 Executive Dashboard</h3>
-            <p style='color: #f0f0f0; margin: 10px 0 0 0;'>High-level portfolio overview and strategic insights</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Key Executive Metrics
-        st.markdown("#### 📊 Portfolio Overview")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Total Customers", "4,525", "+125 this month")
-        with col2:
-            st.metric("Total Credit Exposure", "AED 58.4M", "+8.2%")
-        with col3:
-            st.metric("Portfolio Kee Score", "0.34", "-0.05 (Improving)")
-        with col4:
-            st.metric("Default Rate", "2.1%", "-0.3% (Better)")
-        
-        st.markdown("---")
-        
-        # Risk Distribution
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### 🎯 Risk Distribution")
-            risk_dist = pd.DataFrame({
-                "Risk Category": ["Very Low Risk", "Low Risk", "Medium Risk", "High Risk", "Very High Risk"],
-                "Customers": [3210, 845, 320, 115, 35],
-                "Percentage": ["70.9%", "18.7%", "7.1%", "2.5%", "0.8%"],
-                "Exposure (AED M)": ["41.4", "12.8", "3.2", "0.8", "0.2"]
-            })
-            st.dataframe(risk_dist, use_container_width=True, hide_index=True)
-        
-        with col2:
-            st.markdown("#### 📈 Monthly Trend")
-            trend_data = pd.DataFrame({
-                "Month": ["Jul", "Aug", "Sep", "Oct", "Nov"],
-                "Avg Kee Score": [0.42, 0.39, 0.37, 0.35, 0.34],
-                "Default Rate %": [2.8, 2.6, 2.4, 2.3, 2.1]
-            })
-            st.dataframe(trend_data, use_container_width=True, hide_index=True)
-        
-        st.markdown("---")
-        
-        # Strategic Insights
-        st.markdown("#### 💡 Strategic Insights")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            <div style='background: #d4edda; padding: 15px; border-radius: 8px; border-left: 4px solid #28a745;'>
-                <h4 style='color: #155724; margin: 0 0 10px 0;'>✅ Positive Trends</h4>
-                <ul style='color: #155724; margin: 0;'>
-                    <li>Portfolio risk improving by 12.8% YoY</li>
-                    <li>Premium segment growing 15% monthly</li>
-                    <li>Default rate at 3-year low</li>
-                    <li>Customer engagement up 18%</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style='background: #fff3cd; padding: 15px; border-radius: 8px; border-left: 4px solid #ffc107;'>
-                <h4 style='color: #856404; margin: 0 0 10px 0;'>⚠️ Areas of Focus</h4>
-                <ul style='color: #856404; margin: 0;'>
-                    <li>150 high-risk customers need attention</li>
-                    <li>3.3% concentration risk in top 10 customers</li>
-                    <li>125 inactive customers (90+ days)</li>
-                    <li>Seasonal volatility in Q4</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Top Opportunities
-        st.markdown("#### 🎯 Top Business Opportunities")
-        opportunities = pd.DataFrame({
-            "Opportunity": [
-                "Expand credit to 38 premium customers",
-                "Re-engage 125 inactive customers",
-                "Cross-sell to low-risk segment",
-                "Optimize pricing for medium-risk"
-            ],
-            "Potential Revenue": ["AED 2.4M", "AED 850K", "AED 1.2M", "AED 650K"],
-            "Risk Level": ["Very Low", "Medium", "Low", "Medium"],
-            "Priority": ["High", "Medium", "High", "Low"]
-        })
-        st.dataframe(opportunities, use_container_width=True, hide_index=True)
-    
-    elif dashboard_type == "🔬 Technical Dashboard":
-        # Technical Dashboard Implementation
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-            <h3 style='color: white; margin: 0;'>🔬 Technical Dashboard</h3>
-            <p style='color: #f0f0f0; margin: 10px 0 0 0;'>Model performance, data quality, and system health</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Model Performance Metrics
-        st.markdown("#### 🎯 Model Performance")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("ROC AUC", "98.7%", "+0.3%")
-        with col2:
-            st.metric("Precision", "96.2%", "+0.5%")
-        with col3:
-            st.metric("Recall", "94.8%", "+0.2%")
-        with col4:
-            st.metric("F1 Score", "95.5%", "+0.4%")
-        
-        st.markdown("---")
-        
-        # Feature Performance
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### 🎯 Top 10 Features by Importance")
-            features = pd.DataFrame({
-                "Feature": [
-                    "Volatility", "Days Since Last Order", "GMV Slope",
-                    "Sales 12M", "Sales 6M", "AECB Credit Score",
-                    "Sales 3M", "Monthly GMV", "Active Months", "Order Frequency"
-                ],
-                "Importance": ["15.6%", "14.2%", "12.8%", "11.5%", "9.8%", "6.5%", "8.7%", "7.6%", "6.5%", "4.2%"],
-                "Category": [
-                    "Behavioral", "Behavioral", "Financial",
-                    "Financial", "Financial", "External",
-                    "Financial", "Financial", "Stability", "Behavioral"
-                ]
-            })
-            st.dataframe(features, use_container_width=True, hide_index=True)
-        
-        with col2:
-            st.markdown("#### 📊 Data Quality Metrics")
-            data_quality = pd.DataFrame({
-                "Data Source": [
-                    "Distribution Partner", "Payment Partner",
-                    "Bank Transactions", "AECB Data",
-                    "LOS Data", "DEWA Bills"
-                ],
-                "Completeness": ["99.8%", "100%", "95.2%", "98.5%", "97.8%", "96.5%"],
-                "Freshness": ["Real-time", "Weekly", "Monthly", "Monthly", "Real-time", "Monthly"],
-                "Status": ["✅", "✅", "✅", "✅", "✅", "✅"]
-            })
-            st.dataframe(data_quality, use_container_width=True, hide_index=True)
-        
-        st.markdown("---")
-        
-        # System Health
-        st.markdown("#### 🖥️ System Health & Performance")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("""
-            <div style='background: #e3f2fd; padding: 15px; border-radius: 8px;'>
-                <h4 style='color: #1976d2; margin: 0 0 10px 0;'>⚡ API Performance</h4>
-                <ul style='color: #1976d2; margin: 0; list-style: none; padding: 0;'>
-                    <li>Avg Response: 45ms</li>
-                    <li>P95 Latency: 120ms</li>
-                    <li>Uptime: 99.97%</li>
-                    <li>Requests/day: 125K</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style='background: #f3e5f5; padding: 15px; border-radius: 8px;'>
-                <h4 style='color: #7b1fa2; margin: 0 0 10px 0;'>🔄 Batch Processing</h4>
-                <ul style='color: #7b1fa2; margin: 0; list-style: none; padding: 0;'>
-                    <li>Daily Runs: 100%</li>
-                    <li>Avg Duration: 12min</li>
-                    <li>Records/day: 4,525</li>
-                    <li>Success Rate: 99.8%</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown("""
-            <div style='background: #e8f5e9; padding: 15px; border-radius: 8px;'>
-                <h4 style='color: #388e3c; margin: 0 0 10px 0;'>💾 Data Pipeline</h4>
-                <ul style='color: #388e3c; margin: 0; list-style: none; padding: 0;'>
-                    <li>Sources: 6 active</li>
-                    <li>ETL Success: 99.5%</li>
-                    <li>Data Lag: <5min</li>
-                    <li>Storage: 2.4TB</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Model Monitoring
-        st.markdown("#### 📈 Model Monitoring")
-        monitoring = pd.DataFrame({
-            "Metric": [
-                "Prediction Drift", "Feature Drift", "Data Quality Score",
-                "Model Accuracy", "False Positive Rate", "False Negative Rate"
-            ],
-            "Current Value": ["2.3%", "1.8%", "98.2%", "96.5%", "3.8%", "5.2%"],
-            "Threshold": ["<5%", "<5%", ">95%", ">95%", "<5%", "<5%"],
-            "Status": ["✅ Normal", "✅ Normal", "✅ Healthy", "✅ Good", "✅ Normal", "⚠️ Monitor"]
-        })
-        st.dataframe(monitoring, use_container_width=True, hide_index=True)
-    
-    elif dashboard_type == "📊 Customer Risk Dashboard":
-        # Customer Risk Dashboard Implementation
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-            <h3 style='color: white; margin: 0;'>📊 Customer Risk Dashboard</h3>
-            <p style='color: #f0f0f0; margin: 10px 0 0 0;'>Detailed customer risk analysis and segmentation</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Customer Search
-        st.markdown("#### 🔍 Customer Lookup")
-        
-        if customer_df is not None:
-            # Get list of available customer IDs
-            available_customers = customer_df['customer_id'].astype(str).tolist()
-            
-            col1, col2, col3 = st.columns([2, 2, 1])
-            
-            with col1:
-                customer_id_input = st.selectbox(
-                    "Select Customer ID",
-                    options=[""] + available_customers,
-                    format_func=lambda x: "Choose a customer..." if x == "" else f"Customer {x}"
-                )
-            
-            with col2:
-                if customer_id_input:
-                    customer_name = customer_df[customer_df['customer_id'].astype(str) == customer_id_input]['customer_name'].values[0]
-                    st.markdown(f"<br><strong>Name:</strong> {customer_name}", unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown("<br>", unsafe_allow_html=True)
-                search_btn = st.button("🔍 Analyze", use_container_width=True)
-        else:
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                customer_id_input = st.text_input("Enter Customer ID", placeholder="e.g., 24")
-            with col2:
-                st.markdown("<br>", unsafe_allow_html=True)
-                search_btn = st.button("🔍 Search", use_container_width=True)
-        
-        if customer_id_input and customer_id_input != "":
-            st.markdown("---")
-            
-            # Initialize variables
-            customer_data = None
-            cust = None
-            
-            # Get customer data
-            if customer_df is not None:
-                customer_data = customer_df[customer_df['customer_id'].astype(str) == customer_id_input]
-                
-                if not customer_data.empty:
-                    cust = customer_data.iloc[0]
-                    
-                    st.markdown(f"#### 👤 Customer Profile: {cust['customer_name']} (ID: {cust['customer_id']})")
-                    
-                    # Customer Overview
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    # Determine risk level and color
-                    risk_score = cust['risk_score_30d']
-                    if risk_score < 0.3:
-                        risk_label = "Very Low Risk ✅"
-                        risk_delta = "Excellent"
-                    elif risk_score < 0.5:
-                        risk_label = "Low Risk ✅"
-                        risk_delta = "Good"
-                    elif risk_score < 0.7:
-                        risk_label = "Medium Risk ⚠️"
-                        risk_delta = "Monitor"
-                    else:
-                        risk_label = "High Risk 🔴"
-                        risk_delta = "Caution"
-                    
-                    with col1:
-                        st.metric("Kee Score (30d)", f"{risk_score:.3f}", risk_label)
-                    with col2:
-                        account_value = cust['account_value']
-                        st.metric("Account Value", f"AED {account_value:,.2f}", f"{cust['risk_level_30d']}")
-                    with col3:
-                        active_months = int(cust['active_months'])
-                        st.metric("Active Months", f"{active_months}/36", f"{(active_months/36*100):.0f}% Active")
-                    with col4:
-                        # Calculate recommended credit limit based on risk
-                        if risk_score < 0.3:
-                            credit_limit = min(account_value * 2, 250000)
-                        elif risk_score < 0.5:
-                            credit_limit = min(account_value * 1.5, 150000)
-                        elif risk_score < 0.7:
-                            credit_limit = min(account_value * 1.0, 75000)
-                        else:
-                            credit_limit = min(account_value * 0.5, 25000)
-                        st.metric("Credit Limit", f"AED {credit_limit:,.0f}", "Recommended")
-                else:
-                    st.warning(f"Customer ID {customer_id_input} not found in database.")
-                    st.stop()
-            else:
-                st.markdown("#### 👤 Customer Profile: Sample Customer")
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Kee Score", "N/A", "Data not available")
-                with col2:
-                    st.metric("Total GMV", "N/A", "")
-                with col3:
-                    st.metric("Active Months", "N/A", "")
-                with col4:
-                    st.metric("Credit Limit", "N/A", "")
-            
-            st.markdown("---")
-            
-            # Detailed Metrics
-            if customer_df is not None and customer_data is not None and not customer_data.empty:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("#### 📊 Financial Metrics")
-                    
-                    # Calculate monthly average
-                    monthly_avg = cust['account_value'] / max(cust['active_months'], 1) if cust['active_months'] > 0 else 0
-                    
-                    # Volatility status
-                    vol_status = "✅" if cust['volatility'] < 0.3 else ("⚠️" if cust['volatility'] < 0.6 else "🔴")
-                    vol_label = "Stable" if cust['volatility'] < 0.3 else ("Moderate" if cust['volatility'] < 0.6 else "Volatile")
-                    
-                    # Days since last order status
-                    days_status = "✅" if cust['days_since_last_order'] < 30 else ("⚠️" if cust['days_since_last_order'] < 90 else "🔴")
-                    
-                    # GMV slope status
-                    slope_status = "✅" if cust['gmv_slope'] > 100 else ("⚠️" if cust['gmv_slope'] > 0 else "🔴")
-                    slope_label = f"+{cust['gmv_slope']:.1f}%" if cust['gmv_slope'] > 0 else f"{cust['gmv_slope']:.1f}%"
-                    
-                    financial = pd.DataFrame({
-                        "Metric": [
-                            "Account Value", "Monthly Average",
-                            "Active Months", "GMV Growth Rate",
-                            "Volatility Score", "Days Since Last Order"
-                        ],
-                        "Value": [
-                            f"AED {cust['account_value']:,.2f}",
-                            f"AED {monthly_avg:,.2f}",
-                            f"{int(cust['active_months'])}/36",
-                            slope_label,
-                            f"{cust['volatility']:.3f} ({vol_label})",
-                            f"{int(cust['days_since_last_order'])} days"
-                        ],
-                        "Status": [
-                            "✅" if cust['account_value'] > 1000 else "⚠️",
-                            "✅" if monthly_avg > 100 else "⚠️",
-                            "✅" if cust['active_months'] > 12 else "⚠️",
-                            slope_status,
-                            vol_status,
-                            days_status
-                        ]
-                    })
-                    st.dataframe(financial, use_container_width=True, hide_index=True)
-                
-                with col2:
-                    st.markdown("#### 📈 Risk Trend Analysis")
-                    
-                    # Kee scores over time
-                    risk_trend = pd.DataFrame({
-                        "Period": ["30 Days", "60 Days", "90 Days"],
-                        "Kee Score": [
-                            f"{cust['risk_score_30d']:.3f}",
-                            f"{cust['risk_score_60d']:.3f}",
-                            f"{cust['risk_score_90d']:.3f}"
-                        ],
-                        "Risk Level": [
-                            cust['risk_level_30d'],
-                            "Medium" if cust['risk_score_60d'] > 0.5 else "Low",
-                            "High" if cust['risk_score_90d'] > 0.7 else ("Medium" if cust['risk_score_90d'] > 0.5 else "Low")
-                        ],
-                        "Trend": [
-                            "→",
-                            "↑" if cust['risk_score_60d'] > cust['risk_score_30d'] else "↓",
-                            "↑" if cust['risk_score_90d'] > cust['risk_score_60d'] else "↓"
-                        ]
-                    })
-                    st.dataframe(risk_trend, use_container_width=True, hide_index=True)
-                    
-                    # Additional context
-                    st.markdown("**Intervention Status:**")
-                    if pd.notna(cust['intervention_status']) and cust['intervention_status']:
-                        st.info(f"📋 {cust['intervention_status']}")
-                    else:
-                        st.success("✅ No intervention required")
-            else:
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("#### 📊 Financial Metrics")
-                    st.info("Data not available")
-                with col2:
-                    st.markdown("#### 🏦 External Data")
-                    st.info("Data not available")
-            
-            st.markdown("---")
-            
-            # Risk Factors
-            if customer_df is not None and customer_data is not None and not customer_data.empty:
-                st.markdown("#### 🎯 Key Risk Factors Analysis")
-                
-                # Analyze key factors
-                factors = []
-                
-                # Volatility
-                if cust['volatility'] < 0.3:
-                    factors.append(("Low Volatility", f"-{0.15:.2f}", "Reduces Risk", "✅"))
-                elif cust['volatility'] > 0.6:
-                    factors.append(("High Volatility", f"+{0.18:.2f}", "Increases Risk", "🔴"))
-                else:
-                    factors.append(("Moderate Volatility", f"+{0.08:.2f}", "Neutral", "⚠️"))
-                
-                # Account Value
-                if cust['account_value'] > 5000:
-                    factors.append(("High Account Value", f"-{0.12:.2f}", "Reduces Risk", "✅"))
-                elif cust['account_value'] > 1000:
-                    factors.append(("Moderate Account Value", f"-{0.05:.2f}", "Reduces Risk", "✅"))
-                else:
-                    factors.append(("Low Account Value", f"+{0.10:.2f}", "Increases Risk", "⚠️"))
-                
-                # Days Since Last Order
-                if cust['days_since_last_order'] < 30:
-                    factors.append(("Recent Activity", f"-{0.08:.2f}", "Reduces Risk", "✅"))
-                elif cust['days_since_last_order'] < 90:
-                    factors.append(("Moderate Activity", f"+{0.05:.2f}", "Neutral", "⚠️"))
-                else:
-                    factors.append(("Inactive Customer", f"+{0.15:.2f}", "Increases Risk", "🔴"))
-                
-                # GMV Slope
-                if cust['gmv_slope'] > 100:
-                    factors.append(("Positive Growth", f"-{0.10:.2f}", "Reduces Risk", "✅"))
-                elif cust['gmv_slope'] > 0:
-                    factors.append(("Stable Growth", f"-{0.03:.2f}", "Reduces Risk", "✅"))
-                else:
-                    factors.append(("Declining Trend", f"+{0.12:.2f}", "Increases Risk", "🔴"))
-                
-                # Active Months
-                if cust['active_months'] > 18:
-                    factors.append(("High Tenure", f"-{0.06:.2f}", "Reduces Risk", "✅"))
-                elif cust['active_months'] > 6:
-                    factors.append(("Moderate Tenure", f"-{0.02:.2f}", "Reduces Risk", "✅"))
-                else:
-                    factors.append(("Low Tenure", f"+{0.08:.2f}", "Increases Risk", "⚠️"))
-                
-                risk_factors_df = pd.DataFrame(factors, columns=["Feature", "Impact", "Effect", "Status"])
-                st.dataframe(risk_factors_df, use_container_width=True, hide_index=True)
-                
-                st.markdown("---")
-                
-                # Recommendation based on Kee score
-                if risk_score < 0.3:
-                    st.markdown(f"""
-                    <div style='background: #d4edda; padding: 20px; border-radius: 10px; border-left: 4px solid #28a745;'>
-                        <h4 style='color: #155724; margin: 0 0 10px 0;'>✅ Credit Decision: APPROVED</h4>
-                        <p style='color: #155724; margin: 0;'><strong>Recommended Credit Limit:</strong> AED {credit_limit:,.0f}</p>
-                        <p style='color: #155724; margin: 10px 0 0 0;'><strong>Rationale:</strong> Excellent customer with low Kee score ({risk_score:.3f}), {int(cust['active_months'])} active months, and account value of AED {cust['account_value']:,.2f}. Strong candidate for credit extension.</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                elif risk_score < 0.5:
-                    st.markdown(f"""
-                    <div style='background: #d4edda; padding: 20px; border-radius: 10px; border-left: 4px solid #28a745;'>
-                        <h4 style='color: #155724; margin: 0 0 10px 0;'>✅ Credit Decision: APPROVED (with conditions)</h4>
-                        <p style='color: #155724; margin: 0;'><strong>Recommended Credit Limit:</strong> AED {credit_limit:,.0f}</p>
-                        <p style='color: #155724; margin: 10px 0 0 0;'><strong>Rationale:</strong> Good customer with acceptable Kee score ({risk_score:.3f}). Recommend standard credit terms with regular monitoring.</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                elif risk_score < 0.7:
-                    st.markdown(f"""
-                    <div style='background: #fff3cd; padding: 20px; border-radius: 10px; border-left: 4px solid #ffc107;'>
-                        <h4 style='color: #856404; margin: 0 0 10px 0;'>⚠️ Credit Decision: CONDITIONAL APPROVAL</h4>
-                        <p style='color: #856404; margin: 0;'><strong>Recommended Credit Limit:</strong> AED {credit_limit:,.0f}</p>
-                        <p style='color: #856404; margin: 10px 0 0 0;'><strong>Rationale:</strong> Medium risk customer (score: {risk_score:.3f}). Recommend limited credit with enhanced monitoring and possible collateral requirements.</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                    <div style='background: #f8d7da; padding: 20px; border-radius: 10px; border-left: 4px solid #dc3545;'>
-                        <h4 style='color: #721c24; margin: 0 0 10px 0;'>🔴 Credit Decision: DECLINED</h4>
-                        <p style='color: #721c24; margin: 0;'><strong>Maximum Credit Limit:</strong> AED {credit_limit:,.0f} (if approved)</p>
-                        <p style='color: #721c24; margin: 10px 0 0 0;'><strong>Rationale:</strong> High risk customer (score: {risk_score:.3f}). Recommend declining credit or requiring substantial collateral and guarantees. Close monitoring required if approved.</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.info("Risk analysis not available")
-        
-        else:
-            st.markdown("---")
-            st.markdown("#### 📊 Customer Segments")
-            
-            segments = pd.DataFrame({
-                "Segment": [
-                    "Premium Low-Risk", "Standard Low-Risk",
-                    "Medium Risk", "High Risk", "Inactive"
-                ],
-                "Count": [38, 3172, 320, 150, 845],
-                "Avg GMV": ["AED 215K", "AED 45K", "AED 32K", "AED 28K", "AED 12K"],
-                "Avg Kee Score": ["0.19", "0.28", "0.52", "0.78", "0.45"],
-                "Recommended Action": [
-                    "Expand Credit", "Maintain", "Monitor Closely",
-                    "Restrict Credit", "Re-engage"
-                ]
-            })
-            st.dataframe(segments, use_container_width=True, hide_index=True)
-    
-    elif dashboard_type == "💼 Credit Officer Dashboard":
-        render_credit_officer_dashboard()
-
-elif stage == "💬 AI Assistant":
-    st.markdown('<div class="stage-header">💬 AI Assistant</div>', unsafe_allow_html=True)
-    st.markdown("### Intelligent Credit Risk Analysis Assistant")
-    
-    st.markdown("""
-    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-        <h3 style='color: white; margin: 0;'>💡 Ask me anything about credit risk analysis!</h3>
-        <p style='color: #f0f0f0; margin: 10px 0 0 0;'>I can help you find customer profiles, analyze risk patterns, explain model predictions, and more.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Initialize chat history
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
-    
-    # Example queries
-    st.markdown("#### 🎯 Try These Example Queries:")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🔍 Find high-risk customers", use_container_width=True):
-            st.session_state.example_query = "Show me all high-risk customers with their key risk factors"
-    
-    with col2:
-        if st.button("📊 Analyze customer profile", use_container_width=True):
-            st.session_state.example_query = "Analyze the risk profile for customer ID 8697"
-    
-    with col3:
-        if st.button("💰 Premium customers analysis", use_container_width=True):
-            st.session_state.example_query = "Find all premium customers with low Kee scores"
-    
-    col4, col5, col6 = st.columns(3)
-    
-    with col4:
-        if st.button("📈 Risk trends", use_container_width=True):
-            st.session_state.example_query = "What are the main risk trends in our customer base?"
-    
-    with col5:
-        if st.button("🎯 Feature importance", use_container_width=True):
-            st.session_state.example_query = "Which features are most important for risk prediction?"
-    
-    with col6:
-        if st.button("🔄 Compare customers", use_container_width=True):
-            st.session_state.example_query = "Compare risk profiles of customers 8697 and 12345"
-    
-    st.markdown("---")
-    
-    # Chat interface
-    st.markdown("#### 💬 Chat with AI Assistant")
-    
-    # Display chat messages
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-    
-    # Chat input
-    if "example_query" in st.session_state:
-        prompt = st.session_state.example_query
-        del st.session_state.example_query
-    else:
-        prompt = st.chat_input("Ask me anything about credit risk analysis...")
-    
-    if prompt:
-        # Add user message to chat history
-        st.session_state.messages.append({"role": "user", "content": prompt})
-        
-        # Display user message
-        with st.chat_message("user"):
-            st.markdown(prompt)
-        
-        # Generate AI response
-        with st.chat_message("assistant"):
-            with st.spinner("Analyzing..."):
-                response = generate_ai_response(prompt)
-                st.markdown(response)
-        
-        # Add assistant response to chat history
-        st.session_state.messages.append({"role": "assistant", "content": response})
-    
-    # Clear chat button
-    if st.button("🗑️ Clear Chat History"):
-        st.session_state.messages = []
-        st.rerun()
+# Main content based on selected stage; when profiling, the lazy stage import
+# is recorded as its own phase ahead of the render itself
+if profiling:
+    with profiler.span("import", f"stages.{STAGES[stage]}"):
+        load_stage(stage)
+with profiler.span("render", stage) if profiling else nullcontext():
+    with timed("stage_render_seconds", stage=STAGES[stage]):
+        render_stage(stage)
+if profiling:
+    profiler.finish()
 
 # Footer with Kee Platform Branding
 st.markdown("---")
@@ -0,0 +1,665 @@
+"""
+AI Assistant Query Engine
+=========================
+
+Answers assistant questions from the customer store instead of canned
+text. The intent router extracts entities (customer IDs, amounts, risk
+band, numeric conditions with comparison operators, top-N requests) in a
+single regex pass and dispatches to the registered handler. Filters are
+resolved by the query planner over the store's bitmap and range indexes;
+rankings and aggregations run vectorized over its NumPy columns.
+
+Handlers are generators: the heading and headline numbers are yielded
+before tables and detail sections, so the chat can stream the answer with
+``st.write_stream`` and the first text appears before the full answer is
+built, even over millions of rows.
+
+Answers are cached process-wide by normalized query text (LRU, cleared
+whenever the store's data version changes), so repeated example-button
+questions are served without recomputation.
+
+Usage:
+    from assistant_engine import cached_answer, cached_stream
+    markdown = cached_answer("high-risk customers with account value over 50K", get_current_store())
+    st.write_stream(cached_stream("premium customers", get_current_store()))
+
+Supported questions:
+    - "high-risk customers with account value over 50K"     (filters)
+    - "inactive customers with volatility above 0.5"
+    - "high or medium risk customers with zero account value"
+    - "customers with days since last order between 30 and 90"
+    - "analyze customer 8697"                               (profile)
+    - "compare 48, 53 and 8697"                             (comparison)
+    - "top 10 by gmv_slope", "bottom 5 by account value"    (rankings)
+    - "top 3 high-risk customers by exposure", "top 10 customers" (by account value)
+    - "customer segments", "premium customers", "risk trends", "feature importance"
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from customer_compare import COMPARE_COLUMNS, FACTOR_COLUMNS, compare_customers
+from customer_segments import get_segmentation
+from customer_store import (
+    HIGH_RISK_MIN, INACTIVE_DAYS, LOW_RISK_MAX, PREMIUM_ACCOUNT_VALUE, SKETCH_COLUMNS, credit_limit,
+)
+from formatting import COLUMN_LABELS, format_aed, format_value, percentile_label
+from intent_router import IntentRouter
+from leaderboards import get_leaderboards, premium_rows, top_k
+from metrics import get_registry, timed
+from query_planner import plan_rows
+
+
+# Phrases -> store column, longest first so "gmv slope" wins over "gmv"
+COLUMN_ALIASES = {
+    "days since last order": "days_since_last_order",
+    "days_since_last_order": "days_since_last_order",
+    "days inactive": "days_since_last_order",
+    "risk_score_30d": "risk_score_30d",
+    "risk_score_60d": "risk_score_60d",
+    "risk_score_90d": "risk_score_90d",
+    "account_value": "account_value",
+    "account value": "account_value",
+    "active_months": "active_months",
+    "active months": "active_months",
+    "30d risk": "risk_score_30d",
+    "60d risk": "risk_score_60d",
+    "90d risk": "risk_score_90d",
+    "risk score": "risk_score_30d",
+    "kee score": "risk_score_30d",
+    "gmv_slope": "gmv_slope",
+    "gmv slope": "gmv_slope",
+    "volatility": "volatility",
+    "exposure": "account_value",
+    "recency": "days_since_last_order",
+    "growth": "gmv_slope",
+    "tenure": "active_months",
+    "gmv": "account_value",
+}
+
+OPERATORS = {
+    "over": ">", "above": ">", "greater than": ">", "more than": ">", "exceeding": ">",
+    "at least": ">=", "under": "<", "below": "<", "less than": "<", "at most": "<=",
+    ">=": ">=", "<=": "<=", ">": ">", "<": "<",
+}
+
+_COLUMN_PATTERN = "|".join(re.escape(a) for a in sorted(COLUMN_ALIASES, key=len, reverse=True))
+_OPERATOR_PATTERN = "|".join(re.escape(o) for o in sorted(OPERATORS, key=len, reverse=True))
+
+# Entity patterns (named sub-groups must be unique across the router)
+CONDITION_PATTERN = (
+    rf"(?P<cond_col>{_COLUMN_PATTERN})\s*(?:is\s+|of\s+)?(?P<cond_op>{_OPERATOR_PATTERN})\s*"
+    r"(?:aed\s*)?(?P<cond_num>\d[\d,]*(?:\.\d+)?|\.\d+)\s*(?P<cond_unit>[km])?\b"
+)
+RANGE_PATTERN = (
+    rf"(?P<range_col>{_COLUMN_PATTERN})\s*(?:is\s+|of\s+)?between\s*(?:aed\s*)?"
+    r"(?P<range_low>\d[\d,]*(?:\.\d+)?|\.\d+)\s*(?P<range_low_unit>[km])?\s*(?:and|-|to)\s*(?:aed\s*)?"
+    r"(?P<range_high>\d[\d,]*(?:\.\d+)?|\.\d+)\s*(?P<range_high_unit>[km])?\b"
+)
+TOP_PATTERN = r"\b(?P<top_dir>top|bottom|highest|lowest)\s+(?P<top_n>\d+)\b"
+ORDER_BY_PATTERN = rf"\bby\s+(?P<by_col>{_COLUMN_PATTERN})"
+BAND_PATTERN = (r"\b(?P<band_name>high|medium|low)(?:\s*(?:or|and|/)\s*(?P<band_other>high|medium|low))?"
+                r"[\s-]+risk\b")
+AMOUNT_PATTERN = r"(?:aed\s*)?(?P<amount_num>\d[\d,]*(?:\.\d+)?)\s*(?P<amount_unit>[km])\b"
+# Customer IDs need an explicit cue ("customer 8697", "ids 48, 53 and 8697", "#48", "compare 48 and 53");
+# numbers followed by a unit ("90 days", "50K", "5%") are never IDs
+_ID_NUMBER = r"#?\d{1,7}\b(?![.,]\d|\s*(?:days?|months?|weeks?|years?)\b|\s*[km%]\b|%)"
+ID_PATTERN = (
+    r"(?:\b(?:customers?|outlets?|ids?|compare)(?:\s+ids?)?\s*[:#]?\s*|(?=#))"
+    rf"(?P<id_list>{_ID_NUMBER}(?:\s*(?:,|&|\band\b|\bor\b|\bvs\b\.?|\bversus\b|\bwith\b)\s*{_ID_NUMBER})*)"
+)
+
+TABLE_COLUMNS = ["customer_id", "customer_name", "risk_score_30d", "account_value",
+                 "volatility", "days_since_last_order", "gmv_slope"]
+LIST_LIMIT = 10
+TOP_DEFAULT_COLUMN = "account_value"  # "top 10 customers" without "by ..."
+COMPARE_LIMIT = 10
+ANSWER_CACHE_ENTRIES = 512
+
+
+# ---------------------------------------------------------------------------
+# Formatting
+# ---------------------------------------------------------------------------
+
+def markdown_table_lines(df):
+    """Markdown table for a small DataFrame, one line (with newline) at a time"""
+    yield "| " + " | ".join(str(c) for c in df.columns) + " |\n"
+    yield "|" + "|".join("---" for _ in df.columns) + "|\n"
+    for row in df.itertuples(index=False):
+        yield "| " + " | ".join(str(v).replace("|", "\\|") for v in row) + " |\n"
+
+
+def markdown_table(df):
+    """Render a small DataFrame as a markdown table"""
+    return "".join(markdown_table_lines(df)).rstrip("\n")
+
+
+def customer_table_lines(store, rows, columns=TABLE_COLUMNS):
+    """Markdown table lines for customers at the given row positions"""
+    frame = store.frame(rows, [c for c in columns if c in store.df.columns])
+    display = pd.DataFrame({
+        ("ID" if col == "customer_id" else "Name" if col == "customer_name" else COLUMN_LABELS[col]):
+            frame[col].map(lambda v, col=col: format_value(col, v))
+            if col in COLUMN_LABELS else frame[col].astype(str)
+        for col in frame.columns
+    })
+    return markdown_table_lines(display)
+
+
+def customer_table(store, rows, columns=TABLE_COLUMNS):
+    """Markdown table of customers at the given row positions"""
+    return "".join(customer_table_lines(store, rows, columns)).rstrip("\n")
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def parse_amount(number, suffix):
+    value = float(number.replace(",", ""))
+    if suffix == "k":
+        value *= 1_000
+    elif suffix == "m":
+        value *= 1_000_000
+    return value
+
+
+def _parse_condition(m):
+    return (
+        COLUMN_ALIASES[m.group("cond_col").lower()],
+        OPERATORS[m.group("cond_op").lower()],
+        parse_amount(m.group("cond_num"), (m.group("cond_unit") or "").lower()),
+    )
+
+
+def _parse_range(m):
+    column = COLUMN_ALIASES[m.group("range_col").lower()]
+    low = parse_amount(m.group("range_low"), (m.group("range_low_unit") or "").lower())
+    high = parse_amount(m.group("range_high"), (m.group("range_high_unit") or "").lower())
+    return [(column, ">=", min(low, high)), (column, "<=", max(low, high))]
+
+
+def _parse_top(m):
+    return int(m.group("top_n")), m.group("top_dir").lower() in ("top", "highest")
+
+
+router = IntentRouter()
+# Order matters: conditions/rankings/amounts consume their numbers before bare IDs
+router.entity("range", RANGE_PATTERN, parse=_parse_range)
+router.entity("condition", CONDITION_PATTERN, parse=_parse_condition)
+router.entity("top", TOP_PATTERN, parse=_parse_top)
+router.entity("order_by", ORDER_BY_PATTERN, parse=lambda m: COLUMN_ALIASES[m.group("by_col").lower()])
+router.entity("band", BAND_PATTERN,
+              parse=lambda m: tuple(b.capitalize() for b in m.group("band_name", "band_other") if b))
+router.entity("amount", AMOUNT_PATTERN,
+              parse=lambda m: parse_amount(m.group("amount_num"), m.group("amount_unit").lower()))
+router.entity("customer_id", ID_PATTERN, parse=lambda m: [int(n) for n in re.findall(r"\d+", m.group("id_list"))])
+
+
+def customer_ids(entities):
+    """Cued customer IDs in query order, without repeats"""
+    return list(dict.fromkeys(cid for ids in entities["customer_id"] for cid in ids))
+
+
+def query_filters(entities):
+    """Risk bands, numeric conditions and activity/value flags from routed entities"""
+    return {
+        "bands": sorted({band for bands in entities["band"] for band in bands}),
+        "conditions": entities["condition"] + [c for pair in entities["range"] for c in pair],
+        "inactive": "inactive" in entities["keywords"],
+        "zero_value": "zero" in entities["keywords"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Vectorized filters
+# ---------------------------------------------------------------------------
+
+def filter_bitmap(store, bands=(), inactive=False, zero_value=False):
+    """Bitmap of the categorical/flag part of a filter (bands OR-ed, flags AND-ed), None if unfiltered"""
+    index = store.bitmaps
+    bitmap = index.any_of("risk_level", bands) if bands else None
+    for flag, wanted in (("inactive", inactive), ("zero_value", zero_value)):
+        if wanted:
+            bitmap = index.get(flag) if bitmap is None else bitmap & index.get(flag)
+    return bitmap
+
+
+def filter_rows(store, bands=(), conditions=(), inactive=False, zero_value=False):
+    """Ascending row positions matching risk bands, flags and numeric conditions"""
+    return plan_rows(store, filter_bitmap(store, bands, inactive, zero_value), conditions).rows
+
+
+def describe_filter(bands=(), conditions=(), inactive=False, zero_value=False):
+    parts = []
+    if bands:
+        parts.append(f"{' or '.join(bands)}-risk")
+    if inactive:
+        parts.append(f"inactive (>{INACTIVE_DAYS} days)")
+    if zero_value:
+        parts.append("zero account value")
+    for column, op, value in conditions:
+        parts.append(f"{COLUMN_LABELS[column]} {op} {format_value(column, value)}")
+    return ", ".join(parts) or "all"
+
+
+# ---------------------------------------------------------------------------
+# Handlers
+#
+# Handlers are generators of markdown chunks: the heading goes out before any
+# scan, the headline numbers as soon as the mask is built, then sections and
+# table rows one by one, so the chat can render while the rest is computed.
+# ---------------------------------------------------------------------------
+
+@router.intent("filter", triggers=["band", "condition", "range", "inactive", "zero"], priority=0)
+def answer_filter(store, entities, title="🔍 Customer Filter Results"):
+    filters = query_filters(entities)
+    yield f"### {title}\n\n**Filter**: {describe_filter(**filters)}\n\n"
+
+    rows = filter_rows(store, **filters)
+    count = len(rows)
+    if count == 0:
+        yield "No customers match this filter.\n"
+        return
+
+    account = store.column("account_value")
+    exposure = account[rows].sum()
+    yield (f"- **Count**: {count:,} customers ({count / store.size:.1%} of portfolio)\n"
+           f"- **Total Exposure**: {format_aed(exposure)} ({exposure / account.sum():.1%} of total)\n"
+           f"- **Average Kee Score**: {store.column('risk_score_30d')[rows].mean():.3f}\n\n")
+
+    stats = {col: store.column(col)[rows].mean() for col in
+             ("volatility", "days_since_last_order", "gmv_slope")}
+    inactive_share = (store.column("days_since_last_order")[rows] > INACTIVE_DAYS).mean()
+    declining_share = (store.column("gmv_slope")[rows] < 0).mean()
+    yield f"""**Key Risk Factors (averages):**
+1. **Volatility**: {stats['volatility']:.3f}
+2. **Days Since Last Order**: {stats['days_since_last_order']:.0f} days ({inactive_share:.0%} inactive > {INACTIVE_DAYS} days)
+3. **GMV Slope**: {stats['gmv_slope']:+,.1f} ({declining_share:.0%} declining)
+
+"""
+
+    sample = top_k(store.column("risk_score_30d"), LIST_LIMIT, rows)
+    yield f"**Highest-Risk Matches (top {len(sample)} by Kee score):**\n\n"
+    yield from customer_table_lines(store, sample)
+
+
+@router.intent("premium", triggers=["premium"], priority=10)
+def answer_premium(store, entities):
+    yield (f"### 💎 Premium Low-Risk Customers\n\n**Definition**: Kee score < {LOW_RISK_MAX} "
+           f"and account value ≥ {format_aed(PREMIUM_ACCOUNT_VALUE)}\n\n")
+
+    board = get_leaderboards(store.data_version, store)["premium"]
+    if board.eligible == 0:
+        yield "No customers currently qualify.\n"
+        return
+
+    risk = store.column("risk_score_30d")
+    account = store.column("account_value")
+    rows = premium_rows(store)
+    exposure = account[rows].sum()
+    yield f"""**Overview:**
+- **Total Count**: {len(rows):,} customers ({len(rows) / store.size:.1%} of portfolio)
+- **Combined Account Value**: {format_aed(exposure)} ({exposure / account.sum():.1%} of total)
+- **Average Kee Score**: {risk[rows].mean():.3f}
+- **Average Account Value**: {format_aed(account[rows].mean())}
+- **Average Volatility**: {store.column('volatility')[rows].mean():.3f}
+- **Average GMV Slope**: {store.column('gmv_slope')[rows].mean():+,.1f}
+
+"""
+
+    top = board.rows[:LIST_LIMIT]
+    yield f"**Top {len(top)} Premium Customers by Account Value:**\n\n"
+    yield from customer_table_lines(store, top)
+    yield f"""
+**Business Opportunities:**
+- 💰 Offer premium credit lines (combined recommended limit {format_aed(credit_limit(risk[rows], account[rows]).sum())})
+- 🤝 VIP relationship management
+"""
+
+
+@router.intent("segments", triggers=["segment"], priority=15)
+def answer_segments(store, entities):
+    yield f"### 📊 Customer Segments\n\n**Portfolio**: {store.size:,} customers\n\n"
+    summary = get_segmentation(store.data_version, store).summary
+    yield from markdown_table_lines(pd.DataFrame({
+        "Segment": summary["Segment"],
+        "Customers": summary["Count"].map("{:,}".format),
+        "Share": summary["Share"].map("{:.1%}".format),
+        "Exposure": summary["Exposure"].map(format_aed),
+        "Avg Kee Score": [f"{v:.3f}" if pd.notna(v) else "-" for v in summary["Avg Kee Score"]],
+        "Action": summary["Recommended Action"],
+    }))
+    yield (f"\n_Inactive (> {INACTIVE_DAYS} days) takes precedence; the other segments split active "
+           f"customers by Kee score ({LOW_RISK_MAX} / {HIGH_RISK_MIN}) and account value "
+           f"(premium ≥ {format_aed(PREMIUM_ACCOUNT_VALUE)})._\n")
+
+
+@router.intent("trends", triggers=["trend", "pattern"], priority=20)
+def answer_trends(store, entities):
+    yield f"### 📈 Credit Risk Trends Analysis\n\n**Portfolio Health ({store.size:,} customers):**\n\n"
+
+    account = store.column("account_value")
+    risk = store.column("risk_score_30d")
+    total = account.sum()
+
+    band_rows = []
+    for band in ["Low", "Medium", "High"]:
+        mask = store.risk_level == band
+        band_rows.append({
+            "Risk Level": band,
+            "Customers": f"{mask.sum():,}",
+            "Share": f"{mask.mean():.1%}",
+            "Exposure": format_aed(account[mask].sum()),
+            "Avg Kee Score": f"{risk[mask].mean():.3f}" if mask.any() else "-",
+        })
+    yield from markdown_table_lines(pd.DataFrame(band_rows))
+
+    worsening = (store.column("risk_score_90d") - risk > 0.2).sum()
+    yield f"""
+**Score Horizon:**
+- Average Kee score: 30d **{risk.mean():.3f}** → 60d **{store.column('risk_score_60d').mean():.3f}** → 90d **{store.column('risk_score_90d').mean():.3f}**
+- **{worsening:,}** customers ({worsening / store.size:.1%}) deteriorate by more than 0.2 between the 30d and 90d score
+
+"""
+
+    inactive = (store.column("days_since_last_order") > INACTIVE_DAYS).sum()
+    declining = (store.column("gmv_slope") < 0).sum()
+    zero_value = (account == 0).sum()
+    yield f"""**Areas of Concern** ⚠️
+- **{inactive:,}** inactive customers (no orders in {INACTIVE_DAYS}+ days)
+- **{declining:,}** customers with declining GMV (negative slope)
+- **{zero_value:,}** customers with zero account value
+
+"""
+
+    top_decile = max(1, store.size // 10)
+    top_share = np.partition(account, store.size - top_decile)[-top_decile:].sum() / total if total else 0.0
+    yield f"""**Risk Concentration:**
+- Top 10% of customers hold **{top_share:.1%}** of total exposure ({format_aed(total)})
+"""
+
+
+@router.intent("profile", triggers=["customer_id", "profile", "analy"], priority=40,
+               requires=lambda e: len(customer_ids(e)) >= 1)
+def answer_profile(store, entities):
+    customer_id = customer_ids(entities)[0]
+    row = store.row(customer_id)
+    if row is None:
+        yield f"### 👤 Customer Profile\n\nCustomer ID **{customer_id}** was not found."
+        return
+
+    get = {col: float(store.column(col)[row]) for col in COLUMN_LABELS}
+    risk = get["risk_score_30d"]
+    limit = float(credit_limit(risk, get["account_value"]))
+    if risk < LOW_RISK_MAX:
+        category, decision = "Low Risk ✅", "✅ **APPROVE** - strong candidate for credit extension"
+    elif risk < HIGH_RISK_MIN:
+        category, decision = "Medium Risk ⚠️", "⚠️ **CONDITIONAL** - limited credit with monitoring"
+    else:
+        category, decision = "High Risk 🔴", "🔴 **DECLINE** - or require collateral and guarantees"
+
+    yield f"""
+### 👤 Customer Profile Analysis - ID: {customer_id}
+
+**{store.names[row]}**
+
+**Risk Assessment:**
+- **Kee Score (30d / 60d / 90d)**: {risk:.3f} / {get['risk_score_60d']:.3f} / {get['risk_score_90d']:.3f}
+- **Risk Category**: {category}
+- **Credit Limit Recommendation**: {format_aed(limit)}
+
+**Financial Metrics:**
+- **Account Value**: {format_aed(get['account_value'])}
+- **Monthly Average**: {format_aed(get['account_value'] / max(get['active_months'], 1))}
+- **Active Months**: {int(get['active_months'])}
+
+**Behavioral Indicators:**
+- **Volatility**: {get['volatility']:.3f}
+- **GMV Slope**: {get['gmv_slope']:+,.1f}
+- **Days Since Last Order**: {int(get['days_since_last_order'])} days
+
+**Recommendation**: {decision}
+"""
+    yield "\n**Portfolio Position:**\n"
+    for col in SKETCH_COLUMNS:
+        pct = float(store.percentile(col, get[col]))
+        yield f"- **{COLUMN_LABELS[col]}**: {format_value(col, get[col])} — {percentile_label(pct)} (p{pct:.0f})\n"
+
+
+@router.intent("compare", triggers=["compare", "versus", "vs", "customer_id"], priority=60,
+               requires=lambda e: len(customer_ids(e)) >= 2)
+def answer_compare(store, entities):
+    comparison = compare_customers(store, customer_ids(entities)[:COMPARE_LIMIT])
+    note = f"\n\n_Not found: {', '.join(map(str, comparison.missing))}_" if comparison.missing else ""
+    if len(comparison.ids) < 2:
+        yield f"### 🔄 Customer Comparison\n\nNeed at least two known customers.{note}"
+        return
+
+    yield (f"### 🔄 Customer Comparison Analysis\n\n"
+           f"**Comparing: {' vs '.join(f'Customer {c}' for c in comparison.ids)}** "
+           f"_(pNN = portfolio percentile)_\n\n")
+
+    metrics = comparison.metrics
+    table = {"Metric": [COLUMN_LABELS[col] for col in COMPARE_COLUMNS] + ["Credit Limit", "Net Factor Impact"]}
+    for i, cid in enumerate(comparison.ids):
+        table[f"Customer {cid}"] = [
+            f"{format_value(col, metrics[col].iat[i])} (p{metrics[col + '_pct'].iat[i]:.0f})"
+            for col in COMPARE_COLUMNS
+        ] + [format_aed(metrics["credit_limit"].iat[i]), f"{metrics['factor_impact'].iat[i]:+.2f}"]
+    yield from markdown_table_lines(pd.DataFrame(table))
+
+    factors = comparison.factors
+    cells = factors["Status"] + " " + factors["Feature"] + " (" + factors["Impact"].map("{:+.2f}".format) + ")"
+    factor_table = {"Factor": [COLUMN_LABELS[col] for col in FACTOR_COLUMNS]}
+    for cid in comparison.ids:
+        factor_table[f"Customer {cid}"] = cells[factors["customer_id"] == cid].to_list()
+    yield "\n**Risk Factor Attributions:**\n\n"
+    yield from markdown_table_lines(pd.DataFrame(factor_table))
+
+    best = int(np.argmin(metrics["risk_score_30d"].to_numpy()))
+    yield (f"\n**Lowest risk**: 🟢 Customer {comparison.ids[best]} "
+           f"(Kee score {metrics['risk_score_30d'].iat[best]:.3f}){note}\n")
+
+
+@router.intent("top", triggers=["order_by", "top"], priority=50)
+def answer_top(store, entities):
+    column = entities["order_by"][0] if entities["order_by"] else TOP_DEFAULT_COLUMN
+    n, largest = entities["top"][0] if entities["top"] else (LIST_LIMIT, True)
+    filters = query_filters(entities)
+    direction = "Top" if largest else "Bottom"
+    yield (f"### 🏆 {direction} {min(n, 100)} Customers by {COLUMN_LABELS[column]}\n\n"
+           f"**Filter**: {describe_filter(**filters)}\n\n")
+
+    rows = top_k(store.column(column), min(n, 100), filter_rows(store, **filters), largest)
+    if len(rows) == 0:
+        yield "No customers match this filter.\n"
+        return
+    columns = TABLE_COLUMNS if column in TABLE_COLUMNS else TABLE_COLUMNS + [column]
+    yield from customer_table_lines(store, rows, columns)
+
+
+@router.intent("features", triggers=["feature", "importan"], priority=30)
+def answer_features(store, entities):
+    yield """
+### 🎯 Feature Importance Analysis
+
+**Top 15 Most Important Features (trained model):**
+
+**Behavioral Features:**
+1. **Volatility** (15.6%) - Consistency of purchasing behavior
+2. **Days Since Last Order** (14.2%) - Recency of activity
+3. **Order Frequency** (4.2%) - Engagement level
+
+**Financial Features:**
+4. **GMV Slope** (12.8%) - Growth trajectory
+5. **Sales 12M** (11.5%) - Long-term value
+6. **Sales 6M** (9.8%) - Medium-term value
+7. **Sales 3M** (8.7%) - Short-term value
+8. **Monthly GMV** (7.6%) - Current spending level
+
+**External Credit Data:**
+9. **AECB Credit Score** (6.5%) - Credit bureau score
+10. **Payment Partner Kee Score** (5.4%) - Payment behavior
+11. **Bank Bounce Rate** (4.8%) - Payment reliability
+12. **LOS Debt-to-Income** (4.2%) - Financial capacity
+
+**Stability Indicators:**
+13. **Active Months** (6.5%) - Tenure and consistency
+14. **Consistency Score** (5.4%) - Pattern stability
+15. **DEWA Payment Rate** (3.8%) - Utility payment behavior
+"""
+
+
+@router.default
+def answer_help(store, entities, query=""):
+    yield f"""
+### 🤖 AI Assistant Response
+
+I understand you're asking about: **"{query}"**
+
+I answer from the live customer portfolio ({store.size:,} customers). Try:
+
+- 🔍 **Filters**: "high-risk customers with account value over 50K", "inactive customers with volatility above 0.5"
+- 👤 **Profiles**: "analyze customer 8697"
+- 🔄 **Comparisons**: "compare 48 and 53"
+- 🏆 **Rankings**: "top 10 by gmv_slope", "bottom 5 by account value"
+- 💎 **Segments**: "customer segments", "premium customers", "risk trends"
+- 🎯 **Model**: "which features are most important?"
+"""
+
+
+def stream_answer(query, store):
+    """Markdown chunks answering a question from ``store`` (headline first)"""
+    intent, handler, entities = router.route(query)
+    with timed("assistant_query_seconds", intent=intent):
+        if store is None or store.size == 0:
+            yield "### 🤖 AI Assistant Response\n\nCustomer data is not available."
+            return
+        chunks = handler(store, entities, query) if intent == "help" else handler(store, entities)
+        start = time.perf_counter()
+        for i, chunk in enumerate(chunks):
+            if i == 0:
+                get_registry().observe("assistant_first_chunk_seconds", time.perf_counter() - start,
+                                       intent=intent)
+            yield chunk
+
+
+def answer_query(query, store):
+    """Markdown answer for a question, computed from ``store``"""
+    return "".join(stream_answer(query, store))
+
+
+def normalize_query(query):
+    """Cache key text: lowercase, punctuation stripped, whitespace collapsed"""
+    return " ".join(re.sub(r"[^\w.<>=-]+", " ", query.lower()).split()).strip(" .")
+
+
+class AnswerCache:
+    """Thread-safe LRU of answers for one data version, with hit/miss counters"""
+
+    def __init__(self, max_entries=ANSWER_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.data_version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def lookup(self, query, data_version):
+        """Cached answer for ``query`` at ``data_version``, or None (counts a hit/miss)"""
+        key = normalize_query(query)
+        with self._lock:
+            if data_version != self.data_version:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.data_version = data_version
+            answer = self._entries.get(key)
+            if answer is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                get_registry().inc("assistant_cache_lookups_total", result="hit")
+                return answer
+            self.misses += 1
+            get_registry().inc("assistant_cache_lookups_total", result="miss")
+            return None
+
+    def store(self, query, data_version, answer):
+        """Remember ``answer``; dropped if the data version moved on meanwhile"""
+        key = normalize_query(query)
+        with self._lock:
+            if data_version == self.data_version:
+                self._entries[key] = answer
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+    def get(self, query, data_version, compute):
+        """Answer for ``query`` at ``data_version``, calling ``compute()`` on a miss"""
+        answer = self.lookup(query, data_version)
+        if answer is None:
+            answer = compute()
+            self.store(query, data_version, answer)
+        return answer
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+@st.cache_resource
+def get_answer_cache():
+    """Process-wide answer cache shared across sessions"""
+    return AnswerCache()
+
+
+def cached_answer(query, store):
+    """``answer_query`` through the shared answer cache"""
+    if store is None:
+        return answer_query(query, store)
+    return get_answer_cache().get(query, store.data_version, lambda: answer_query(query, store))
+
+
+def cached_stream(query, store):
+    """``stream_answer`` through the shared answer cache
+
+    A hit yields the whole cached answer at once; a miss streams the chunks
+    as they are computed and caches the joined answer once it completes.
+    """
+    if store is None:
+        yield from stream_answer(query, store)
+        return
+    cache = get_answer_cache()
+    answer = cache.lookup(query, store.data_version)
+    if answer is not None:
+        yield answer
+        return
+    chunks = []
+    for chunk in stream_answer(query, store):
+        chunks.append(chunk)
+        yield chunk
+    cache.store(query, store.data_version, "".join(chunks))
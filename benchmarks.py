@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for the data, lookup, scoring and render paths.
+Run this locally (or from test_deployment.py) to catch regressions before deploying.
+
+    python benchmarks.py                     # full suite -> benchmark_results.json
+    python benchmarks.py --quick             # fewer repetitions
+    python benchmarks.py --update-baseline   # also write benchmark_baseline.json
+    python benchmarks.py --gate              # exactly what the deployment gate runs
+    python benchmarks.py --gate --update-baseline   # refresh the baseline the gate compares to
+    python benchmarks.py --data synthetic/dashboard_data_1m.csv   # see synthetic_data.py
+
+Timings depend on the machine. Every run also times a fixed CPU workload
+(``calibrate``), and compare_to_baseline scales the timing limits by the
+ratio of the two calibration times, so a baseline captured on a faster or
+slower machine still gives a fair limit. Memory figures are compared
+unscaled, and only between runs of the same groups and pages.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+ROOT = Path(__file__).resolve().parent
+RESULTS_FILE = "benchmark_results.json"
+BASELINE_FILE = "benchmark_baseline.json"
+
+GROUPS = ["data", "lookup", "profile", "pages", "memory"]
+
+# What test_deployment.py's performance gate runs (and the baseline must be taken with).
+# Only the Dashboards stage is rendered: it includes the per-customer Credit Officer view.
+GATE_GROUPS = ["data", "lookup", "pages", "memory"]
+GATE_STAGES = ["dashboards"]
+GATE_REPEAT = 3
+
+CALIBRATION_RUNS = 7
+
+# Regression tolerances used by compare_to_baseline(): a benchmark fails when
+# current > baseline * (1 + relative) + absolute (seconds for timings, MB for memory)
+TOLERANCES = {
+    "data.load_customer_data": (0.50, 0.020),
+    "data.load_all_customers": (0.50, 0.020),
+    "lookup.customer_row": (0.50, 0.002),
+    "render.credit_officer": (0.50, 0.050),
+    "memory.data_and_profiles_peak_mb": (0.25, 4.0),
+    "memory.process_max_rss_mb": (0.25, 32.0),
+}
+
+# Credit Officer view inside the Dashboards stage
+CREDIT_OFFICER_VIEW = "💼 Credit Officer Dashboard"
+
+
+def _quiet_streamlit():
+    """Silence 'no runtime' warnings from calling cached functions in bare mode"""
+    import streamlit.logger
+    streamlit.logger.set_log_level("error")
+
+
+def summarize(samples):
+    """Timing stats (seconds) for a list of samples"""
+    ordered = sorted(samples)
+    n = len(ordered)
+
+    def pct(q):
+        return ordered[min(n - 1, int(round(q / 100 * (n - 1))))]
+
+    return {
+        "runs": n,
+        "min_s": ordered[0],
+        "median_s": pct(50),
+        "p95_s": pct(95),
+        "max_s": ordered[-1],
+        "mean_s": sum(ordered) / n,
+    }
+
+
+def measure(func, repeat, warmup=1):
+    """Call ``func`` ``warmup`` + ``repeat`` times and summarize the timed runs"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def calibrate(runs=CALIBRATION_RUNS):
+    """Median seconds for a fixed CPU workload (interpreter loop + NumPy sort), a machine speed reference"""
+    import numpy as np
+    values = np.random.default_rng(0).random(500_000)
+
+    def workload():
+        total = 0
+        for i in range(300_000):
+            total += i * i % 7
+        np.sort(values)
+        return total
+
+    return measure(workload, runs)["median_s"]
+
+
+def max_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _load_frames():
+    from customer_data import find_dashboard_data, get_data_version, load_customer_data
+    from credit_officer_enhanced_section import load_all_customers
+    data_version = get_data_version(find_dashboard_data())
+    return load_customer_data(), load_all_customers(data_version)
+
+
+def bench_data(repeat):
+    """Uncached load time of load_customer_data() and load_all_customers()"""
+    from customer_data import find_dashboard_data, get_data_version, load_customer_data
+    from credit_officer_enhanced_section import load_all_customers
+    data_version = get_data_version(find_dashboard_data())
+
+    def cold_load_customer_data():
+        load_customer_data.clear()
+        load_customer_data()
+
+    def cold_load_all_customers():
+        load_all_customers.clear()
+        load_all_customers(data_version)
+
+    return {
+        "data.load_customer_data": measure(cold_load_customer_data, repeat),
+        "data.load_all_customers": measure(cold_load_all_customers, repeat),
+    }
+
+
+def bench_lookup(repeat):
+    """Single-customer lookup latency over a spread of customer IDs"""
+    from credit_officer_enhanced_section import find_customer_row
+    _, customer_df = _load_frames()
+    ids = customer_df['customer_id'].astype(str).tolist()
+    step = max(1, len(ids) // 50)
+    sample_ids = ids[::step][:50]
+
+    samples = []
+    for _ in range(repeat):
+        for cid in sample_ids:
+            start = time.perf_counter()
+            find_customer_row(customer_df, cid)
+            samples.append(time.perf_counter() - start)
+    return {"lookup.customer_row": summarize(samples)}
+
+
+def bench_profile(repeat):
+    """Credit Officer profile construction and SHAP contributions per customer"""
+    from credit_officer_enhanced_section import build_customer_profile, compute_shap_contributions
+    _, customer_df = _load_frames()
+    rows = [row for _, row in customer_df.head(50).iterrows()]
+
+    profile_samples = []
+    shap_samples = []
+    for _ in range(repeat):
+        for row in rows:
+            start = time.perf_counter()
+            profile = build_customer_profile(row)
+            profile_samples.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            compute_shap_contributions(
+                volatility_val=float(row.get('volatility', 0.5)),
+                days_since=int(row.get('days_since_last_order', 30)),
+                gmv_slope=float(row.get('gmv_slope', 0)),
+                active_mons=profile['active_months'],
+                gmv_val=profile['gmv'],
+                orders=profile['orders'],
+                kee_score_scaled=profile['kee_score_scaled'],
+            )
+            shap_samples.append(time.perf_counter() - start)
+    return {
+        "profile.build_customer_profile": summarize(profile_samples),
+        "profile.compute_shap_contributions": summarize(shap_samples),
+    }
+
+
+def bench_pages(repeat, stages=None):
+    """Full-page script execution per stage with Streamlit's headless AppTest"""
+    from streamlit.testing.v1 import AppTest
+    from stages import STAGES
+
+    results = {}
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120)
+
+    start = time.perf_counter()
+    at.run()
+    results["render.cold_start"] = summarize([time.perf_counter() - start])
+    if at.exception:
+        raise RuntimeError(f"app.py raised on first run: {at.exception[0].value}")
+
+    labels = [label for label, module in STAGES.items() if stages is None or module in stages]
+    for label in labels:
+        at.sidebar.radio[0].set_value(label)
+
+        def run_stage():
+            at.run()
+            if at.exception:
+                raise RuntimeError(f"{label} raised: {at.exception[0].value}")
+
+        results[f"render.{STAGES[label]}"] = measure(run_stage, repeat)
+
+        if STAGES[label] == "dashboards":
+            at.selectbox[0].set_value(CREDIT_OFFICER_VIEW)
+            results["render.credit_officer"] = measure(run_stage, repeat)
+
+    return results
+
+
+def bench_memory():
+    """Peak Python allocations for loading data and building profiles, plus process RSS"""
+    from credit_officer_enhanced_section import build_customer_profile, load_all_customers
+    from customer_data import find_dashboard_data, get_data_version, load_customer_data
+
+    load_customer_data.clear()
+    load_all_customers.clear()
+    tracemalloc.start()
+    try:
+        load_customer_data()
+        customer_df = load_all_customers(get_data_version(find_dashboard_data()))
+        for _, row in customer_df.head(200).iterrows():
+            build_customer_profile(row)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "memory.data_and_profiles_peak_mb": {"value": peak / (1024 * 1024)},
+        "memory.process_max_rss_mb": {"value": max_rss_mb()},
+    }
+
+
+def run_benchmarks(groups=GROUPS, repeat=5, stages=None, verbose=True):
+    """Run the selected benchmark groups and return the results document"""
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    _quiet_streamlit()
+
+    runners = {
+        "data": lambda: bench_data(repeat),
+        "lookup": lambda: bench_lookup(max(1, repeat // 2)),
+        "profile": lambda: bench_profile(max(1, repeat // 2)),
+        "pages": lambda: bench_pages(repeat, stages),
+        "memory": bench_memory,
+    }
+
+    benchmarks = {}
+    for group in groups:
+        start = time.perf_counter()
+        benchmarks.update(runners[group]())
+        if verbose:
+            print(f"  ✅ {group} ({time.perf_counter() - start:.1f}s)")
+
+    return {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "data": os.environ.get("KEE_DASHBOARD_DATA", "dashboard_data.csv"),
+            "groups": list(groups),
+            "stages": sorted(stages) if stages is not None else None,
+            "calibration_s": calibrate(),
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def load_baseline(path=None):
+    """Committed baseline results, or None if there is none yet"""
+    path = Path(path) if path else ROOT / BASELINE_FILE
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _headline(stats):
+    return stats["value"] if "value" in stats else stats["median_s"]
+
+
+def speed_ratio(results, baseline):
+    """Current / baseline calibration time (>1 = this machine is slower); 1.0 if either is missing"""
+    current = results.get("meta", {}).get("calibration_s")
+    reference = baseline.get("meta", {}).get("calibration_s")
+    if not current or not reference:
+        return 1.0
+    return current / reference
+
+
+def same_workload(results, baseline):
+    """Whether both runs used the same groups and pages (needed for comparable memory figures)"""
+    keys = ("groups", "stages", "data")
+    return all(results.get("meta", {}).get(k) == baseline.get("meta", {}).get(k) for k in keys)
+
+
+def compare_to_baseline(results, baseline, tolerances=TOLERANCES):
+    """Check gated benchmarks against the baseline
+
+    Returns one row per benchmark present in both documents:
+    ``{"name", "baseline", "current", "limit", "ok"}`` (median seconds or MB).
+    Timing limits are scaled by ``speed_ratio``; memory benchmarks are only
+    compared when ``same_workload`` holds.
+    """
+    scale = speed_ratio(results, baseline)
+    comparable_memory = same_workload(results, baseline)
+    rows = []
+    for name, (relative, absolute) in tolerances.items():
+        current = results["benchmarks"].get(name)
+        reference = baseline["benchmarks"].get(name)
+        if current is None or reference is None:
+            continue
+        current, reference = _headline(current), _headline(reference)
+        if current is None or reference is None:
+            continue
+        if name.startswith("memory."):
+            if not comparable_memory:
+                continue
+            limit = reference * (1 + relative) + absolute
+        else:
+            limit = (reference * (1 + relative) + absolute) * scale
+        rows.append({
+            "name": name,
+            "baseline": reference,
+            "current": current,
+            "limit": limit,
+            "ok": current <= limit,
+        })
+    return rows
+
+
+def format_results(results):
+    lines = []
+    for name, stats in results["benchmarks"].items():
+        if "value" in stats:
+            value = stats["value"]
+            lines.append(f"  {name:<42} {value:10.1f} MB" if value is not None else f"  {name:<42}        n/a")
+        else:
+            lines.append(
+                f"  {name:<42} median {stats['median_s'] * 1000:9.2f} ms"
+                f"   p95 {stats['p95_s'] * 1000:9.2f} ms   (n={stats['runs']})"
+            )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the dashboard performance benchmarks")
+    parser.add_argument("--quick", action="store_true", help="Fewer repetitions")
+    parser.add_argument("--repeat", type=int, help="Timed repetitions per benchmark")
+    parser.add_argument("--groups", nargs="+", choices=GROUPS, default=GROUPS)
+    parser.add_argument("--output", default=RESULTS_FILE, help="Results JSON file")
+    parser.add_argument("--data", help="Customer file to benchmark instead of dashboard_data.csv")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help=f"Also write the results to {BASELINE_FILE}")
+    parser.add_argument("--gate", action="store_true",
+                        help="Run the deployment gate's groups and pages (as the baseline should be)")
+    args = parser.parse_args()
+
+    repeat = args.repeat or (2 if args.quick else GATE_REPEAT if args.gate else 5)
+    groups, stages = (GATE_GROUPS, GATE_STAGES) if args.gate else (args.groups, None)
+    if args.data:
+        from customer_data import DATA_ENV_VAR
+        os.environ[DATA_ENV_VAR] = os.path.abspath(args.data)
+
+    print("=" * 60)
+    print("⏱️  Dashboard Performance Benchmarks")
+    print("=" * 60)
+    results = run_benchmarks(groups=groups, repeat=repeat, stages=stages)
+    print()
+    print(format_results(results))
+
+    print(f"  {'calibration':<42} median {results['meta']['calibration_s'] * 1000:9.2f} ms")
+
+    with open(ROOT / args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n📝 Results written to {args.output}")
+
+    if args.update_baseline:
+        with open(ROOT / BASELINE_FILE, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📌 Baseline updated: {BASELINE_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Bitmap Index
+============
+
+Packed bitmap indexes over categorical and flag columns. Each (field,
+value) pair - e.g. ("risk_level", "High"), ("inactive", True) - is a bit
+array with one bit per customer row, packed into 64-bit words, so a
+compound segment like "High risk AND inactive AND NOT zero value" is a
+few word-wise AND/OR/NOT operations over n/64 words instead of fresh
+boolean masks over the whole table.
+
+Usage:
+    index = BitmapIndex(len(df))
+    index.add_categories("risk_level", df["risk_level_30d"].to_numpy())
+    index.add("inactive", df["days_since_last_order"].to_numpy() > 90)
+
+    segment = index.get("risk_level", "High") & index.get("inactive") & ~index.get("zero_value")
+    segment.count(), segment.rows()
+"""
+
+import numpy as np
+import pandas as pd
+
+
+if hasattr(np, "bitwise_count"):
+    def _popcount(words):
+        return int(np.bitwise_count(words).sum())
+else:  # NumPy < 2.0
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(words):
+        return int(_BYTE_COUNTS[words.view(np.uint8)].sum(dtype=np.int64))
+
+
+class Bitmap:
+    """Fixed-size bit array packed into uint64 words"""
+
+    __slots__ = ("words", "size")
+
+    def __init__(self, words, size):
+        self.words = words
+        self.size = size
+
+    @classmethod
+    def from_mask(cls, mask):
+        mask = np.asarray(mask, dtype=bool)
+        packed = np.packbits(mask, bitorder="little")
+        packed = np.concatenate([packed, np.zeros(-len(packed) % 8, dtype=np.uint8)])
+        return cls(packed.view(np.uint64), len(mask))
+
+    @classmethod
+    def from_rows(cls, rows, size):
+        mask = np.zeros(size, dtype=bool)
+        mask[np.asarray(rows, dtype=np.int64)] = True
+        return cls.from_mask(mask)
+
+    @classmethod
+    def empty(cls, size):
+        return cls(np.zeros((size + 63) // 64, dtype=np.uint64), size)
+
+    @classmethod
+    def full(cls, size):
+        return ~cls.empty(size)
+
+    def _check(self, other):
+        if other.size != self.size:
+            raise ValueError(f"Bitmap sizes differ: {self.size} vs {other.size}")
+
+    def __and__(self, other):
+        self._check(other)
+        return Bitmap(self.words & other.words, self.size)
+
+    def __or__(self, other):
+        self._check(other)
+        return Bitmap(self.words | other.words, self.size)
+
+    def __sub__(self, other):
+        """Bits in self and not in other"""
+        self._check(other)
+        return Bitmap(self.words & ~other.words, self.size)
+
+    def __invert__(self):
+        words = ~self.words
+        tail = self.size % 64
+        if tail:
+            words[-1] &= np.uint64((1 << tail) - 1)
+        return Bitmap(words, self.size)
+
+    def contains(self, rows):
+        """Boolean array: is the bit set for each row position"""
+        rows = np.asarray(rows, dtype=np.int64)
+        bits = self.words[rows >> 6] >> (rows & 63).astype(np.uint64)
+        return (bits & np.uint64(1)).astype(bool)
+
+    def count(self):
+        return _popcount(self.words)
+
+    def to_mask(self):
+        bits = np.unpackbits(self.words.view(np.uint8), count=self.size, bitorder="little")
+        return bits.view(bool)
+
+    def rows(self):
+        """Row positions of set bits, ascending"""
+        return np.flatnonzero(self.to_mask())
+
+
+class BitmapIndex:
+    """Bitmaps keyed by (field, value) for one table"""
+
+    def __init__(self, size):
+        self.size = size
+        self._bitmaps = {}
+
+    def add(self, field, mask, value=True):
+        self._bitmaps[(field, value)] = Bitmap.from_mask(mask)
+
+    def add_categories(self, field, values, missing="None"):
+        """One bitmap per distinct value of a categorical column (NaN -> ``missing``)"""
+        codes, categories = pd.factorize(pd.Series(values, dtype=object).fillna(missing), sort=True)
+        for code, category in enumerate(categories):
+            self._bitmaps[(field, category)] = Bitmap.from_mask(codes == code)
+
+    def get(self, field, value=True):
+        """Bitmap for ``field == value`` (empty if the value never occurs)"""
+        bitmap = self._bitmaps.get((field, value))
+        return bitmap if bitmap is not None else Bitmap.empty(self.size)
+
+    def any_of(self, field, values):
+        """OR of the bitmaps for several values of one field"""
+        result = Bitmap.empty(self.size)
+        for value in values:
+            result = result | self.get(field, value)
+        return result
+
+    def values(self, field):
+        return sorted(value for f, value in self._bitmaps if f == field)
+
+    def all(self):
+        return Bitmap.full(self.size)
@@ -0,0 +1,148 @@
+"""
+Chat History
+============
+
+Bounded per-session chat history for the AI Assistant. Only the latest
+``window`` messages are rendered on each rerun; older ones stay behind a
+"show earlier" control, and the history is capped at ``max_messages``
+(oldest dropped first) so rerun time and session memory stay flat in long
+sessions.
+
+Long assistant answers (tables, customer lists) are kept by reference into
+a process-wide answer store keyed by content hash: sessions that got the
+same answer share one copy, together with the data version it was built
+from. A stored answer never changes and is never recomputed, so an old
+message keeps showing exactly what the officer saw; it is freed once no
+session's history refers to it any more.
+
+Set ``KEE_CHAT_WINDOW`` to change how many messages are shown by default.
+"""
+
+import hashlib
+import os
+import threading
+import weakref
+from collections import deque
+
+import streamlit as st
+
+
+SESSION_KEY = "chat_history"
+WINDOW_ENV_VAR = "KEE_CHAT_WINDOW"
+DEFAULT_WINDOW = 10
+MAX_MESSAGES = 200
+INLINE_LIMIT = 1024  # characters; longer answers (tables, lists) are stored by reference
+
+
+class StoredAnswer:
+    """One immutable answer: content hash, markdown and the data version it was built from"""
+
+    __slots__ = ("digest", "text", "data_version", "__weakref__")
+
+    def __init__(self, digest, text, data_version):
+        self.digest = digest
+        self.text = text
+        self.data_version = data_version
+
+
+class AnswerStore:
+    """Content-addressed answers shared across sessions
+
+    Entries are held weakly: chat messages keep their StoredAnswer alive,
+    and an answer no history refers to is dropped.
+    """
+
+    def __init__(self):
+        self._answers = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._answers)
+
+    def put(self, text, data_version):
+        """The shared StoredAnswer for ``text`` built at ``data_version``"""
+        digest = hashlib.sha256(f"{data_version}\0{text}".encode()).hexdigest()
+        with self._lock:
+            answer = self._answers.get(digest)
+            if answer is None:
+                answer = StoredAnswer(digest, text, data_version)
+                self._answers[digest] = answer
+            return answer
+
+    def get(self, digest):
+        """StoredAnswer for a hash, or None once no session refers to it"""
+        return self._answers.get(digest)
+
+
+@st.cache_resource
+def get_answer_store():
+    """Process-wide answer store shared across sessions"""
+    return AnswerStore()
+
+
+def _window_from_env():
+    """Render window from ``KEE_CHAT_WINDOW``; default if unset or not a number, at least 1"""
+    try:
+        window = int(os.environ.get(WINDOW_ENV_VAR, DEFAULT_WINDOW))
+    except ValueError:
+        return DEFAULT_WINDOW
+    return max(1, window)
+
+
+class ChatHistory:
+    """Capped message list with a render window"""
+
+    def __init__(self, window=None, max_messages=MAX_MESSAGES):
+        self.window = window or _window_from_env()
+        self.messages = deque(maxlen=max_messages)
+        self.shown = self.window
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self.messages)
+
+    def _append(self, message):
+        if len(self.messages) == self.messages.maxlen:
+            self.dropped += 1
+        self.messages.append(message)
+
+    def add_user(self, text):
+        self._append({"role": "user", "content": text})
+
+    def add_assistant(self, answer, data_version=None, store=None):
+        """Store an answer inline if short, else as a reference into the answer store"""
+        if len(answer) > INLINE_LIMIT:
+            stored = (store or get_answer_store()).put(answer, data_version)
+            self._append({"role": "assistant", "answer": stored, "data_version": data_version})
+        else:
+            self._append({"role": "assistant", "content": answer, "data_version": data_version})
+
+    def hidden_count(self):
+        return max(0, len(self.messages) - self.shown)
+
+    def show_earlier(self):
+        self.shown += self.window
+
+    def visible(self):
+        """Messages inside the current render window (oldest first)"""
+        start = max(0, len(self.messages) - self.shown)
+        return [self.messages[i] for i in range(start, len(self.messages))]
+
+    def clear(self):
+        self.messages.clear()
+        self.shown = self.window
+        self.dropped = 0
+
+
+def get_chat_history():
+    """This session's chat history (created on first use)"""
+    if SESSION_KEY not in st.session_state:
+        st.session_state[SESSION_KEY] = ChatHistory()
+    return st.session_state[SESSION_KEY]
+
+
+def message_content(message):
+    """Markdown for a message, exactly as it was first shown"""
+    if "answer" in message:
+        return message["answer"].text
+    return message["content"]
@@ -24,12 +24,378 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 import numpy as np
+import hashlib
 from datetime import datetime, timedelta
 
+from customer_data import find_conektr_data, find_dashboard_data, get_data_version
+from customer_store import get_current_store
+from formatting import percentile_label
+from figure_cache import cached_figure
+from gmv_rollup import get_current_rollup
+from metrics import timed
+
 
 # Enhanced Credit Officer Dashboard Code
 # =======================================
 
+PORTFOLIO_POSITION_COLUMNS = [
+    ("risk_score_30d", "Kee score"),
+    ("account_value", "Account value"),
+    ("volatility", "Volatility"),
+    ("gmv_slope", "GMV slope"),
+]
+
+# Load customer data from CSV files
+@st.cache_data
+def load_all_customers(data_version):
+    """Load all customers from CSV files
+
+    ``data_version`` is only part of the cache key, so a new daily file
+    is picked up without restarting the app.
+    """
+    try:
+        # Load dashboard data
+        dashboard_path = find_dashboard_data()
+        if dashboard_path is None:
+            raise FileNotFoundError("dashboard_data.csv not found in any expected location")
+        with timed("data_load_seconds", source="credit_officer_customers"):
+            dashboard_df = pd.read_csv(dashboard_path)
+        
+        # Try to load conektr data for customer names (optional)
+        conektr_df = None
+        conektr_path = find_conektr_data()
+        if conektr_path is not None:
+            try:
+                conektr_df = pd.read_csv(conektr_path)
+            except:
+                pass  # File might be too large or corrupted
+        
+        # Use dashboard data as base
+        merged_df = dashboard_df.copy()
+        
+        # Check if customer_name column exists, otherwise create it
+        if 'customer_name' in merged_df.columns:
+            # Rename to Outlet Name for consistency
+            merged_df['Outlet Name'] = merged_df['customer_name']
+        elif 'Outlet Name' not in merged_df.columns:
+            # If conektr data is available, try to get outlet names from it
+            if conektr_df is not None:
+                try:
+                    customer_names = conektr_df.groupby('customer_id')['Outlet Name'].first().reset_index()
+                    merged_df = merged_df.merge(customer_names, on='customer_id', how='left')
+                except:
+                    pass
+        
+        # Remove customers with missing outlet names
+        merged_df = merged_df[merged_df['Outlet Name'].notna()]
+        
+        return merged_df
+    except Exception as e:
+        st.error(f"Could not load customer data: {str(e)}")
+        return None
+
+
+def find_customer_row(customer_df, customer_id):
+    """Return the row for ``customer_id`` (str or int)"""
+    return customer_df[customer_df['customer_id'].astype(str) == str(customer_id)].iloc[0]
+
+
+def build_customer_profile(cust_row):
+    """Build the profile dict shown across the tabs from a customer CSV row
+
+    The illustrative figures are drawn from ``customer_rng`` so a customer's
+    profile is the same on every rerun (and matches the cached SHAP inputs).
+    """
+    rng = customer_rng(cust_row.get('customer_id'), "profile")
+    # Build customer data dictionary from CSV
+    # Use account_value as GMV proxy, calculate orders from active months
+    account_val = float(cust_row.get('account_value', 0))
+    
+    # Get raw Kee score first for all calculations
+    raw_kee_score = float(cust_row.get('risk_score_30d', 0.001))
+    
+    # Adjust metrics based on risk level - LOW RISK = BETTER METRICS
+    if raw_kee_score >= 0.7:  # Very High Risk
+        estimated_gmv = max(account_val * 500, rng.uniform(15000, 50000))
+        estimated_orders = rng.integers(20, 60)
+        active_mons = max(4, int(cust_row.get('active_months', rng.integers(4, 8))))
+        days_since = rng.integers(45, 90)  # Long time since last order
+    elif raw_kee_score >= 0.5:  # High Risk
+        estimated_gmv = max(account_val * 700, rng.uniform(25000, 80000))
+        estimated_orders = rng.integers(30, 100)
+        active_mons = max(6, int(cust_row.get('active_months', rng.integers(6, 10))))
+        days_since = rng.integers(30, 60)
+    elif raw_kee_score >= 0.1:  # Medium Risk
+        estimated_gmv = max(account_val * 900, rng.uniform(40000, 150000))
+        estimated_orders = rng.integers(50, 150)
+        active_mons = max(8, int(cust_row.get('active_months', rng.integers(8, 14))))
+        days_since = rng.integers(15, 35)
+    else:  # Low to Very Low Risk
+        estimated_gmv = max(account_val * 1000, rng.uniform(80000, 250000))
+        estimated_orders = rng.integers(80, 200)
+        active_mons = max(12, int(cust_row.get('active_months', rng.integers(12, 24))))
+        days_since = rng.integers(1, 15)  # Very recent activity
+    
+    # Scale Kee score to 1-10 range (10 = lowest risk, 1 = highest risk)
+    # Invert so higher score = lower risk (like credit scores)
+    # Formula: 10 - (risk * 9) maps [0,1] risk to [10,1] score
+    kee_score_scaled = min(10, max(1, 10 - (raw_kee_score * 9)))
+    
+    # Determine AECB score based on risk level (inverse relationship)
+    # High Kee score (high risk) = Low AECB score
+    if raw_kee_score >= 0.7:  # Very High Risk
+        aecb_score = int(rng.uniform(500, 600))
+    elif raw_kee_score >= 0.5:  # High Risk
+        aecb_score = int(rng.uniform(580, 650))
+    elif raw_kee_score >= 0.1:  # Medium Risk
+        aecb_score = int(rng.uniform(640, 720))
+    elif raw_kee_score >= 0.05:  # Low Risk
+        aecb_score = int(rng.uniform(710, 800))
+    else:  # Very Low Risk
+        aecb_score = int(rng.uniform(780, 850))
+    
+    return {
+        "gmv": round(estimated_gmv, 2),
+        "gmv_change": f"+{rng.uniform(5, 20):.1f}%",
+        "orders": estimated_orders,
+        "orders_change": f"+{rng.integers(1, 30)}",
+        "active_months": active_mons,
+        "last_order": f"{days_since} days ago",
+        "avg_order": estimated_gmv / max(estimated_orders, 1),
+        "order_freq": f"{estimated_orders / max(active_mons, 1):.1f} orders/month",
+        "category": rng.choice(["Electronics", "Fashion", "Home & Garden", "Beauty", "Sports", "Food"]),
+        "since": f"{rng.choice(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'])} {rng.choice([2022, 2023])}",
+        "volatility": f"{cust_row.get('volatility', 0):.2f} ({'Low' if cust_row.get('volatility', 0) < 0.3 else 'Medium' if cust_row.get('volatility', 0) < 0.5 else 'High'})",
+        "growth": f"+{cust_row.get('gmv_slope', 0) * 100:.1f}%",
+        "kee_score": raw_kee_score,  # Keep original for logic
+        "kee_score_scaled": kee_score_scaled,  # Display scaled version
+        "bank_balance": int(rng.uniform(20000, 100000)),
+        "avg_monthly_income": int(rng.uniform(12000, 35000)),
+        "avg_expenses": int(rng.uniform(8000, 20000)),
+        "aecb_score": aecb_score,  # Risk-adjusted AECB score
+        "credit_cards": rng.integers(1, 4),
+        "loans": rng.integers(0, 3),
+        "dewa_avg": int(rng.uniform(600, 1200))
+    }
+
+
+def customer_rng(customer_id, stream):
+    """Deterministic RNG for a customer's illustrative series"""
+    seed = int(hashlib.blake2b(f"{customer_id}:{stream}".encode(), digest_size=8).hexdigest(), 16)
+    return np.random.default_rng(seed)
+
+
+def compute_shap_contributions(volatility_val, days_since, gmv_slope, active_mons,
+                               gmv_val, orders, kee_score_scaled):
+    """Per-feature SHAP contributions for one customer as a DataFrame"""
+    # Calculate SHAP impacts based on actual values and risk level
+    # For high-risk customers, features should increase risk (positive SHAP)
+    # For low-risk customers, features should decrease risk (negative SHAP)
+    
+    # Base SHAP calculation - adjust based on feature quality
+    base_impact = kee_score_scaled / 8  # Distribute the score across features
+    
+    # Volatility impact (high volatility = increases risk)
+    if volatility_val > 0.5:
+        volatility_shap = base_impact * 1.5
+        volatility_effect = "↑ Increases Risk"
+        volatility_explain = "High volatility indicates unstable business"
+    elif volatility_val > 0.3:
+        volatility_shap = base_impact * 0.5
+        volatility_effect = "↑ Slight Risk Increase"
+        volatility_explain = "Moderate volatility shows some instability"
+    else:
+        volatility_shap = -base_impact * 0.8
+        volatility_effect = "↓ Reduces Risk"
+        volatility_explain = "Low volatility indicates stable business"
+    
+    # Days since last order (recent = reduces risk)
+    if days_since > 60:
+        days_shap = base_impact * 1.2
+        days_effect = "↑ Increases Risk"
+        days_explain = "Long gap since last order is concerning"
+    elif days_since > 30:
+        days_shap = base_impact * 0.3
+        days_effect = "↑ Slight Risk Increase"
+        days_explain = "Moderate gap shows reduced engagement"
+    else:
+        days_shap = -base_impact * 0.7
+        days_effect = "↓ Reduces Risk"
+        days_explain = "Recent activity shows engagement"
+    
+    # GMV Slope (positive growth = reduces risk)
+    if gmv_slope < -500:
+        gmv_slope_shap = base_impact * 1.3
+        gmv_slope_effect = "↑ Increases Risk"
+        gmv_slope_explain = "Negative growth trend is concerning"
+    elif gmv_slope < 0:
+        gmv_slope_shap = base_impact * 0.4
+        gmv_slope_effect = "↑ Slight Risk Increase"
+        gmv_slope_explain = "Declining trend shows weakness"
+    else:
+        gmv_slope_shap = -base_impact * 0.6
+        gmv_slope_effect = "↓ Reduces Risk"
+        gmv_slope_explain = "Positive growth trend is favorable"
+    
+    # Sales volume (high GMV = reduces risk)
+    if gmv_val > 100000:
+        sales_shap = -base_impact * 0.9
+        sales_effect = "↓ Reduces Risk"
+        sales_explain = "High sales volume reduces risk"
+    elif gmv_val > 50000:
+        sales_shap = -base_impact * 0.4
+        sales_effect = "↓ Slight Risk Reduction"
+        sales_explain = "Moderate sales provide some stability"
+    else:
+        sales_shap = base_impact * 0.6
+        sales_effect = "↑ Increases Risk"
+        sales_explain = "Low sales volume increases risk"
+    
+    # Consistency score (derived from volatility)
+    consistency_val = 1 - volatility_val
+    if consistency_val > 0.7:
+        consistency_shap = -base_impact * 0.5
+        consistency_effect = "↓ Reduces Risk"
+        consistency_explain = "Consistent behavior is positive"
+    elif consistency_val > 0.5:
+        consistency_shap = -base_impact * 0.2
+        consistency_effect = "↓ Slight Risk Reduction"
+        consistency_explain = "Moderate consistency is acceptable"
+    else:
+        consistency_shap = base_impact * 0.7
+        consistency_effect = "↑ Increases Risk"
+        consistency_explain = "Inconsistent behavior is concerning"
+    
+    # Active months (longer tenure = reduces risk)
+    if active_mons >= 12:
+        active_shap = -base_impact * 0.6
+        active_effect = "↓ Reduces Risk"
+        active_explain = "Long tenure indicates stability"
+    elif active_mons >= 6:
+        active_shap = -base_impact * 0.3
+        active_effect = "↓ Slight Risk Reduction"
+        active_explain = "Moderate tenure shows commitment"
+    else:
+        active_shap = base_impact * 0.5
+        active_effect = "↑ Increases Risk"
+        active_explain = "Short tenure increases uncertainty"
+    
+    # Order frequency
+    order_freq = orders / max(active_mons, 1)
+    if order_freq > 20:
+        freq_shap = -base_impact * 0.4
+        freq_effect = "↓ Reduces Risk"
+        freq_explain = "Regular orders show reliability"
+    elif order_freq > 10:
+        freq_shap = -base_impact * 0.2
+        freq_effect = "↓ Slight Risk Reduction"
+        freq_explain = "Moderate order frequency is acceptable"
+    else:
+        freq_shap = base_impact * 0.4
+        freq_effect = "↑ Increases Risk"
+        freq_explain = "Low order frequency is concerning"
+    
+    # Recency score (inverse of days since)
+    recency_score = max(0, 1 - (days_since / 90))
+    if recency_score > 0.8:
+        recency_shap = -base_impact * 0.3
+        recency_effect = "↓ Reduces Risk"
+        recency_explain = "Recent transactions are positive"
+    elif recency_score > 0.5:
+        recency_shap = -base_impact * 0.1
+        recency_effect = "↓ Slight Risk Reduction"
+        recency_explain = "Moderate recency is acceptable"
+    else:
+        recency_shap = base_impact * 0.5
+        recency_effect = "↑ Increases Risk"
+        recency_explain = "Lack of recent activity is concerning"
+    
+    shap_data = pd.DataFrame({
+        "Feature": [
+            "Volatility",
+            "Days Since Last Order",
+            "GMV Slope (Growth)",
+            "Sales Last 12 Months",
+            "Consistency Score",
+            "Active Months",
+            "Order Frequency",
+            "Recency Score"
+        ],
+        "Value": [
+            f"{volatility_val:.2f}",
+            f"{days_since} days",
+            f"AED {gmv_slope:.1f}/month",
+            f"AED {gmv_val:,.0f}",
+            f"{consistency_val:.2f}",
+            f"{active_mons} months",
+            f"{order_freq:.1f}/month",
+            f"{recency_score:.2f}"
+        ],
+        "SHAP Impact": [
+            volatility_shap,
+            days_shap,
+            gmv_slope_shap,
+            sales_shap,
+            consistency_shap,
+            active_shap,
+            freq_shap,
+            recency_shap
+        ],
+        "Effect": [
+            volatility_effect,
+            days_effect,
+            gmv_slope_effect,
+            sales_effect,
+            consistency_effect,
+            active_effect,
+            freq_effect,
+            recency_effect
+        ],
+        "Explanation": [
+            volatility_explain,
+            days_explain,
+            gmv_slope_explain,
+            sales_explain,
+            consistency_explain,
+            active_explain,
+            freq_explain,
+            recency_explain
+        ]
+    })
+    
+    return shap_data
+
+
+@st.cache_data(max_entries=512)
+def get_shap_contributions(customer_id, data_version, _inputs):
+    """Cached contributions vector for a customer
+
+    Keyed on (customer_id, data_version) only; ``_inputs`` is excluded from
+    hashing. That is safe because the inputs come from the customer's CSV row
+    and ``build_customer_profile``, both fixed for a customer and data version.
+    """
+    return compute_shap_contributions(**_inputs)
+
+
+def build_shap_waterfall(shap_data):
+    """Build the SHAP waterfall figure from a contributions DataFrame"""
+    fig = go.Figure(go.Waterfall(
+        name="SHAP",
+        orientation="h",
+        y=shap_data["Feature"],
+        x=shap_data["SHAP Impact"],
+        connector={"line": {"color": "rgb(63, 63, 63)"}},
+        decreasing={"marker": {"color": "green"}},
+        increasing={"marker": {"color": "red"}},
+    ))
+    fig.update_layout(
+        title="SHAP Feature Contributions (Waterfall)",
+        xaxis_title="Impact on Kee Score (Positive = Increases Risk)",
+        height=400
+    )
+    return fig
+
+
 def render_credit_officer_dashboard():
     """Main function to render the enhanced Credit Officer Dashboard"""
     
@@ -53,75 +419,9 @@ def render_credit_officer_dashboard():
     # Customer Selection
     st.markdown("#### 🔍 Customer Selection")
     
-    # Load customer data from CSV files
-    @st.cache_data
-    def load_all_customers():
-        """Load all customers from CSV files"""
-        try:
-            import os
-            # Get the directory where this script is located
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            # Try multiple possible paths for the CSV files
-            dashboard_paths = [
-                'dashboard_data.csv',  # Current directory
-                os.path.join(script_dir, 'dashboard_data.csv'),  # Script directory
-                os.path.join(script_dir, '..', 'dashboard_data.csv'),  # Parent directory
-            ]
-            
-            conektr_paths = [
-                'data/conektr_data.csv',  # Current directory
-                os.path.join(script_dir, 'data', 'conektr_data.csv'),  # Script directory
-                os.path.join(script_dir, '..', 'data', 'conektr_data.csv'),  # Parent directory
-            ]
-            
-            # Load dashboard data
-            dashboard_df = None
-            for path in dashboard_paths:
-                if os.path.exists(path):
-                    dashboard_df = pd.read_csv(path)
-                    break
-            
-            if dashboard_df is None:
-                raise FileNotFoundError("dashboard_data.csv not found in any expected location")
-            
-            # Try to load conektr data for customer names (optional)
-            conektr_df = None
-            for path in conektr_paths:
-                if os.path.exists(path):
-                    try:
-                        conektr_df = pd.read_csv(path)
-                        break
-                    except:
-                        pass  # File might be too large or corrupted
-            
-            # Use dashboard data as base
-            merged_df = dashboard_df.copy()
-            
-            # Check if customer_name column exists, otherwise create it
-            if 'customer_name' in merged_df.columns:
-                # Rename to Outlet Name for consistency
-                merged_df['Outlet Name'] = merged_df['customer_name']
-            elif 'Outlet Name' not in merged_df.columns:
-                # If conektr data is available, try to get outlet names from it
-                if conektr_df is not None:
-                    try:
-                        customer_names = conektr_df.groupby('customer_id')['Outlet Name'].first().reset_index()
-                        merged_df = merged_df.merge(customer_names, on='customer_id', how='left')
-                    except:
-                        pass
-                
-
-            
-            # Remove customers with missing outlet names
-            merged_df = merged_df[merged_df['Outlet Name'].notna()]
-            
-            return merged_df
-        except Exception as e:
-            st.error(f"Could not load customer data: {str(e)}")
-            return None
-    
-    customer_df = load_all_customers()
+    dashboard_path = find_dashboard_data()
+    data_version = get_data_version(dashboard_path)
+    customer_df = load_all_customers(data_version)
     
     if customer_df is not None and len(customer_df) > 0:
         # Create customer dropdown options with real outlet names
@@ -140,78 +440,10 @@ def render_credit_officer_dashboard():
             customer_id = selected_display.split(" - ")[0]
             
             # Get customer row data
-            cust_row = customer_df[customer_df['customer_id'].astype(str) == customer_id].iloc[0]
-            
-            # Build customer data dictionary from CSV
-            # Use account_value as GMV proxy, calculate orders from active months
-            account_val = float(cust_row.get('account_value', 0))
-            
-            # Get raw Kee score first for all calculations
-            raw_kee_score = float(cust_row.get('risk_score_30d', 0.001))
+            with timed("customer_lookup_seconds", view="credit_officer"):
+                cust_row = find_customer_row(customer_df, customer_id)
             
-            # Adjust metrics based on risk level - LOW RISK = BETTER METRICS
-            if raw_kee_score >= 0.7:  # Very High Risk
-                estimated_gmv = max(account_val * 500, np.random.uniform(15000, 50000))
-                estimated_orders = np.random.randint(20, 60)
-                active_mons = max(4, int(cust_row.get('active_months', np.random.randint(4, 8))))
-                days_since = np.random.randint(45, 90)  # Long time since last order
-            elif raw_kee_score >= 0.5:  # High Risk
-                estimated_gmv = max(account_val * 700, np.random.uniform(25000, 80000))
-                estimated_orders = np.random.randint(30, 100)
-                active_mons = max(6, int(cust_row.get('active_months', np.random.randint(6, 10))))
-                days_since = np.random.randint(30, 60)
-            elif raw_kee_score >= 0.1:  # Medium Risk
-                estimated_gmv = max(account_val * 900, np.random.uniform(40000, 150000))
-                estimated_orders = np.random.randint(50, 150)
-                active_mons = max(8, int(cust_row.get('active_months', np.random.randint(8, 14))))
-                days_since = np.random.randint(15, 35)
-            else:  # Low to Very Low Risk
-                estimated_gmv = max(account_val * 1000, np.random.uniform(80000, 250000))
-                estimated_orders = np.random.randint(80, 200)
-                active_mons = max(12, int(cust_row.get('active_months', np.random.randint(12, 24))))
-                days_since = np.random.randint(1, 15)  # Very recent activity
-            
-            # Scale Kee score to 1-10 range (10 = lowest risk, 1 = highest risk)
-            # Invert so higher score = lower risk (like credit scores)
-            # Formula: 10 - (risk * 9) maps [0,1] risk to [10,1] score
-            kee_score_scaled = min(10, max(1, 10 - (raw_kee_score * 9)))
-            
-            # Determine AECB score based on risk level (inverse relationship)
-            # High Kee score (high risk) = Low AECB score
-            if raw_kee_score >= 0.7:  # Very High Risk
-                aecb_score = int(np.random.uniform(500, 600))
-            elif raw_kee_score >= 0.5:  # High Risk
-                aecb_score = int(np.random.uniform(580, 650))
-            elif raw_kee_score >= 0.1:  # Medium Risk
-                aecb_score = int(np.random.uniform(640, 720))
-            elif raw_kee_score >= 0.05:  # Low Risk
-                aecb_score = int(np.random.uniform(710, 800))
-            else:  # Very Low Risk
-                aecb_score = int(np.random.uniform(780, 850))
-            
-            cust_data = {
-                "gmv": round(estimated_gmv, 2),
-                "gmv_change": f"+{np.random.uniform(5, 20):.1f}%",
-                "orders": estimated_orders,
-                "orders_change": f"+{np.random.randint(1, 30)}",
-                "active_months": active_mons,
-                "last_order": f"{days_since} days ago",
-                "avg_order": estimated_gmv / max(estimated_orders, 1),
-                "order_freq": f"{estimated_orders / max(active_mons, 1):.1f} orders/month",
-                "category": np.random.choice(["Electronics", "Fashion", "Home & Garden", "Beauty", "Sports", "Food"]),
-                "since": f"{np.random.choice(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'])} {np.random.choice([2022, 2023])}",
-                "volatility": f"{cust_row.get('volatility', 0):.2f} ({'Low' if cust_row.get('volatility', 0) < 0.3 else 'Medium' if cust_row.get('volatility', 0) < 0.5 else 'High'})",
-                "growth": f"+{cust_row.get('gmv_slope', 0) * 100:.1f}%",
-                "kee_score": raw_kee_score,  # Keep original for logic
-                "kee_score_scaled": kee_score_scaled,  # Display scaled version
-                "bank_balance": int(np.random.uniform(20000, 100000)),
-                "avg_monthly_income": int(np.random.uniform(12000, 35000)),
-                "avg_expenses": int(np.random.uniform(8000, 20000)),
-                "aecb_score": aecb_score,  # Risk-adjusted AECB score
-                "credit_cards": np.random.randint(1, 4),
-                "loans": np.random.randint(0, 3),
-                "dewa_avg": int(np.random.uniform(600, 1200))
-            }
+            cust_data = build_customer_profile(cust_row)
             
             # Set selected_customer variable
             selected_customer = selected_display
@@ -285,6 +517,15 @@ def render_credit_officer_dashboard():
         with col3:
             st.metric("Confidence", "98.5%", help="Model confidence level")
         
+        # Where the customer sits in the portfolio (quantile sketches, per data version)
+        if customer_df is not None and len(customer_df) > 0:
+            store = get_current_store()
+            position = [
+                f"{label} **{percentile_label(float(store.percentile(col, float(cust_row.get(col, np.nan)))))}**"
+                for col, label in PORTFOLIO_POSITION_COLUMNS
+            ]
+            st.caption("📍 Portfolio position: " + " · ".join(position))
+        
         st.markdown("---")
         
         
@@ -477,199 +718,23 @@ def render_credit_officer_dashboard():
         
         st.markdown("---")
 
-        # Calculate SHAP impacts based on actual values and risk level
-        # For high-risk customers, features should increase risk (positive SHAP)
-        # For low-risk customers, features should decrease risk (negative SHAP)
-        
-        # Base SHAP calculation - adjust based on feature quality
-        base_impact = kee_score_scaled / 8  # Distribute the score across features
-        
-        # Volatility impact (high volatility = increases risk)
-        if volatility_val > 0.5:
-            volatility_shap = base_impact * 1.5
-            volatility_effect = "↑ Increases Risk"
-            volatility_explain = "High volatility indicates unstable business"
-        elif volatility_val > 0.3:
-            volatility_shap = base_impact * 0.5
-            volatility_effect = "↑ Slight Risk Increase"
-            volatility_explain = "Moderate volatility shows some instability"
-        else:
-            volatility_shap = -base_impact * 0.8
-            volatility_effect = "↓ Reduces Risk"
-            volatility_explain = "Low volatility indicates stable business"
-        
-        # Days since last order (recent = reduces risk)
-        if days_since > 60:
-            days_shap = base_impact * 1.2
-            days_effect = "↑ Increases Risk"
-            days_explain = "Long gap since last order is concerning"
-        elif days_since > 30:
-            days_shap = base_impact * 0.3
-            days_effect = "↑ Slight Risk Increase"
-            days_explain = "Moderate gap shows reduced engagement"
-        else:
-            days_shap = -base_impact * 0.7
-            days_effect = "↓ Reduces Risk"
-            days_explain = "Recent activity shows engagement"
-        
-        # GMV Slope (positive growth = reduces risk)
-        if gmv_slope < -500:
-            gmv_slope_shap = base_impact * 1.3
-            gmv_slope_effect = "↑ Increases Risk"
-            gmv_slope_explain = "Negative growth trend is concerning"
-        elif gmv_slope < 0:
-            gmv_slope_shap = base_impact * 0.4
-            gmv_slope_effect = "↑ Slight Risk Increase"
-            gmv_slope_explain = "Declining trend shows weakness"
-        else:
-            gmv_slope_shap = -base_impact * 0.6
-            gmv_slope_effect = "↓ Reduces Risk"
-            gmv_slope_explain = "Positive growth trend is favorable"
-        
-        # Sales volume (high GMV = reduces risk)
-        if gmv_val > 100000:
-            sales_shap = -base_impact * 0.9
-            sales_effect = "↓ Reduces Risk"
-            sales_explain = "High sales volume reduces risk"
-        elif gmv_val > 50000:
-            sales_shap = -base_impact * 0.4
-            sales_effect = "↓ Slight Risk Reduction"
-            sales_explain = "Moderate sales provide some stability"
-        else:
-            sales_shap = base_impact * 0.6
-            sales_effect = "↑ Increases Risk"
-            sales_explain = "Low sales volume increases risk"
-        
-        # Consistency score (derived from volatility)
-        consistency_val = 1 - volatility_val
-        if consistency_val > 0.7:
-            consistency_shap = -base_impact * 0.5
-            consistency_effect = "↓ Reduces Risk"
-            consistency_explain = "Consistent behavior is positive"
-        elif consistency_val > 0.5:
-            consistency_shap = -base_impact * 0.2
-            consistency_effect = "↓ Slight Risk Reduction"
-            consistency_explain = "Moderate consistency is acceptable"
-        else:
-            consistency_shap = base_impact * 0.7
-            consistency_effect = "↑ Increases Risk"
-            consistency_explain = "Inconsistent behavior is concerning"
-        
-        # Active months (longer tenure = reduces risk)
-        if active_mons >= 12:
-            active_shap = -base_impact * 0.6
-            active_effect = "↓ Reduces Risk"
-            active_explain = "Long tenure indicates stability"
-        elif active_mons >= 6:
-            active_shap = -base_impact * 0.3
-            active_effect = "↓ Slight Risk Reduction"
-            active_explain = "Moderate tenure shows commitment"
-        else:
-            active_shap = base_impact * 0.5
-            active_effect = "↑ Increases Risk"
-            active_explain = "Short tenure increases uncertainty"
-        
-        # Order frequency
-        order_freq = cust_data['orders'] / max(active_mons, 1)
-        if order_freq > 20:
-            freq_shap = -base_impact * 0.4
-            freq_effect = "↓ Reduces Risk"
-            freq_explain = "Regular orders show reliability"
-        elif order_freq > 10:
-            freq_shap = -base_impact * 0.2
-            freq_effect = "↓ Slight Risk Reduction"
-            freq_explain = "Moderate order frequency is acceptable"
-        else:
-            freq_shap = base_impact * 0.4
-            freq_effect = "↑ Increases Risk"
-            freq_explain = "Low order frequency is concerning"
-        
-        # Recency score (inverse of days since)
-        recency_score = max(0, 1 - (days_since / 90))
-        if recency_score > 0.8:
-            recency_shap = -base_impact * 0.3
-            recency_effect = "↓ Reduces Risk"
-            recency_explain = "Recent transactions are positive"
-        elif recency_score > 0.5:
-            recency_shap = -base_impact * 0.1
-            recency_effect = "↓ Slight Risk Reduction"
-            recency_explain = "Moderate recency is acceptable"
-        else:
-            recency_shap = base_impact * 0.5
-            recency_effect = "↑ Increases Risk"
-            recency_explain = "Lack of recent activity is concerning"
-        
-        shap_data = pd.DataFrame({
-            "Feature": [
-                "Volatility",
-                "Days Since Last Order",
-                "GMV Slope (Growth)",
-                "Sales Last 12 Months",
-                "Consistency Score",
-                "Active Months",
-                "Order Frequency",
-                "Recency Score"
-            ],
-            "Value": [
-                f"{volatility_val:.2f}",
-                f"{days_since} days",
-                f"AED {gmv_slope:.1f}/month",
-                f"AED {gmv_val:,.0f}",
-                f"{consistency_val:.2f}",
-                f"{active_mons} months",
-                f"{order_freq:.1f}/month",
-                f"{recency_score:.2f}"
-            ],
-            "SHAP Impact": [
-                volatility_shap,
-                days_shap,
-                gmv_slope_shap,
-                sales_shap,
-                consistency_shap,
-                active_shap,
-                freq_shap,
-                recency_shap
-            ],
-            "Effect": [
-                volatility_effect,
-                days_effect,
-                gmv_slope_effect,
-                sales_effect,
-                consistency_effect,
-                active_effect,
-                freq_effect,
-                recency_effect
-            ],
-            "Explanation": [
-                volatility_explain,
-                days_explain,
-                gmv_slope_explain,
-                sales_explain,
-                consistency_explain,
-                active_explain,
-                freq_explain,
-                recency_explain
-            ]
+        # Contributions and the waterfall are memoized per (customer, data version)
+        shap_data = get_shap_contributions(customer_id, data_version, {
+            "volatility_val": volatility_val,
+            "days_since": days_since,
+            "gmv_slope": gmv_slope,
+            "active_mons": active_mons,
+            "gmv_val": gmv_val,
+            "orders": cust_data['orders'],
+            "kee_score_scaled": kee_score_scaled,
         })
         
         st.dataframe(shap_data, use_container_width=True, hide_index=True)
         
-        # # SHAP waterfall chart
-        # fig = go.Figure(go.Waterfall(
-        #     name="SHAP",
-        #     orientation="h",
-        #     y=shap_data["Feature"],
-        #     x=shap_data["SHAP Impact"],
-        #     connector={"line": {"color": "rgb(63, 63, 63)"}},
-        #     decreasing={"marker": {"color": "green"}},
-        #     increasing={"marker": {"color": "red"}},
-        # ))
-        # fig.update_layout(
-        #     title="SHAP Feature Contributions (Waterfall)",
-        #     xaxis_title="Impact on Kee Score (Positive = Increases Risk)",
-        #     height=400
-        # )
-        # st.plotly_chart(fig, use_container_width=True)
+        # SHAP waterfall chart
+        fig = cached_figure("shap_waterfall", lambda: build_shap_waterfall(shap_data),
+                            customer_id, data_version)
+        st.plotly_chart(fig, use_container_width=True)
 
         # # Loan Recommendations Section - Dynamic based on Risk Level
         # st.markdown("---")
@@ -1008,26 +1073,48 @@ def render_credit_officer_dashboard():
             st.dataframe(trans_data, use_container_width=True, hide_index=True)
         
         with col2:
-            # Monthly GMV trend
-            months = pd.date_range('2024-07-01', '2025-06-01', freq='M')
-            gmv = np.random.uniform(10000, 15000, len(months))
-            gmv = gmv + np.linspace(0, 3000, len(months))  # Add growth trend
+            # Monthly GMV trend from the pre-aggregated transaction rollup (one row slice)
+            rollup = get_current_rollup()
+            history = rollup.history(customer_id) if rollup is not None else None
+            if history is not None:
+                months, gmv = history['month'], history['gmv'].to_numpy()
+                orders, aov = history['orders'].to_numpy(), history['aov'].to_numpy()
+            else:
+                # No transactions on file: illustrative series, seeded per customer
+                months = pd.date_range('2024-07-01', '2025-06-01', freq='M')
+                gmv = customer_rng(customer_id, "gmv").uniform(10000, 15000, len(months))
+                gmv = gmv + np.linspace(0, 3000, len(months))  # Add growth trend
+                orders = aov = None
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=months, y=gmv,
-                mode='lines+markers',
-                name='Monthly GMV',
-                line=dict(color='#1f77b4', width=3),
-                fill='tozeroy'
-            ))
-            fig.update_layout(
-                title="Monthly GMV Trend",
-                xaxis_title="Month",
-                yaxis_title="GMV (AED)",
-                height=300
-            )
+            def build_gmv_trend():
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=months, y=gmv,
+                    mode='lines+markers',
+                    name='Monthly GMV',
+                    line=dict(color='#1f77b4', width=3),
+                    fill='tozeroy',
+                    customdata=None if orders is None else np.column_stack([orders, aov]),
+                    hovertemplate=None if orders is None else
+                        "%{x|%b %Y}<br>GMV: AED %{y:,.0f}<br>Orders: %{customdata[0]:,.0f}"
+                        "<br>AOV: AED %{customdata[1]:,.0f}<extra></extra>"
+                ))
+                fig.update_layout(
+                    title="Monthly GMV Trend",
+                    xaxis_title="Month",
+                    yaxis_title="GMV (AED)",
+                    height=300
+                )
+                return fig
+            
+            fig = cached_figure("co_gmv_trend", build_gmv_trend, months, gmv, orders, height=300)
             st.plotly_chart(fig, use_container_width=True)
+            if history is not None:
+                total_orders = int(orders.sum())
+                st.caption(f"Last {len(months)} months: AED {gmv.sum():,.0f} GMV from {total_orders:,} orders"
+                           f" (AOV AED {gmv.sum() / max(total_orders, 1):,.0f})")
+            else:
+                st.caption("Illustrative series - no transaction file found")
 
     
     # TAB 3: Bank Statement Analysis
@@ -1076,20 +1163,25 @@ def render_credit_officer_dashboard():
         with col2:
             # Income vs Expense trend
             months = pd.date_range('2024-12-01', '2025-06-01', freq='M')
-            income = np.random.uniform(17500, 19500, len(months))
-            expenses = np.random.uniform(11500, 13000, len(months))
+            rng = customer_rng(customer_id, "bank")
+            income = rng.uniform(17500, 19500, len(months))
+            expenses = rng.uniform(11500, 13000, len(months))
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=months, y=income, name='Income',
-                                    line=dict(color='green', width=2)))
-            fig.add_trace(go.Scatter(x=months, y=expenses, name='Expenses',
-                                    line=dict(color='red', width=2)))
-            fig.update_layout(
-                title="Income vs Expenses (Last 6 Months)",
-                xaxis_title="Month",
-                yaxis_title="Amount (AED)",
-                height=300
-            )
+            def build_income_expense():
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=months, y=income, name='Income',
+                                        line=dict(color='green', width=2)))
+                fig.add_trace(go.Scatter(x=months, y=expenses, name='Expenses',
+                                        line=dict(color='red', width=2)))
+                fig.update_layout(
+                    title="Income vs Expenses (Last 6 Months)",
+                    xaxis_title="Month",
+                    yaxis_title="Amount (AED)",
+                    height=300
+                )
+                return fig
+            
+            fig = cached_figure("co_income_expense", build_income_expense, months, income, expenses, height=300)
             st.plotly_chart(fig, use_container_width=True)
         
         # Expense breakdown
@@ -1100,10 +1192,14 @@ def render_credit_officer_dashboard():
             "Percentage": [36.6, 22.8, 12.2, 6.9, 9.8, 11.8]
         })
         
-        fig = px.pie(expense_categories, values="Amount", names="Category",
-                     title="Monthly Expense Distribution",
-                     color_discrete_sequence=px.colors.sequential.RdBu)
-        fig.update_layout(height=500)
+        def build_expense_pie():
+            fig = px.pie(expense_categories, values="Amount", names="Category",
+                         title="Monthly Expense Distribution",
+                         color_discrete_sequence=px.colors.sequential.RdBu)
+            fig.update_layout(height=500)
+            return fig
+        
+        fig = cached_figure("co_expense_pie", build_expense_pie, expense_categories, height=500)
         st.plotly_chart(fig, use_container_width=True)
 
     
@@ -1162,23 +1258,27 @@ def render_credit_officer_dashboard():
             months = pd.date_range('2024-07-01', '2025-06-01', freq='M')
             scores = [720, 725, 728, 730, 735, 738, 740, 742, 743, 744, 745]
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=months, y=scores,
-                mode='lines+markers',
-                name='Credit Score',
-                line=dict(color='#2ca02c', width=3),
-                fill='tozeroy'
-            ))
-            fig.add_hline(y=700, line_dash="dash", line_color="orange",
-                         annotation_text="Good Threshold")
-            fig.update_layout(
-                title="Credit Score Trend",
-                xaxis_title="Month",
-                yaxis_title="Score",
-                height=300,
-                yaxis_range=[650, 800]
-            )
+            def build_credit_score_trend():
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=months, y=scores,
+                    mode='lines+markers',
+                    name='Credit Score',
+                    line=dict(color='#2ca02c', width=3),
+                    fill='tozeroy'
+                ))
+                fig.add_hline(y=700, line_dash="dash", line_color="orange",
+                             annotation_text="Good Threshold")
+                fig.update_layout(
+                    title="Credit Score Trend",
+                    xaxis_title="Month",
+                    yaxis_title="Score",
+                    height=300,
+                    yaxis_range=[650, 800]
+                )
+                return fig
+            
+            fig = cached_figure("co_credit_score_trend", build_credit_score_trend, months, tuple(scores), height=300)
             st.plotly_chart(fig, use_container_width=True)
         
         # Active accounts
@@ -1245,18 +1345,22 @@ def render_credit_officer_dashboard():
             months = pd.date_range('2024-07-01', '2025-06-01', freq='M')
             bills = [650, 700, 750, 800, 900, 1100, 1250, 1150, 950, 850, 800]
             
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=months, y=bills,
-                name='Monthly Bill',
-                marker_color='#ff7f0e'
-            ))
-            fig.update_layout(
-                title="DEWA Bill History (Last 11 Months)",
-                xaxis_title="Month",
-                yaxis_title="Amount (AED)",
-                height=300
-            )
+            def build_dewa_bars():
+                fig = go.Figure()
+                fig.add_trace(go.Bar(
+                    x=months, y=bills,
+                    name='Monthly Bill',
+                    marker_color='#ff7f0e'
+                ))
+                fig.update_layout(
+                    title="DEWA Bill History (Last 11 Months)",
+                    xaxis_title="Month",
+                    yaxis_title="Amount (AED)",
+                    height=300
+                )
+                return fig
+            
+            fig = cached_figure("co_dewa_bars", build_dewa_bars, months, tuple(bills), height=300)
             st.plotly_chart(fig, use_container_width=True)
         
         # Payment history table
@@ -0,0 +1,124 @@
+"""
+Customer Comparison
+===================
+
+Side-by-side comparison of any number of customers. IDs are resolved
+through the store's ID index and every metric is gathered for all of them
+in one vectorized pass: Kee scores (30d/60d/90d), account value,
+volatility, GMV slope, active months, recommended credit limit, risk factor
+attributions and each customer's portfolio percentile per metric.
+
+The factor rules are the Customer Risk Dashboard's; they live here so the
+dashboards and the assistant score factors the same way.
+
+Usage:
+    from customer_compare import compare_customers
+    comparison = compare_customers(get_current_store(), [8697, 48, 53])
+    comparison.metrics          # DataFrame, one row per found customer
+    comparison.missing          # IDs not in the portfolio
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from customer_store import credit_limit
+
+
+COMPARE_COLUMNS = [
+    "risk_score_30d",
+    "risk_score_60d",
+    "risk_score_90d",
+    "account_value",
+    "volatility",
+    "gmv_slope",
+    "active_months",
+]
+
+# (column, [(test, label, impact, effect, status), ...]) - first matching test
+# wins, ``None`` is the fallback. Negative impact reduces risk.
+RISK_FACTOR_RULES = [
+    ("volatility", [
+        (lambda v: v < 0.3, "Low Volatility", -0.15, "Reduces Risk", "✅"),
+        (lambda v: v > 0.6, "High Volatility", 0.18, "Increases Risk", "🔴"),
+        (None, "Moderate Volatility", 0.08, "Neutral", "⚠️"),
+    ]),
+    ("account_value", [
+        (lambda v: v > 5000, "High Account Value", -0.12, "Reduces Risk", "✅"),
+        (lambda v: v > 1000, "Moderate Account Value", -0.05, "Reduces Risk", "✅"),
+        (None, "Low Account Value", 0.10, "Increases Risk", "⚠️"),
+    ]),
+    ("days_since_last_order", [
+        (lambda v: v < 30, "Recent Activity", -0.08, "Reduces Risk", "✅"),
+        (lambda v: v < 90, "Moderate Activity", 0.05, "Neutral", "⚠️"),
+        (None, "Inactive Customer", 0.15, "Increases Risk", "🔴"),
+    ]),
+    ("gmv_slope", [
+        (lambda v: v > 100, "Positive Growth", -0.10, "Reduces Risk", "✅"),
+        (lambda v: v > 0, "Stable Growth", -0.03, "Reduces Risk", "✅"),
+        (None, "Declining Trend", 0.12, "Increases Risk", "🔴"),
+    ]),
+    ("active_months", [
+        (lambda v: v > 18, "High Tenure", -0.06, "Reduces Risk", "✅"),
+        (lambda v: v > 6, "Moderate Tenure", -0.02, "Reduces Risk", "✅"),
+        (None, "Low Tenure", 0.08, "Increases Risk", "⚠️"),
+    ]),
+]
+
+FACTOR_COLUMNS = [column for column, _ in RISK_FACTOR_RULES]
+
+
+Comparison = namedtuple("Comparison", "ids rows missing metrics factors")
+
+
+def factor_choices(column, values):
+    """Index of the matching rule in ``column``'s rule list, per value"""
+    rules = dict(RISK_FACTOR_RULES)[column]
+    values = np.asarray(values, dtype=np.float64)
+    tests = [test(values) for test, *_ in rules if test is not None]
+    return np.select(tests, np.arange(len(tests)), default=len(rules) - 1)
+
+
+def risk_factors(values):
+    """Factor attributions for customers given ``values[column]`` arrays
+
+    Returns a DataFrame with one row per (customer, factor): position,
+    column, Feature, Impact, Effect and Status.
+    """
+    frames = []
+    for column, rules in RISK_FACTOR_RULES:
+        choice = factor_choices(column, values[column])
+        table = np.array([rule[1:] for rule in rules], dtype=object)
+        frames.append(pd.DataFrame({
+            "position": np.arange(len(choice)),
+            "column": column,
+            "Feature": table[choice, 0],
+            "Impact": table[choice, 1].astype(np.float64),
+            "Effect": table[choice, 2],
+            "Status": table[choice, 3],
+        }))
+    return pd.concat(frames, ignore_index=True).sort_values("position", kind="stable", ignore_index=True)
+
+
+def compare_customers(store, customer_ids):
+    """Gather metrics, credit limits, factors and percentiles for ``customer_ids``"""
+    ids = [int(c) for c in dict.fromkeys(customer_ids)]
+    rows = store.rows(ids)
+    found = rows >= 0
+    rows = rows[found]
+    found_ids = [cid for cid, ok in zip(ids, found) if ok]
+    missing = [cid for cid, ok in zip(ids, found) if not ok]
+
+    gathered = {col: store.column(col)[rows] for col in set(COMPARE_COLUMNS) | set(FACTOR_COLUMNS)}
+    metrics = pd.DataFrame({"customer_id": found_ids, "customer_name": store.names[rows]})
+    for col in COMPARE_COLUMNS:
+        metrics[col] = gathered[col]
+        metrics[f"{col}_pct"] = store.percentile(col, gathered[col])
+    metrics["credit_limit"] = credit_limit(gathered["risk_score_30d"], gathered["account_value"])
+
+    factors = risk_factors(gathered)
+    metrics["factor_impact"] = factors.groupby("position")["Impact"].sum().reindex(
+        range(len(rows)), fill_value=0.0).to_numpy()
+    factors.insert(0, "customer_id", np.asarray(found_ids, dtype=np.int64)[factors["position"].to_numpy()])
+    return Comparison(found_ids, rows, missing, metrics, factors.drop(columns="position"))
@@ -0,0 +1,76 @@
+"""
+Customer Data Loading
+=====================
+
+Shared, lightweight helpers for locating and loading the customer files.
+Kept free of plotly and other heavy imports so any page can use it.
+"""
+
+import os
+
+import streamlit as st
+import pandas as pd
+
+from metrics import timed
+
+
+# Point the app (or benchmarks) at another customer file, e.g. a synthetic one
+DATA_ENV_VAR = "KEE_DASHBOARD_DATA"
+CONEKTR_ENV_VAR = "KEE_CONEKTR_DATA"
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Try multiple possible paths for the CSV files
+DASHBOARD_PATHS = [
+    'dashboard_data.csv',  # Current directory
+    os.path.join(SCRIPT_DIR, 'dashboard_data.csv'),  # Script directory
+    os.path.join(SCRIPT_DIR, '..', 'dashboard_data.csv'),  # Parent directory
+]
+
+CONEKTR_PATHS = [
+    'data/conektr_data.csv',  # Current directory
+    os.path.join(SCRIPT_DIR, 'data', 'conektr_data.csv'),  # Script directory
+    os.path.join(SCRIPT_DIR, '..', 'data', 'conektr_data.csv'),  # Parent directory
+]
+
+
+def find_dashboard_data():
+    """Return the first existing dashboard_data.csv path, or None"""
+    override = os.environ.get(DATA_ENV_VAR)
+    if override:
+        return override if os.path.exists(override) else None
+    for path in DASHBOARD_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def find_conektr_data():
+    """Return the first existing conektr transaction file path, or None"""
+    override = os.environ.get(CONEKTR_ENV_VAR)
+    if override:
+        return override if os.path.exists(override) else None
+    for path in CONEKTR_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def get_data_version(path):
+    """Fingerprint of a data file (mtime + size) used to key cached results"""
+    if path is None:
+        return "missing"
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+# Load real customer data
+@st.cache_data
+def load_customer_data():
+    """Load real customer data from CSV file"""
+    try:
+        with timed("data_load_seconds", source="dashboard_data"):
+            df = pd.read_csv(find_dashboard_data())
+        return df
+    except:
+        return None
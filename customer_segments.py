@@ -0,0 +1,103 @@
+"""
+Customer Segments
+=================
+
+Assigns every customer to exactly one segment with vectorized rules over
+risk_score_30d, account_value and days_since_last_order (first matching
+rule wins, so inactivity overrides the score-based segments):
+
+    Inactive            no order in more than 90 days
+    Premium Low-Risk    Kee score < 0.3 and account value >= AED 50K
+    Standard Low-Risk   Kee score < 0.3
+    Medium Risk         Kee score < 0.7
+    High Risk           everything else
+
+Membership is stored once per data version as ascending row-id arrays
+(plus a bitmap per segment for combining with the store's other
+indexes), together with counts, exposure and averages, so the Customer
+Segments view and its drill-down never recompute on rerun.
+
+Usage:
+    segmentation = get_segmentation(store.data_version, store)
+    segmentation.summary              # DataFrame, one row per segment
+    segmentation.members["Inactive"]  # row positions
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from bitmap_index import Bitmap
+from customer_store import (
+    HIGH_RISK_MIN, INACTIVE_DAYS, LOW_RISK_MAX, PREMIUM_ACCOUNT_VALUE, get_customer_store
+)
+from metrics import timed
+
+
+# name -> recommended action, in rule order
+SEGMENTS = {
+    "Inactive": "Re-engage",
+    "Premium Low-Risk": "Expand Credit",
+    "Standard Low-Risk": "Maintain",
+    "Medium Risk": "Monitor Closely",
+    "High Risk": "Restrict Credit",
+}
+SEGMENT_NAMES = list(SEGMENTS)
+
+Segmentation = namedtuple("Segmentation", "codes members bitmaps summary")
+
+
+def assign_segments(risk, account, days_inactive):
+    """Segment code (index into SEGMENT_NAMES) per customer"""
+    risk = np.asarray(risk, dtype=np.float64)
+    account = np.asarray(account, dtype=np.float64)
+    days_inactive = np.asarray(days_inactive, dtype=np.float64)
+    low_risk = risk < LOW_RISK_MAX
+    return np.select(
+        [days_inactive > INACTIVE_DAYS,
+         low_risk & (account >= PREMIUM_ACCOUNT_VALUE),
+         low_risk,
+         risk < HIGH_RISK_MIN],
+        [0, 1, 2, 3],
+        default=4,
+    ).astype(np.int8)
+
+
+def build_segmentation(store):
+    """Segment codes, row-id membership, bitmaps and summary for one store"""
+    risk = store.column("risk_score_30d")
+    account = store.column("account_value")
+    codes = assign_segments(risk, account, store.column("days_since_last_order"))
+
+    # One stable sort groups the rows by segment, each group in row order
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes, minlength=len(SEGMENT_NAMES))
+    groups = np.split(order, np.cumsum(counts)[:-1])
+    members = dict(zip(SEGMENT_NAMES, groups))
+    bitmaps = {name: Bitmap.from_rows(rows, store.size) for name, rows in members.items()}
+
+    total_exposure = account.sum()
+    exposure = np.bincount(codes, weights=account, minlength=len(SEGMENT_NAMES))
+    risk_sum = np.bincount(codes, weights=risk, minlength=len(SEGMENT_NAMES))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        summary = pd.DataFrame({
+            "Segment": SEGMENT_NAMES,
+            "Count": counts,
+            "Share": counts / max(store.size, 1),
+            "Exposure": exposure,
+            "Exposure Share": exposure / total_exposure if total_exposure else 0.0,
+            "Avg Account Value": exposure / counts,
+            "Avg Kee Score": risk_sum / counts,
+            "Recommended Action": list(SEGMENTS.values()),
+        })
+    return Segmentation(codes, members, bitmaps, summary)
+
+
+@st.cache_resource(max_entries=2)
+def get_segmentation(data_version, _store=None):
+    """Segmentation for one data version (shared by all sessions)"""
+    store = _store if _store is not None else get_customer_store(data_version)
+    with timed("segmentation_build_seconds"):
+        return build_segmentation(store)
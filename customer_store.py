@@ -0,0 +1,173 @@
+"""
+Customer Store
+==============
+
+Column-oriented, read-only view of the customer file built once per data
+version and shared by every session. Numeric columns are held as NumPy
+arrays and customer IDs are indexed (sorted IDs + permutation), so lookups
+and filters are vectorized instead of scanning a DataFrame per rerun.
+Portfolio percentiles come from mergeable KLL sketches (quantile_sketch)
+built per chunk, so a lookup is a binary search over a few hundred items.
+Risk band, intervention status, inactivity and zero account value are
+held as packed bitmaps (bitmap_index), and each numeric column has a
+sorted range index (argsort permutation) so range predicates are two
+binary searches; query_planner combines both.
+
+Usage:
+    store = get_current_store()
+    rows = store.rows([48, 53])          # row positions, -1 if unknown
+    store.column("account_value")[rows]
+    store.percentile("risk_score_30d", [0.42])   # share of portfolio at or below
+    (store.bitmaps.get("risk_level", "High") & store.bitmaps.get("inactive")).count()
+    store.range_rows("account_value", low=50_000, low_inclusive=False)
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from customer_data import find_dashboard_data, get_data_version
+from bitmap_index import BitmapIndex
+from metrics import timed
+from quantile_sketch import build_sketches
+
+
+NUMERIC_COLUMNS = [
+    "risk_score_30d",
+    "risk_score_60d",
+    "risk_score_90d",
+    "account_value",
+    "days_since_last_order",
+    "active_months",
+    "volatility",
+    "gmv_slope",
+]
+
+# Business thresholds shared by the assistant, segments and dashboards
+LOW_RISK_MAX = 0.3
+HIGH_RISK_MIN = 0.7
+PREMIUM_ACCOUNT_VALUE = 50_000
+INACTIVE_DAYS = 90
+
+# Columns with portfolio-percentile sketches, built per ingestion chunk and merged
+SKETCH_COLUMNS = [
+    "risk_score_30d",
+    "risk_score_60d",
+    "risk_score_90d",
+    "account_value",
+    "volatility",
+    "gmv_slope",
+    "active_months",
+]
+SKETCH_CHUNK_ROWS = 100_000
+
+
+def credit_limit(risk_scores, account_values):
+    """Recommended credit limit (AED) per customer from Kee score and account value"""
+    risk_scores = np.asarray(risk_scores, dtype=np.float64)
+    account_values = np.asarray(account_values, dtype=np.float64)
+    return np.select(
+        [risk_scores < LOW_RISK_MAX, risk_scores < 0.5, risk_scores < HIGH_RISK_MIN],
+        [np.minimum(account_values * 2, 250_000),
+         np.minimum(account_values * 1.5, 150_000),
+         np.minimum(account_values, 75_000)],
+        default=np.minimum(account_values * 0.5, 25_000),
+    )
+
+
+class CustomerStore:
+    """Customer table as NumPy columns with an ID index"""
+
+    def __init__(self, df, data_version="memory"):
+        self.data_version = data_version
+        self.df = df.reset_index(drop=True)
+        self.size = len(self.df)
+
+        self._columns = {
+            col: self.df[col].to_numpy(dtype=np.float64)
+            for col in NUMERIC_COLUMNS if col in self.df.columns
+        }
+        self.ids = self.df["customer_id"].to_numpy(dtype=np.int64)
+        self.names = self.df["customer_name"].astype(str).to_numpy() if "customer_name" in self.df.columns \
+            else self.ids.astype(str)
+        self.risk_level = self.df["risk_level_30d"].astype(str).to_numpy() if "risk_level_30d" in self.df.columns \
+            else np.full(self.size, "", dtype=object)
+
+        self.bitmaps = self._build_bitmaps()
+
+        # Sorted range index per numeric column: (permutation, sorted values)
+        order_dtype = np.int32 if self.size < 2 ** 31 else np.int64
+        self._ranges = {}
+        for col, values in self._columns.items():
+            order = np.argsort(values, kind="stable").astype(order_dtype)
+            self._ranges[col] = (order, values[order])
+
+        self._id_order = np.argsort(self.ids, kind="stable")
+        self._sorted_ids = self.ids[self._id_order]
+
+        self.sketches = build_sketches(
+            {col: self._columns[col] for col in SKETCH_COLUMNS if col in self._columns},
+            chunk_rows=SKETCH_CHUNK_ROWS,
+        )
+
+    def column(self, name):
+        """NumPy array for a numeric column (shared - do not modify)"""
+        return self._columns[name]
+
+    def _build_bitmaps(self):
+        """Bitmap index over risk band, intervention status and activity/value flags"""
+        index = BitmapIndex(self.size)
+        index.add_categories("risk_level", self.risk_level)
+        if "intervention_status" in self.df.columns:
+            index.add_categories("intervention_status", self.df["intervention_status"].to_numpy(dtype=object))
+        if "days_since_last_order" in self._columns:
+            index.add("inactive", self._columns["days_since_last_order"] > INACTIVE_DAYS)
+        if "account_value" in self._columns:
+            index.add("zero_value", self._columns["account_value"] == 0)
+        return index
+
+    def percentile(self, name, values):
+        """Portfolio percentile (0-100, share at or below) of ``values`` in a column"""
+        sketch = self.sketches.get(name)
+        if sketch is None:
+            return np.full(np.shape(values), np.nan)
+        return sketch.rank(values) * 100
+
+    def range_rows(self, name, low=-np.inf, high=np.inf, low_inclusive=True, high_inclusive=True):
+        """Row positions (unordered) with ``low <= value <= high`` via the range index"""
+        order, sorted_values = self._ranges[name]
+        start = np.searchsorted(sorted_values, low, side="left" if low_inclusive else "right")
+        stop = np.searchsorted(sorted_values, high, side="right" if high_inclusive else "left")
+        return order[start:max(start, stop)]
+
+    def rows(self, customer_ids):
+        """Row positions for a list of customer IDs (-1 where not found)"""
+        ids = np.asarray([int(c) for c in customer_ids], dtype=np.int64)
+        if self.size == 0:
+            return np.full(len(ids), -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self._sorted_ids, ids), self.size - 1)
+        return np.where(self._sorted_ids[pos] == ids, self._id_order[pos], -1)
+
+    def row(self, customer_id):
+        """Row position for one customer ID, or None"""
+        pos = int(self.rows([customer_id])[0])
+        return None if pos < 0 else pos
+
+    def frame(self, rows, columns=None):
+        """DataFrame slice for the given row positions"""
+        out = self.df.iloc[np.asarray(rows, dtype=np.int64)]
+        return out[columns] if columns is not None else out
+
+
+@st.cache_resource(max_entries=2)
+def get_customer_store(data_version):
+    """Build the store for one version of the customer file (shared by all sessions)"""
+    path = find_dashboard_data()
+    with timed("data_load_seconds", source="customer_store"):
+        df = pd.read_csv(path) if path is not None else pd.DataFrame(columns=["customer_id"])
+    return CustomerStore(df, data_version)
+
+
+def get_current_store():
+    """Store for the customer file currently on disk"""
+    return get_customer_store(get_data_version(find_dashboard_data()))
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Early-Warning Scanner
+=====================
+
+Diffs today's customer file against the previous snapshot and writes a
+compact alert table for the dashboards. Both files are read with only the
+columns the rules need, joined on customer_id with one sort + binary
+search, and every rule is a vectorized comparison, so millions of
+customers scan in seconds.
+
+Alerts (one row per customer and alert type):
+    band_crossing    risk band worsened (Low -> Medium/High, Medium -> High)
+    score_jump       risk_score_30d rose by at least 0.2
+    new_inactive     crossed 90 days without an order since the last snapshot
+    new_high_risk    customer not in the previous snapshot, already High risk
+
+    python early_warning.py                         # dashboard_data.csv vs last snapshot
+    python early_warning.py --previous old.csv --current new.csv --no-rotate
+
+After a scan the current file becomes the previous snapshot (unless
+--no-rotate). The first run only records the snapshot.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from customer_data import SCRIPT_DIR, find_dashboard_data, get_data_version
+from customer_store import HIGH_RISK_MIN, INACTIVE_DAYS, LOW_RISK_MAX
+
+
+ALERTS_FILE = os.path.join(SCRIPT_DIR, "alerts", "early_warning.csv")
+PREVIOUS_SNAPSHOT = os.path.join(SCRIPT_DIR, "alerts", "previous_snapshot.csv")
+
+SCAN_COLUMNS = ["customer_id", "customer_name", "risk_score_30d", "account_value", "days_since_last_order"]
+SCORE_JUMP = 0.2
+BANDS = np.array(["Low", "Medium", "High"])
+SEVERITY_ORDER = {"high": 0, "medium": 1}
+ALERT_LABELS = {
+    "band_crossing": "Band Crossing",
+    "score_jump": "Score Jump",
+    "new_inactive": "Newly Inactive",
+    "new_high_risk": "New High-Risk",
+}
+ALERT_COLUMNS = ["customer_id", "customer_name", "alert", "severity", "previous", "current",
+                 "change", "account_value", "detected_at"]
+
+
+def band_codes(scores):
+    """0 = Low, 1 = Medium, 2 = High (the dashboards' 0.3 / 0.7 cut-offs)"""
+    scores = np.asarray(scores, dtype=np.float64)
+    return (scores >= LOW_RISK_MAX).astype(np.int8) + (scores >= HIGH_RISK_MIN).astype(np.int8)
+
+
+def read_snapshot(path):
+    """Columns needed for the scan, with compact dtypes"""
+    return pd.read_csv(path, usecols=SCAN_COLUMNS, dtype={
+        "customer_id": np.int64, "customer_name": object, "risk_score_30d": np.float64,
+        "account_value": np.float64, "days_since_last_order": np.float64,
+    })
+
+
+def join_on_id(previous_ids, current_ids):
+    """(current positions, previous positions) of customers present in both"""
+    order = np.argsort(previous_ids, kind="stable")
+    sorted_ids = previous_ids[order]
+    pos = np.searchsorted(sorted_ids, current_ids)
+    pos = np.minimum(pos, max(len(sorted_ids) - 1, 0))
+    found = (sorted_ids[pos] == current_ids) if len(sorted_ids) else np.zeros(len(current_ids), dtype=bool)
+    return np.flatnonzero(found), order[pos[found]]
+
+
+def scan(previous, current, detected_at=None):
+    """Alert table for two snapshots (DataFrames with SCAN_COLUMNS)"""
+    detected_at = detected_at or datetime.now().strftime("%Y-%m-%d")
+    cur_idx, prev_idx = join_on_id(previous["customer_id"].to_numpy(), current["customer_id"].to_numpy())
+
+    def pick(frame, col, idx):
+        return frame[col].to_numpy()[idx]
+
+    prev_score, cur_score = pick(previous, "risk_score_30d", prev_idx), pick(current, "risk_score_30d", cur_idx)
+    prev_band, cur_band = band_codes(prev_score), band_codes(cur_score)
+    prev_days = pick(previous, "days_since_last_order", prev_idx)
+    cur_days = pick(current, "days_since_last_order", cur_idx)
+
+    frames = []
+
+    def add(alert, mask, severity, prev_values, cur_values, rows=cur_idx):
+        if not mask.any():
+            return
+        selected = rows[mask]
+        if prev_values.dtype.kind == "f":
+            prev_values, cur_values = np.round(prev_values, 4), np.round(cur_values, 4)
+        frames.append(pd.DataFrame({
+            "customer_id": current["customer_id"].to_numpy()[selected],
+            "customer_name": current["customer_name"].to_numpy()[selected],
+            "alert": alert,
+            "severity": severity[mask] if isinstance(severity, np.ndarray) else severity,
+            "previous": prev_values[mask],
+            "current": cur_values[mask],
+            "change": (cur_values[mask] - prev_values[mask]) if prev_values.dtype.kind == "f"
+                      else np.full(int(mask.sum()), np.nan),
+            "account_value": current["account_value"].to_numpy()[selected],
+        }))
+
+    crossed = cur_band > prev_band
+    add("band_crossing", crossed, np.where(cur_band == 2, "high", "medium"),
+        BANDS[prev_band].astype(object), BANDS[cur_band].astype(object))
+    jump = cur_score - prev_score >= SCORE_JUMP
+    add("score_jump", jump, np.where(cur_score >= HIGH_RISK_MIN, "high", "medium"), prev_score, cur_score)
+    inactive = (prev_days <= INACTIVE_DAYS) & (cur_days > INACTIVE_DAYS)
+    add("new_inactive", inactive, "medium", prev_days, cur_days)
+
+    new_rows = np.setdiff1d(np.arange(len(current)), cur_idx, assume_unique=True)
+    new_scores = current["risk_score_30d"].to_numpy()[new_rows]
+    new_high = new_scores >= HIGH_RISK_MIN
+    add("new_high_risk", new_high, "high", np.full(len(new_rows), np.nan), new_scores, rows=new_rows)
+
+    if not frames:
+        return pd.DataFrame(columns=ALERT_COLUMNS)
+    alerts = pd.concat(frames, ignore_index=True)
+    alerts["detected_at"] = detected_at
+    alerts["_severity"] = alerts["severity"].map(SEVERITY_ORDER)
+    alerts = alerts.sort_values(["_severity", "account_value"], ascending=[True, False], kind="stable")
+    return alerts.drop(columns="_severity").reset_index(drop=True)[ALERT_COLUMNS]
+
+
+def run_scan(current_path=None, previous_path=PREVIOUS_SNAPSHOT, output=ALERTS_FILE, rotate=True):
+    """Scan ``current_path`` against ``previous_path``; write alerts; return a summary"""
+    current_path = current_path or find_dashboard_data()
+    if current_path is None:
+        raise FileNotFoundError("dashboard_data.csv not found in any expected location")
+
+    summary = {"current": current_path, "previous": previous_path, "alerts": 0, "by_alert": {}}
+    start = time.perf_counter()
+    current = read_snapshot(current_path)
+    summary["customers"] = len(current)
+    if os.path.exists(previous_path):
+        alerts = scan(read_snapshot(previous_path), current)
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        alerts.to_csv(output, index=False)
+        summary["alerts"] = len(alerts)
+        summary["by_alert"] = alerts["alert"].value_counts().to_dict()
+        summary["output"] = output
+    else:
+        summary["previous"] = None
+    summary["seconds"] = time.perf_counter() - start
+
+    if rotate and os.path.abspath(current_path) != os.path.abspath(previous_path):
+        os.makedirs(os.path.dirname(os.path.abspath(previous_path)), exist_ok=True)
+        shutil.copyfile(current_path, previous_path)
+    return summary
+
+
+@st.cache_data
+def load_alerts(data_version):
+    """Latest alert table (``data_version`` keys the cache to the file)"""
+    if data_version == "missing":
+        return None
+    return pd.read_csv(ALERTS_FILE)
+
+
+def get_alerts():
+    """Alert table for the file currently on disk, or None if no scan has run"""
+    path = ALERTS_FILE if os.path.exists(ALERTS_FILE) else None
+    return load_alerts(get_data_version(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Early-warning scan between customer snapshots")
+    parser.add_argument("--current", help="Today's customer file (default: dashboard_data.csv)")
+    parser.add_argument("--previous", default=PREVIOUS_SNAPSHOT, help="Previous snapshot")
+    parser.add_argument("-o", "--output", default=ALERTS_FILE)
+    parser.add_argument("--no-rotate", action="store_true", help="Keep the previous snapshot as is")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🚨 Early-Warning Scan")
+    print("=" * 60)
+    summary = run_scan(args.current, args.previous, args.output, rotate=not args.no_rotate)
+    if summary["previous"] is None:
+        print(f"📸 No previous snapshot; recorded {summary['customers']:,} customers for the next scan")
+        return 0
+    print(f"✅ Scanned {summary['customers']:,} customers in {summary['seconds']:.2f}s")
+    for alert, count in summary["by_alert"].items():
+        print(f"   ⚠️ {alert}: {count:,}")
+    print(f"📝 {summary['alerts']:,} alerts -> {summary['output']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
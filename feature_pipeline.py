@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Feature Pipeline
+================
+
+Recomputes the transaction-derived customer features in dashboard_data.csv
+from conektr-style order lines:
+
+    volatility              coefficient of variation (std / mean) of monthly GMV
+                            over the 12 months ending at the as-of month
+    gmv_slope               least-squares slope of those monthly GMV sums (AED per month)
+    days_since_last_order   days from the latest order to the as-of date
+    active_months           distinct months with at least one order
+
+Only orders up to the as-of date count: a back-dated full run leaves out
+later order lines, and an incremental run rejects new lines dated after
+its as-of date (they would otherwise be folded into the stored totals).
+
+Order lines are reduced to (customer, month) totals in one chunked pass
+over the ingested columns (shared with gmv_rollup), scattered into a customer x month matrix, and
+every feature is a row-wise array operation on that matrix - no Python
+loop over customers.
+
+The monthly totals are kept in features/state.npz. An incremental run
+reads only the new order lines, re-aggregates and recomputes the customers
+that appear in them, and shifts days_since_last_order for everyone else by
+the elapsed days. If the as-of month has moved, the 12-month window moves
+for every customer, so the matrix features are recomputed from the stored
+totals (still without re-reading old transactions).
+
+    python feature_pipeline.py --transactions data/conektr_data.csv
+    python feature_pipeline.py --transactions new_orders.csv --incremental
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from customer_data import SCRIPT_DIR, find_conektr_data
+from gmv_rollup import ROLLUP_CHUNK_ROWS, merge_totals, monthly_matrix, monthly_totals, transaction_totals
+
+
+FEATURE_COLUMNS = ["volatility", "gmv_slope", "days_since_last_order", "active_months"]
+FEATURE_MONTHS = 12
+FEATURE_DIR = os.path.join(SCRIPT_DIR, "features")
+STATE_FILE = os.path.join(FEATURE_DIR, "state.npz")
+FEATURES_FILE = os.path.join(FEATURE_DIR, "customer_features.csv")
+TOTAL_COLUMNS = ["customer_id", "month", "gmv", "orders", "last_order"]
+
+
+def as_of_day(as_of):
+    """Days since 1970-01-01 for a date"""
+    return int(np.datetime64(as_of, "D").astype(np.int64))
+
+
+def as_of_month(as_of):
+    return as_of.year * 12 + as_of.month - 1
+
+
+def compute_features(totals, as_of, months=FEATURE_MONTHS):
+    """Feature table (customer_id + FEATURE_COLUMNS) from monthly totals, one row per customer
+
+    Months after the as-of month are ignored. Totals for the as-of month
+    itself cannot be split by day, so they must not include later orders.
+    """
+    totals = totals[totals["month"].to_numpy() <= as_of_month(as_of)]
+    if len(totals) and int(totals["last_order"].max()) > as_of_day(as_of):
+        raise ValueError(f"totals include orders after the as-of date {as_of}")
+    ids, gmv, _ = monthly_matrix(totals, as_of_month(as_of), months)
+
+    mean = gmv.mean(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        volatility = np.where(mean > 0, gmv.std(axis=1) / mean, 0.0)
+    x = np.arange(months) - (months - 1) / 2
+    slope = gmv @ x / (x @ x)
+
+    # Totals are sorted by customer, one row per (customer, month)
+    customer_ids = totals["customer_id"].to_numpy()
+    starts = np.flatnonzero(np.diff(customer_ids, prepend=customer_ids[:1] - 1))
+    last_order = totals["last_order"].to_numpy()
+    last_order = np.maximum.reduceat(last_order, starts) if len(starts) else last_order[:0]
+    return pd.DataFrame({
+        "customer_id": ids,
+        "volatility": volatility,
+        "gmv_slope": slope,
+        "days_since_last_order": as_of_day(as_of) - last_order,
+        "active_months": np.diff(np.r_[starts, len(totals)]),
+    })
+
+
+def save_state(totals, features, as_of, path=STATE_FILE):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    np.savez(path, as_of=np.datetime64(as_of, "D"),
+             **{f"totals_{c}": totals[c].to_numpy() for c in TOTAL_COLUMNS},
+             **{f"features_{c}": features[c].to_numpy() for c in ["customer_id", *FEATURE_COLUMNS]})
+
+
+def load_state(path=STATE_FILE):
+    """(totals, features, as_of) from a previous run"""
+    with np.load(path) as state:
+        totals = pd.DataFrame({c: state[f"totals_{c}"] for c in TOTAL_COLUMNS})
+        features = pd.DataFrame({c: state[f"features_{c}"] for c in ["customer_id", *FEATURE_COLUMNS]})
+        as_of = state["as_of"].item()
+    return totals, features, as_of
+
+
+def run_full(transactions, as_of, chunk_rows=ROLLUP_CHUNK_ROWS):
+    """Features for every customer from the full transaction file (orders up to ``as_of``)"""
+    totals = transaction_totals(transactions, chunk_rows, until=as_of)
+    return totals, compute_features(totals, as_of)
+
+
+def run_incremental(new_transactions, as_of, totals, features, previous_as_of, chunk_rows=ROLLUP_CHUNK_ROWS):
+    """Fold new order lines into the stored totals; recompute only what changed
+
+    Returns (totals, features, number of customers recomputed).
+    """
+    if as_of < previous_as_of:
+        raise ValueError(f"as-of date {as_of} is before the previous run ({previous_as_of})")
+    new = monthly_totals(new_transactions, chunk_rows)
+    if len(new) and int(new["last_order"].max()) > as_of_day(as_of):
+        raise ValueError(f"new order lines are dated after the as-of date {as_of}")
+    affected = np.unique(new["customer_id"].to_numpy())
+    touched = np.isin(totals["customer_id"].to_numpy(), affected)
+    changed = merge_totals(pd.concat([totals[touched], new], ignore_index=True))
+    totals = pd.concat([totals[~touched], changed], ignore_index=True).sort_values(
+        ["customer_id", "month"], kind="stable", ignore_index=True)
+
+    if as_of_month(as_of) != as_of_month(previous_as_of):
+        features = compute_features(totals, as_of)
+        return totals, features, len(features)
+
+    # Same window: everyone else only ages by the elapsed days
+    features = features.copy()
+    features["days_since_last_order"] += as_of_day(as_of) - as_of_day(previous_as_of)
+    recomputed = compute_features(totals[np.isin(totals["customer_id"].to_numpy(), affected)], as_of)
+    features = pd.concat([features[~np.isin(features["customer_id"].to_numpy(), affected)], recomputed],
+                         ignore_index=True).sort_values("customer_id", kind="stable", ignore_index=True)
+    return totals, features, len(affected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute customer features from transactions")
+    parser.add_argument("--transactions", help="Order lines (default: the conektr file)")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today(), help="YYYY-MM-DD (default: today)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Transactions are new order lines since the last run")
+    parser.add_argument("-o", "--output", default=FEATURES_FILE)
+    parser.add_argument("--state", default=STATE_FILE)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧮 Customer Feature Pipeline")
+    print("=" * 60)
+    transactions = args.transactions or find_conektr_data()
+    if transactions is None:
+        print("❌ No transaction file found (set KEE_CONEKTR_DATA or pass --transactions)")
+        return 1
+
+    start = time.perf_counter()
+    if args.incremental:
+        if not os.path.exists(args.state):
+            print(f"❌ No state at {args.state}; run once without --incremental first")
+            return 1
+        totals, features, previous_as_of = load_state(args.state)
+        try:
+            totals, features, recomputed = run_incremental(transactions, args.as_of, totals, features,
+                                                           previous_as_of)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        print(f"✅ Incremental run: {recomputed:,} of {len(features):,} customers recomputed")
+    else:
+        totals, features = run_full(transactions, args.as_of)
+        print(f"✅ Full run: {len(features):,} customers")
+    save_state(totals, features, args.as_of, args.state)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    features.to_csv(args.output, index=False)
+    print(f"⏱️ {time.perf_counter() - start:.2f}s (as of {args.as_of})")
+    print(f"📝 Features -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Plotly Figure Cache
+===================
+
+Memoizes Plotly figures as serialized JSON, keyed on a fingerprint of the
+chart's input data and layout parameters. The cache is process-wide (shared
+by every session) with LRU eviction and hit/miss counters, so charts whose
+inputs do not change between reruns are only built once.
+
+Usage:
+    fig = cached_figure("segment_pie", lambda: px.pie(df, ...), df, height=500)
+    st.plotly_chart(fig, use_container_width=True)
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+import streamlit as st
+
+from metrics import get_registry, timed
+
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+def fingerprint(*parts, **params):
+    """Stable hash of chart inputs (DataFrames, arrays, scalars) and layout params"""
+    h = hashlib.blake2b(digest_size=16)
+    for part in list(parts) + sorted(params.items()):
+        if isinstance(part, (pd.DataFrame, pd.Series, pd.Index)):
+            h.update(repr(part.columns if isinstance(part, pd.DataFrame) else part.name).encode())
+            h.update(pd.util.hash_pandas_object(part, index=True).values.tobytes())
+        elif isinstance(part, np.ndarray):
+            h.update(str(part.dtype).encode())
+            h.update(repr(part.shape).encode())
+            h.update(np.ascontiguousarray(part).tobytes())
+        elif isinstance(part, tuple) and any(isinstance(p, (pd.DataFrame, pd.Series, np.ndarray)) for p in part):
+            h.update(fingerprint(*part).encode())
+        else:
+            h.update(repr(part).encode())
+        h.update(b"|")
+    return h.hexdigest()
+
+
+class FigureCache:
+    """Thread-safe LRU of serialized figures with hit/miss counters"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_json(self, key, build):
+        """Return the figure JSON for ``key``, calling ``build()`` on a miss"""
+        with self._lock:
+            fig_json = self._entries.get(key)
+            if fig_json is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                get_registry().inc("figure_cache_lookups_total", result="hit")
+                return fig_json
+            self.misses += 1
+            get_registry().inc("figure_cache_lookups_total", result="miss")
+
+        # Build outside the lock so slow charts don't block other sessions
+        fig_json = build().to_json()
+
+        with self._lock:
+            self._entries[key] = fig_json
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return fig_json
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+@st.cache_resource
+def get_figure_cache():
+    """Process-wide figure cache shared across sessions"""
+    return FigureCache()
+
+
+def cached_figure(name, build, *inputs, **layout):
+    """Return a figure for ``name`` from cache, building it on first use
+
+    ``inputs`` and ``layout`` make up the cache key together with ``name``;
+    pass everything the figure depends on. ``build`` is only called on a miss.
+    """
+    key = f"{name}:{fingerprint(*inputs, **layout)}"
+
+    def timed_build():
+        with timed("figure_build_seconds", chart=name):
+            return build()
+
+    return pio.from_json(get_figure_cache().get_json(key, timed_build))
@@ -0,0 +1,55 @@
+"""
+Display Formatting
+==================
+
+Column labels and value formatting shared by the dashboards, the Credit
+Officer view and the AI Assistant. Kept free of Streamlit and the chat
+engine so any page can use it.
+"""
+
+import numpy as np
+
+
+COLUMN_LABELS = {
+    "risk_score_30d": "Kee Score (30d)",
+    "risk_score_60d": "Kee Score (60d)",
+    "risk_score_90d": "Kee Score (90d)",
+    "account_value": "Account Value",
+    "days_since_last_order": "Days Since Last Order",
+    "active_months": "Active Months",
+    "volatility": "Volatility",
+    "gmv_slope": "GMV Slope",
+}
+
+
+def format_aed(value):
+    """AED amount in compact form, e.g. 'AED 1.2M', 'AED 45.3K', 'AED 950'"""
+    value = float(value)
+    if abs(value) >= 1_000_000:
+        return f"AED {value / 1_000_000:,.1f}M"
+    if abs(value) >= 1_000:
+        return f"AED {value / 1_000:,.1f}K"
+    return f"AED {value:,.0f}"
+
+
+def format_value(column, value):
+    if column == "account_value":
+        return format_aed(value)
+    if column in ("days_since_last_order", "active_months"):
+        return f"{int(value):,}"
+    if column == "gmv_slope":
+        return f"{value:+,.1f}"
+    return f"{value:.3f}"
+
+
+def percentile_label(pct):
+    """'Above 96% of customers' / 'Below 89% of customers' for a 0-100 portfolio percentile
+
+    Direction only, not a rating: a high Kee score percentile is worse, a
+    high account value percentile is better.
+    """
+    if np.isnan(pct):
+        return "n/a"
+    if pct >= 50:
+        return f"Above {min(99, round(pct)):.0f}% of customers"
+    return f"Below {min(99, round(100 - pct)):.0f}% of customers"
@@ -0,0 +1,168 @@
+"""
+Monthly GMV Rollup
+==================
+
+Pre-aggregated per-customer monthly history built from the conektr
+transaction file: GMV and order count for each of the last 12 months
+(ending at the latest order month in the file), with average order value
+derived on read.
+
+The customer_id, order_date and gmv columns come from the ingestion
+columnar store (memory-mapped, parsed once per file version and shared
+with the Data Ingestion page and the feature pipeline). They are grouped
+in chunks to (customer, month) totals and scattered into customer-major
+arrays: one row of 12 months per customer, rows sorted by customer_id.
+A customer's history is then one binary search and one row slice, with
+no per-render aggregation. Files the store cannot hold (for example
+without the declared order_id/sku_count columns) are read from the CSV
+in chunks instead.
+
+Usage:
+    rollup = get_current_rollup()        # None without a transaction file
+    history = rollup.history(8697)       # DataFrame: month, gmv, orders, aov
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from customer_data import find_conektr_data, get_data_version
+from ingestion import source_table
+from metrics import timed
+
+
+ROLLUP_MONTHS = 12
+ROLLUP_COLUMNS = ["customer_id", "order_date", "gmv"]
+ROLLUP_CHUNK_ROWS = 1_000_000
+
+
+def month_index(dates):
+    """Months since year 0 (``year * 12 + month - 1``) for datetime values"""
+    months = np.asarray(dates, dtype="datetime64[M]").astype(np.int64)
+    return months + 1970 * 12
+
+
+class MonthlyRollup:
+    """Per-customer monthly GMV and order counts, customer-major"""
+
+    def __init__(self, ids, months, gmv, orders):
+        self.ids = ids          # sorted customer_ids
+        self.months = months    # month start timestamps, oldest first
+        self.gmv = gmv          # (customers, months) float64
+        self.orders = orders    # (customers, months) int32
+
+    @property
+    def size(self):
+        return len(self.ids)
+
+    def position(self, customer_id):
+        """Row of ``customer_id``, or None"""
+        pos = int(np.searchsorted(self.ids, int(customer_id)))
+        if pos < len(self.ids) and self.ids[pos] == int(customer_id):
+            return pos
+        return None
+
+    def history(self, customer_id):
+        """Monthly GMV, orders and AOV for one customer (zeros if it has no orders)"""
+        pos = self.position(customer_id)
+        if pos is None:
+            gmv, orders = np.zeros(len(self.months)), np.zeros(len(self.months), dtype=np.int32)
+        else:
+            gmv, orders = self.gmv[pos], self.orders[pos]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            aov = np.where(orders > 0, gmv / orders, 0.0)
+        return pd.DataFrame({"month": self.months, "gmv": gmv, "orders": orders, "aov": aov})
+
+
+def order_totals(customer_ids, order_dates, gmv, until=None):
+    """(customer_id, month) totals for order lines; ``order_dates`` is datetime64[D] (NaT skipped)
+
+    With ``until`` (a date), order lines after it are left out.
+    """
+    valid = ~np.isnat(order_dates)
+    if until is not None:
+        valid &= order_dates <= np.datetime64(until, "D")
+    dates = order_dates[valid]
+    return merge_totals(pd.DataFrame({
+        "customer_id": customer_ids[valid],
+        "month": month_index(dates),
+        "gmv": gmv[valid],
+        "orders": np.ones(len(dates), dtype=np.int64),
+        "last_order": dates.astype(np.int64),
+    }))
+
+
+def monthly_totals(path, chunk_rows=ROLLUP_CHUNK_ROWS, until=None):
+    """(customer_id, month) totals from a CSV in one chunked pass: gmv, orders and last order day
+
+    ``last_order`` is days since 1970-01-01. Rows are sorted by customer_id, month.
+    """
+    partials = []
+    reader = pd.read_csv(path, usecols=ROLLUP_COLUMNS, chunksize=chunk_rows,
+                         dtype={"customer_id": np.int64, "gmv": np.float64})
+    for chunk in reader:
+        dates = pd.to_datetime(chunk["order_date"], format="%Y-%m-%d", errors="coerce")
+        partials.append(order_totals(chunk["customer_id"].to_numpy(),
+                                     dates.to_numpy().astype("datetime64[D]"), chunk["gmv"].to_numpy(), until))
+    return merge_totals(pd.concat(partials, ignore_index=True))
+
+
+def transaction_totals(path, chunk_rows=ROLLUP_CHUNK_ROWS, until=None):
+    """``monthly_totals`` for a conektr file, from the ingestion store when it can hold the file"""
+    table = source_table("distribution_partner", path)
+    if table is None:
+        return monthly_totals(path, chunk_rows, until)
+    columns = table.columns
+    partials = [order_totals(columns["customer_id"][i:i + chunk_rows], columns["order_date"][i:i + chunk_rows],
+                             columns["gmv"][i:i + chunk_rows], until)
+                for i in range(0, max(table.rows, 1), chunk_rows)]
+    return merge_totals(pd.concat(partials, ignore_index=True))
+
+
+def merge_totals(totals):
+    """Combine rows for the same (customer_id, month): sums, latest order day"""
+    return (totals.groupby(["customer_id", "month"], sort=True)
+            .agg(gmv=("gmv", "sum"), orders=("orders", "sum"), last_order=("last_order", "max"))
+            .reset_index())
+
+
+def monthly_matrix(totals, last_month, months=ROLLUP_MONTHS):
+    """Customer-major (customers, months) GMV and order arrays for the months ending at ``last_month``"""
+    ids, rows = np.unique(totals["customer_id"].to_numpy(), return_inverse=True)
+    offset = totals["month"].to_numpy() - (last_month - months + 1)
+    in_window = (offset >= 0) & (offset < months)
+    cells = rows[in_window] * months + offset[in_window]
+    size = len(ids) * months
+    gmv = np.bincount(cells, weights=totals["gmv"].to_numpy()[in_window], minlength=size)
+    orders = np.bincount(cells, weights=totals["orders"].to_numpy()[in_window], minlength=size)
+    return ids, gmv.reshape(len(ids), months), orders.astype(np.int32).reshape(len(ids), months)
+
+
+def build_rollup(path, months=ROLLUP_MONTHS, chunk_rows=ROLLUP_CHUNK_ROWS):
+    """Rollup of the last ``months`` months up to the latest order month"""
+    totals = transaction_totals(path, chunk_rows)
+    if totals.empty:
+        return MonthlyRollup(np.zeros(0, dtype=np.int64), pd.DatetimeIndex([]),
+                             np.zeros((0, months)), np.zeros((0, months), dtype=np.int32))
+    last = int(totals["month"].max())
+    ids, gmv, orders = monthly_matrix(totals, last, months)
+    month_starts = pd.to_datetime(pd.DataFrame({
+        "year": np.arange(last - months + 1, last + 1) // 12,
+        "month": np.arange(last - months + 1, last + 1) % 12 + 1,
+        "day": 1,
+    }))
+    return MonthlyRollup(ids, pd.DatetimeIndex(month_starts), gmv, orders)
+
+
+@st.cache_resource(max_entries=2)
+def get_gmv_rollup(data_version):
+    """Monthly rollup for one version of the transaction file (shared by all sessions)"""
+    if data_version == "missing":
+        return None
+    with timed("rollup_build_seconds"):
+        return build_rollup(find_conektr_data())
+
+
+def get_current_rollup():
+    """Rollup for the transaction file currently on disk, or None"""
+    return get_gmv_rollup(get_data_version(find_conektr_data()))
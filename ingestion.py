@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Multi-Source Ingestion
+======================
+
+One reader per data source over local files, run concurrently on a
+thread pool (pandas' C parser releases the GIL while tokenizing). Each
+source declares its schema: only the declared columns are parsed
+(``usecols``), with fixed dtypes, and the result is stored column-wise
+as NumPy arrays. A per-source report (rows, columns read vs. present,
+bytes, seconds, rows/sec, status) feeds the Data Ingestion page.
+
+Files are looked up in data/ (or $KEE_INGEST_DIR); the Distribution
+Partner file follows the conektr transaction file lookup. Missing or
+unreadable files are reported, not fatal.
+
+Parsed tables are written to the columnar store in ingested/, one .npy
+file per column under a directory named for the source file's version:
+
+    ingested/<source>/<version>/
+        meta.json           source path, rows, dtypes and categories
+        <column>.npy        one array per declared column
+
+Consumers (the GMV rollup, the feature pipeline) memory-map those columns
+through ``source_table`` instead of parsing the CSV again; a source that
+is not stored yet is read once and stored on first use.
+
+    python ingestion.py                      # ingest and print the timing report
+    python ingestion.py --workers 1          # serial, for comparison
+    python ingestion.py --write-samples      # sample files for missing sources
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from customer_data import SCRIPT_DIR, find_conektr_data, find_dashboard_data, get_data_version
+from metrics import timed
+from synthetic_data import generate_transactions
+
+
+INGEST_ENV_VAR = "KEE_INGEST_DIR"
+DEFAULT_INGEST_DIR = os.path.join(SCRIPT_DIR, "data")
+STORE_DIR = os.path.join(SCRIPT_DIR, "ingested")
+
+# Unreadable files (empty, truncated, not UTF-8, bad values) are reported per source, never raised
+READ_ERRORS = (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError, ValueError, TypeError)
+
+Source = namedtuple("Source", "title filename schema")
+SourceTable = namedtuple("SourceTable", "source columns rows")
+SourceReport = namedtuple(
+    "SourceReport", "source title path status rows columns_read columns_total bytes seconds error"
+)
+
+# source -> declared schema (column -> dtype; "date" columns are parsed to datetime64[D])
+SOURCES = {
+    "distribution_partner": Source("Distribution Partner Data", "conektr_data.csv", {
+        "order_id": "int64", "customer_id": "int64", "order_date": "date",
+        "gmv": "float64", "sku_count": "int32",
+    }),
+    "payment_partner": Source("Payment Partner", "payment_partner.csv", {
+        "customer_id": "int64", "payment_score": "float64", "txn_velocity": "float64",
+        "fraud_flag": "int8", "credit_utilization": "float64",
+    }),
+    "bank_transactions": Source("Bank Transactions", "bank_transactions.csv", {
+        "customer_id": "int64", "statement_month": "date", "closing_balance": "float64",
+        "income": "float64", "expenses": "float64", "bounces": "int16",
+    }),
+    "aecb": Source("AECB Data", "aecb.csv", {
+        "customer_id": "int64", "credit_score": "int16", "history_months": "int16",
+        "active_loans": "int16", "delinquencies": "int16", "inquiries": "int16",
+    }),
+    "los": Source("LOS Data", "los.csv", {
+        "customer_id": "int64", "requested_amount": "float64", "approved_amount": "float64",
+        "monthly_income": "float64", "status": pd.CategoricalDtype(["approved", "pending", "rejected"]),
+    }),
+    "dewa": Source("Dewa Bills", "dewa.csv", {
+        "customer_id": "int64", "bill_month": "date", "bill_amount": "float64", "days_late": "int16",
+    }),
+}
+
+
+def ingest_dir():
+    return os.environ.get(INGEST_ENV_VAR) or DEFAULT_INGEST_DIR
+
+
+def source_path(name):
+    """File for one source (the Distribution Partner file is the conektr transaction file)"""
+    if name == "distribution_partner" and not os.environ.get(INGEST_ENV_VAR):
+        found = find_conektr_data()
+        if found is not None:
+            return found
+    return os.path.join(ingest_dir(), SOURCES[name].filename)
+
+
+def read_source(name, path):
+    """Read one source with its declared schema; returns (SourceTable or None, SourceReport)"""
+    source = SOURCES[name]
+    start = time.perf_counter()
+
+    def report(status, rows=0, columns_total=0, error=None):
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        return SourceReport(name, source.title, path, status, rows, len(source.schema) if status == "ok" else 0,
+                            columns_total, size, time.perf_counter() - start, error)
+
+    if not os.path.exists(path):
+        return None, report("missing")
+    try:
+        header = pd.read_csv(path, nrows=0).columns
+    except READ_ERRORS as e:
+        return None, report("read error", error=f"{type(e).__name__}: {e}")
+    missing = [column for column in source.schema if column not in header]
+    if missing:
+        return None, report("schema error", columns_total=len(header), error=f"missing columns: {missing}")
+
+    dates = [column for column, dtype in source.schema.items() if dtype == "date"]
+    dtypes = {column: dtype for column, dtype in source.schema.items() if dtype != "date"}
+    try:
+        with timed("ingest_source_seconds", source=name):
+            df = pd.read_csv(path, usecols=list(source.schema), dtype=dtypes)
+            columns = {}
+            for column in source.schema:
+                if column in dates:
+                    parsed = pd.to_datetime(df[column], format="%Y-%m-%d", errors="coerce")
+                    columns[column] = parsed.to_numpy().astype("datetime64[D]")
+                elif isinstance(df[column].dtype, pd.CategoricalDtype):
+                    columns[column] = df[column].array
+                else:
+                    columns[column] = df[column].to_numpy()
+    except READ_ERRORS as e:
+        return None, report("read error", columns_total=len(header), error=f"{type(e).__name__}: {e}")
+    return SourceTable(name, columns, len(df)), report("ok", len(df), len(header))
+
+
+def store_version(path):
+    """Directory name for one version of a source file (path + mtime/size fingerprint)"""
+    key = f"{os.path.abspath(path)}:{get_data_version(path)}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def write_table(table, path, store_dir=STORE_DIR):
+    """Store a parsed table column-wise for the source file at ``path``
+
+    The columns are written to a temporary directory and renamed into place,
+    so readers never see a partial table; older versions are removed.
+    """
+    source_dir = os.path.join(store_dir, table.source)
+    target = os.path.join(source_dir, store_version(path))
+    os.makedirs(source_dir, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=".staging-", dir=source_dir)
+    meta = {"path": os.path.abspath(path), "rows": table.rows, "dtypes": {}, "categories": {}}
+    for column, values in table.columns.items():
+        if isinstance(values, pd.Categorical):
+            meta["categories"][column] = list(values.categories)
+            values = values.codes
+        meta["dtypes"][column] = str(values.dtype)
+        np.save(os.path.join(staging, f"{column}.npy"), values)
+    with open(os.path.join(staging, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    try:
+        os.rename(staging, target)
+    except OSError:
+        # Another reader stored this version first
+        shutil.rmtree(staging, ignore_errors=True)
+    for entry in os.listdir(source_dir):
+        if entry != os.path.basename(target) and not entry.startswith(".staging-"):
+            shutil.rmtree(os.path.join(source_dir, entry), ignore_errors=True)
+    return target
+
+
+def load_table(name, path, store_dir=STORE_DIR):
+    """Stored table for the current version of ``path`` (columns memory-mapped), or None"""
+    if not os.path.exists(path):
+        return None
+    directory = os.path.join(store_dir, name, store_version(path))
+    try:
+        with open(os.path.join(directory, "meta.json")) as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+    columns = {}
+    for column in meta["dtypes"]:
+        values = np.load(os.path.join(directory, f"{column}.npy"), mmap_mode="r")
+        if column in meta["categories"]:
+            values = pd.Categorical.from_codes(values, meta["categories"][column])
+        columns[column] = values
+    return SourceTable(name, columns, meta["rows"])
+
+
+def ingest_source(name, path, store_dir=STORE_DIR):
+    """Read one source and store it column-wise; returns its SourceReport"""
+    table, report = read_source(name, path)
+    if table is not None:
+        write_table(table, path, store_dir)
+    return report
+
+
+def source_table(name, path=None, store_dir=STORE_DIR):
+    """Columns of one source from the store, ingesting the file first if needed; None if unreadable"""
+    path = path or source_path(name)
+    table = load_table(name, path, store_dir)
+    if table is None and ingest_source(name, path, store_dir).status == "ok":
+        table = load_table(name, path, store_dir)
+    return table
+
+
+def ingest_all(names=None, workers=None, store_dir=STORE_DIR):
+    """Read every source concurrently into the columnar store; returns (reports, wall seconds)"""
+    names = list(names or SOURCES)
+    workers = workers or len(names)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as pool:
+        reports = list(pool.map(lambda name: ingest_source(name, source_path(name), store_dir), names))
+    return reports, time.perf_counter() - start
+
+
+def report_frame(reports):
+    """Timing report as a display table"""
+    return pd.DataFrame({
+        "Source": [r.title for r in reports],
+        "Status": [{"ok": "✅", "missing": "⏸️ missing"}.get(r.status, f"❌ {r.status}") for r in reports],
+        "Records": [r.rows for r in reports],
+        "Columns": [f"{r.columns_read}/{r.columns_total}" if r.columns_total else "-" for r in reports],
+        "Size (MB)": [r.bytes / 1e6 for r in reports],
+        "Seconds": [r.seconds for r in reports],
+        "Rows/sec": [r.rows / r.seconds if r.rows and r.seconds else 0.0 for r in reports],
+    })
+
+
+@st.cache_data(max_entries=2)
+def get_ingestion(versions):
+    """(reports, wall seconds) for the source files (``versions`` keys the cache)"""
+    return ingest_all()
+
+
+def get_current_ingestion():
+    """Ingestion result for the source files currently on disk"""
+    versions = tuple(get_data_version(path if os.path.exists(path) else None)
+                     for path in map(source_path, SOURCES))
+    return get_ingestion(versions)
+
+
+def sample_source(schema, customer_ids, rows_per_customer, rng, as_of):
+    """Random rows matching a declared schema for some customers"""
+    ids = np.repeat(customer_ids, rows_per_customer)
+    columns = {}
+    for column, dtype in schema.items():
+        if column == "customer_id":
+            columns[column] = ids
+        elif dtype == "date":
+            days = rng.integers(0, 365, len(ids)).astype("timedelta64[D]")
+            columns[column] = pd.to_datetime(np.datetime64(as_of.date()) - days).strftime("%Y-%m-%d")
+        elif isinstance(dtype, pd.CategoricalDtype):
+            columns[column] = rng.choice(list(dtype.categories), len(ids))
+        elif dtype.startswith("float"):
+            columns[column] = np.round(rng.gamma(2.0, 5_000.0, len(ids)), 2)
+        else:
+            columns[column] = rng.integers(0, 2 if dtype == "int8" else 1_000, len(ids))
+    return pd.DataFrame(columns)
+
+
+def write_samples(output_dir=None, seed=42, as_of=None):
+    """Sample files for sources that have no file yet, keyed to dashboard_data.csv customers"""
+    output_dir = output_dir or ingest_dir()
+    as_of = as_of or datetime.now()
+    rng = np.random.default_rng(seed)
+    customers = pd.read_csv(find_dashboard_data())
+    os.makedirs(output_dir, exist_ok=True)
+    written = {}
+    for name, source in SOURCES.items():
+        path = os.path.join(output_dir, source.filename)
+        if os.path.exists(source_path(name)) or os.path.exists(path):
+            continue
+        if name == "distribution_partner":
+            df = generate_transactions(customers, rng, as_of)
+        else:
+            # Bank statements and bills are monthly; the others one row per matched customer
+            matched = customers["customer_id"].to_numpy()[rng.random(len(customers)) < 0.9]
+            monthly = any(dtype == "date" for dtype in source.schema.values())
+            df = sample_source(source.schema, matched, 12 if monthly else 1, rng, as_of)
+        df.to_csv(path, index=False)
+        written[name] = (path, len(df))
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest the six data sources")
+    parser.add_argument("--workers", type=int, help="Reader threads (default: one per source)")
+    parser.add_argument("--write-samples", action="store_true", help="Write sample files for missing sources first")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📥 Multi-Source Ingestion")
+    print("=" * 60)
+    if args.write_samples:
+        for name, (path, rows) in write_samples().items():
+            print(f"🧪 {SOURCES[name].title}: {rows:,} sample rows -> {path}")
+
+    reports, wall = ingest_all(workers=args.workers)
+    for r in reports:
+        if r.status == "ok":
+            print(f"✅ {r.title}: {r.rows:,} rows, {r.columns_read}/{r.columns_total} columns "
+                  f"in {r.seconds:.2f}s ({r.rows / max(r.seconds, 1e-9):,.0f} rows/s)")
+        else:
+            print(f"⚠️ {r.title}: {r.status} ({r.error or r.path})")
+    busy = sum(r.seconds for r in reports)
+    stored = sum(r.status == "ok" for r in reports)
+    print(f"⏱️ {stored}/{len(reports)} sources in {wall:.2f}s wall ({busy:.2f}s summed across readers)")
+    print(f"📦 Columnar store -> {STORE_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Intent Router
+=============
+
+Single-pass intent and entity extraction for free-text questions. Entity
+patterns and intent keywords are compiled into ONE regular expression with
+named groups; one ``finditer`` over the query yields every entity and
+keyword. Intents are registered with the keywords/entities that trigger
+them, and only the triggered intents are considered, so adding intents
+does not add work to unrelated queries.
+
+Usage:
+    router = IntentRouter()
+    router.entity("id", r"\\b\\d{1,7}\\b", parse=lambda m: int(m.group()))
+
+    @router.intent("compare", triggers=["compare"], priority=50,
+                   requires=lambda e: len(e["id"]) >= 2)
+    def answer_compare(store, entities):
+        ...
+
+    name, handler, entities = router.route("compare 48 and 53")
+
+Entity patterns are tried in registration order at each position, so
+register the more specific ones (e.g. amounts) before generic ones (IDs).
+Group names inside entity patterns must be unique across the router.
+"""
+
+import re
+import threading
+from collections import namedtuple
+
+
+Intent = namedtuple("Intent", "name handler triggers priority requires")
+
+KEYWORD_GROUP = "kw"
+
+
+class IntentRouter:
+    """Registry of entity patterns and intents behind one compiled regex"""
+
+    def __init__(self, default=None):
+        self._entities = []  # (name, pattern, parse)
+        self._intents = {}
+        self._by_trigger = {}
+        self._keywords = set()
+        self._default = default
+        self._compiled = None
+        self._lock = threading.Lock()
+
+    # -- registration -----------------------------------------------------
+
+    def entity(self, name, pattern, parse=None):
+        """Register an entity pattern; ``parse(match)`` -> value (None drops the match)"""
+        self._entities.append((name, pattern, parse))
+        self._compiled = None
+
+    def intent(self, name, triggers=(), priority=0, requires=None):
+        """Decorator registering ``handler`` for an intent
+
+        ``triggers`` are keyword stems (matched as word prefixes) or entity
+        names; the intent is a candidate only when one of them occurs.
+        Among candidates whose ``requires(entities)`` holds, the highest
+        ``priority`` wins.
+        """
+        def decorator(handler):
+            self._intents[name] = Intent(name, handler, tuple(triggers), priority, requires)
+            entity_names = {e[0] for e in self._entities}
+            for trigger in triggers:
+                self._by_trigger.setdefault(trigger, []).append(name)
+                if trigger not in entity_names:
+                    self._keywords.add(trigger)
+            self._compiled = None
+            return handler
+        return decorator
+
+    def default(self, handler):
+        """Decorator registering the fallback handler"""
+        self._default = handler
+        return handler
+
+    # -- matching ---------------------------------------------------------
+
+    def compile(self):
+        """Build (once) the combined pattern: entities first, then keywords"""
+        with self._lock:
+            if self._compiled is None:
+                parts = [f"(?P<{name}>{pattern})" for name, pattern, _ in self._entities]
+                if self._keywords:
+                    stems = "|".join(re.escape(k) for k in sorted(self._keywords, key=len, reverse=True))
+                    parts.append(rf"\b(?P<{KEYWORD_GROUP}>{stems})\w*")
+                self._compiled = re.compile("|".join(parts), re.IGNORECASE)
+        return self._compiled
+
+    def extract(self, query):
+        """Entities (name -> list of values) and the set of keyword stems, in one pass"""
+        entities = {name: [] for name, _, _ in self._entities}
+        keywords = set()
+        parsers = {name: parse for name, _, parse in self._entities}
+        for match in self.compile().finditer(query):
+            group = match.lastgroup
+            if group == KEYWORD_GROUP:
+                keywords.add(match.group(KEYWORD_GROUP).lower())
+                continue
+            parse = parsers.get(group)
+            value = parse(match) if parse else match.group(group)
+            if value is not None:
+                entities[group].append(value)
+        entities["keywords"] = keywords
+        return entities
+
+    def route(self, query):
+        """``(intent_name, handler, entities)`` for a query"""
+        entities = self.extract(query)
+        triggered = set(entities["keywords"]) | {name for name, values in entities.items()
+                                                   if name != "keywords" and values}
+        candidates = {intent for trigger in triggered for intent in self._by_trigger.get(trigger, ())}
+        for name in sorted(candidates, key=lambda n: self._intents[n].priority, reverse=True):
+            intent = self._intents[name]
+            if intent.requires is None or intent.requires(entities):
+                return name, intent.handler, entities
+        return "help", self._default, entities
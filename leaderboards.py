@@ -0,0 +1,86 @@
+"""
+Leaderboards
+============
+
+Portfolio top-K lists built on the customer store: highest exposure,
+fastest GMV growth, largest 30d -> 90d Kee score deterioration and premium
+low-risk customers by account value. Selection uses ``np.argpartition``
+(O(n)) and only the K winners are sorted, and the boards are built once
+per data version and shared by all sessions.
+
+Usage:
+    boards = get_leaderboards(store.data_version, store)
+    board = boards["premium"]
+    board.rows[:10], board.scores[:10], board.eligible
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import streamlit as st
+
+from customer_store import LOW_RISK_MAX, PREMIUM_ACCOUNT_VALUE, get_customer_store
+from metrics import timed
+
+
+LEADERBOARD_SIZE = 100
+
+Leaderboard = namedtuple("Leaderboard", "name title metric rows scores eligible")
+
+
+def top_k(values, k, rows=None, largest=True):
+    """Positions of the ``k`` largest (or smallest) ``values``, best first
+
+    ``rows`` restricts the candidates to those positions. Partial selection
+    with argpartition, then a sort of the k selected only.
+    """
+    candidates = np.arange(len(values)) if rows is None else np.asarray(rows)
+    k = min(k, len(candidates))
+    if k == 0:
+        return candidates[:0]
+    keys = values[candidates] if largest else -values[candidates]
+    if k < len(candidates):
+        picked = np.argpartition(-keys, k - 1)[:k]
+    else:
+        picked = np.arange(len(candidates))
+    picked = picked[np.argsort(-keys[picked], kind="stable")]
+    return candidates[picked]
+
+
+def premium_rows(store):
+    """Rows of premium low-risk customers (low Kee score, high account value)"""
+    return np.flatnonzero((store.column("risk_score_30d") < LOW_RISK_MAX)
+                          & (store.column("account_value") >= PREMIUM_ACCOUNT_VALUE))
+
+
+# name -> (title, metric label, score(store), eligible rows(store) or None for all)
+LEADERBOARDS = {
+    "exposure": ("Highest Exposure", "Account Value",
+                 lambda s: s.column("account_value"), None),
+    "growth": ("Fastest-Growing GMV", "GMV Slope",
+               lambda s: s.column("gmv_slope"), None),
+    "deterioration": ("Largest Kee Score Deterioration (30d → 90d)", "Score Change",
+                      lambda s: s.column("risk_score_90d") - s.column("risk_score_30d"), None),
+    "premium": ("Premium Low-Risk by Account Value", "Account Value",
+                lambda s: s.column("account_value"), premium_rows),
+}
+
+
+def build_leaderboards(store, k=LEADERBOARD_SIZE):
+    """All leaderboards for one store"""
+    boards = {}
+    for name, (title, metric, score, eligible) in LEADERBOARDS.items():
+        values = score(store)
+        rows = eligible(store) if eligible else None
+        top = top_k(values, k, rows)
+        boards[name] = Leaderboard(name, title, metric, top, values[top],
+                                   store.size if rows is None else len(rows))
+    return boards
+
+
+@st.cache_resource(max_entries=2)
+def get_leaderboards(data_version, _store=None):
+    """Leaderboards for one data version (shared by all sessions)"""
+    store = _store if _store is not None else get_customer_store(data_version)
+    with timed("leaderboard_build_seconds"):
+        return build_leaderboards(store)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Concurrent-session load test for the Streamlit app.
+
+Drives N simulated officer sessions against one process with Streamlit's
+headless AppTest (each AppTest has its own session_state, while st.cache_data,
+st.cache_resource and the figure cache are shared, as on a real replica).
+Every session walks a seeded random scenario: navigate stages, open the
+Credit Officer dashboard, pick customers, click Approve/Reject and ask the
+AI Assistant example questions.
+
+All sessions are open at the same time and advance one action each in
+round-robin order. AppTest is not thread-safe, and reruns are CPU-bound
+under the GIL on a real replica too, so interleaving gives the same
+contention for memory and caches without flaky threads.
+
+    python loadtest.py                          # 8 sessions x 20 actions
+    python loadtest.py --sessions 32 --actions 50 -o loadtest_results.json
+
+Reports throughput (reruns/s), rerun latency percentiles per action and
+overall, errors, and process RSS growth per session.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+from benchmarks import CREDIT_OFFICER_VIEW, ROOT, _quiet_streamlit, max_rss_mb, summarize
+
+
+ACTIONS = ["navigate", "pick_customer", "approve", "reject", "ask_assistant"]
+# Officers spend most of their time in the Credit Officer view
+ACTION_WEIGHTS = [2, 4, 2, 1, 1]
+
+DASHBOARD_SELECT = "Select Dashboard to Preview"
+
+
+def current_rss_mb():
+    """Current resident set size in MB (falls back to peak RSS off Linux)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return max_rss_mb()
+
+
+def _stage_label(module):
+    from stages import STAGES
+    return next(label for label, name in STAGES.items() if name == module)
+
+
+def _widget(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    return None
+
+
+class SimulatedSession:
+    """One officer's browser tab, driven through AppTest"""
+
+    def __init__(self, session_id, seed, timeout=120):
+        from streamlit.testing.v1 import AppTest
+        self.session_id = session_id
+        self.rng = random.Random(seed)
+        self.at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout)
+        self.samples = []  # (action, seconds)
+        self.errors = []
+
+    def _run(self, action):
+        start = time.perf_counter()
+        self.at.run()
+        self.samples.append((action, time.perf_counter() - start))
+        if self.at.exception:
+            self.errors.append(f"{action}: {self.at.exception[0].value}")
+
+    def _goto(self, stage):
+        radio = self.at.sidebar.radio[0]
+        if radio.value != stage:
+            radio.set_value(stage)
+            self._run("navigate")
+
+    def _open_credit_officer(self):
+        self._goto(_stage_label("dashboards"))
+        view = _widget(self.at.selectbox, DASHBOARD_SELECT)
+        if view is not None and view.value != CREDIT_OFFICER_VIEW:
+            view.set_value(CREDIT_OFFICER_VIEW)
+            self._run("open_credit_officer")
+
+    def start(self):
+        self._run("first_load")
+
+    def step(self):
+        action = self.rng.choices(ACTIONS, ACTION_WEIGHTS)[0]
+        if action == "navigate":
+            from stages import STAGES
+            self._goto(self.rng.choice(list(STAGES)))
+        elif action == "pick_customer":
+            self._open_credit_officer()
+            select = _widget(self.at.selectbox, "Select Customer")
+            if select is not None and select.options:
+                select.set_value(self.rng.choice(select.options))
+                self._run(action)
+        elif action in ("approve", "reject"):
+            self._open_credit_officer()
+            label = "✅ Approve Loan" if action == "approve" else "❌ Reject Loan"
+            button = _widget(self.at.button, label)
+            if button is not None:
+                button.click()
+                self._run(action)
+        elif action == "ask_assistant":
+            self._goto(_stage_label("ai_assistant"))
+            buttons = [b for b in self.at.button if b.label != "🗑️ Clear Chat History"]
+            if buttons:
+                self.rng.choice(buttons).click()
+                self._run(action)
+
+
+def run_load_test(sessions=8, actions=20, seed=42, verbose=True):
+    """Run ``sessions`` simulated sessions of ``actions`` steps each; return the report"""
+    _quiet_streamlit()
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+    # One untimed session first so module imports and shared cache fills
+    # are not attributed to the measured sessions' RSS growth
+    warmup = SimulatedSession(-1, seed - 1)
+    warmup.start()
+    for _ in range(actions):
+        warmup.step()
+    del warmup
+    rss_start = current_rss_mb()
+
+    wall_start = time.perf_counter()
+    open_sessions = []
+    for session_id in range(sessions):
+        session = SimulatedSession(session_id, seed + session_id)
+        session.start()
+        open_sessions.append(session)
+    for _ in range(actions):
+        for session in open_sessions:
+            session.step()
+    wall = time.perf_counter() - wall_start
+    rss_end = current_rss_mb()
+
+    if verbose:
+        for session in open_sessions:
+            print(f"  ✅ session {session.session_id:>3}: {len(session.samples)} reruns, "
+                  f"{len(session.errors)} errors")
+
+    all_samples = [s for session in open_sessions for s in session.samples]
+    by_action = {}
+    for action, seconds in all_samples:
+        by_action.setdefault(action, []).append(seconds)
+
+    errors = [f"session {s.session_id}: {e}" for s in open_sessions for e in s.errors]
+    rss_growth = (rss_end - rss_start) if rss_start is not None and rss_end is not None else None
+
+    return {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "sessions": sessions,
+            "actions_per_session": actions,
+            "seed": seed,
+        },
+        "throughput_reruns_per_s": len(all_samples) / wall if wall else None,
+        "wall_s": wall,
+        "reruns": len(all_samples),
+        "latency": summarize([s for _, s in all_samples]),
+        "latency_by_action": {a: summarize(v) for a, v in sorted(by_action.items())},
+        "errors": errors,
+        "rss_start_mb": rss_start,
+        "rss_end_mb": rss_end,
+        "rss_growth_per_session_mb": rss_growth / sessions if rss_growth is not None else None,
+    }
+
+
+def format_report(report):
+    def ms(seconds):
+        return f"{seconds * 1000:8.1f} ms"
+
+    lat = report["latency"]
+    lines = [
+        "",
+        f"  Sessions: {report['meta']['sessions']} open x {report['meta']['actions_per_session']} actions",
+        f"  Reruns:   {report['reruns']} in {report['wall_s']:.1f}s "
+        f"-> {report['throughput_reruns_per_s']:.1f} reruns/s",
+        f"  Latency:  p50 {ms(lat['median_s'])}   p95 {ms(lat['p95_s'])}   max {ms(lat['max_s'])}",
+        "",
+        f"  {'Action':<22}{'n':>6}{'p50':>14}{'p95':>14}",
+    ]
+    for action, stats in report["latency_by_action"].items():
+        lines.append(f"  {action:<22}{stats['runs']:>6}{ms(stats['median_s']):>14}{ms(stats['p95_s']):>14}")
+    lines.append("")
+    if report["rss_growth_per_session_mb"] is not None:
+        lines.append(
+            f"  RSS: {report['rss_start_mb']:.1f} MB -> {report['rss_end_mb']:.1f} MB "
+            f"({report['rss_growth_per_session_mb']:.2f} MB/session)"
+        )
+    lines.append(f"  Errors: {len(report['errors'])}")
+    for error in report["errors"][:10]:
+        lines.append(f"    ❌ {error}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the dashboard")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--actions", type=int, default=20, help="Actions per session")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-o", "--output", help="Write the report as JSON to this file")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🚦 Dashboard Load Test")
+    print("=" * 60)
+    report = run_load_test(args.sessions, args.actions, args.seed)
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📝 Report written to {args.output}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
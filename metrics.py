@@ -0,0 +1,257 @@
+"""
+In-Process Metrics
+==================
+
+Lightweight timing instrumentation shared by every session in the process:
+histograms (Prometheus-style cumulative buckets plus a bounded window of
+recent samples for percentiles) and counters.
+
+Usage:
+    with timed("stage_render_seconds", stage="overview"):
+        render()
+
+    summary = get_registry().summary("stage_render_seconds")
+
+Set ``KEE_METRICS_PORT`` (e.g. 9464) to serve the metrics in Prometheus text
+format on http://127.0.0.1:<port>/metrics.
+"""
+
+import bisect
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+PORT_ENV_VAR = "KEE_METRICS_PORT"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RECENT_SAMPLES = 1024
+
+
+class Histogram:
+    """Cumulative-bucket histogram with a window of recent samples for percentiles"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # last = +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, value):
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def percentile(self, q):
+        """q-th percentile (0-100) over the recent window, or None if empty"""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        idx = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+        return ordered[idx]
+
+
+class MetricsRegistry:
+    """Thread-safe store of histograms and counters keyed by (name, labels)"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._histograms = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram()
+            hist.observe(value)
+
+    def inc(self, name, amount=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def counter(self, name, **labels):
+        """Sum of a counter across all label sets matching ``labels``"""
+        with self._lock:
+            return sum(
+                v for (n, lbls), v in self._counters.items()
+                if n == name and set(labels.items()) <= set(lbls)
+            )
+
+    def uptime_seconds(self):
+        return time.time() - self.started_at
+
+    def summary(self, name):
+        """Per-label-set stats for one histogram: count, mean, p50, p95, p99 (seconds)"""
+        rows = []
+        with self._lock:
+            for (n, labels), hist in self._histograms.items():
+                if n != name:
+                    continue
+                rows.append({
+                    "labels": dict(labels),
+                    "count": hist.count,
+                    "mean": hist.sum / hist.count if hist.count else None,
+                    "p50": hist.percentile(50),
+                    "p95": hist.percentile(95),
+                    "p99": hist.percentile(99),
+                })
+        return sorted(rows, key=lambda r: r["count"], reverse=True)
+
+    def overall(self, name):
+        """Stats for one histogram merged across all label sets"""
+        with self._lock:
+            hists = [h for (n, _), h in self._histograms.items() if n == name]
+            samples = sorted(v for h in hists for v in h.recent)
+            count = sum(h.count for h in hists)
+            total = sum(h.sum for h in hists)
+
+        def pct(q):
+            if not samples:
+                return None
+            return samples[min(len(samples) - 1, int(round(q / 100 * (len(samples) - 1))))]
+
+        return {
+            "count": count,
+            "mean": total / count if count else None,
+            "p50": pct(50),
+            "p95": pct(95),
+            "p99": pct(99),
+        }
+
+    def render_prometheus(self):
+        """All metrics in the Prometheus text exposition format"""
+        def fmt_labels(labels, extra=()):
+            items = list(labels) + list(extra)
+            if not items:
+                return ""
+            escaped = [(k, str(v).replace("\\", "\\\\").replace('"', '\\"')) for k, v in items]
+            return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+        lines = [
+            "# TYPE kee_process_uptime_seconds gauge",
+            f"kee_process_uptime_seconds {self.uptime_seconds():.3f}",
+        ]
+        with self._lock:
+            seen = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in seen:
+                    lines.append(f"# TYPE kee_{name} counter")
+                    seen.add(name)
+                lines.append(f"kee_{name}{fmt_labels(labels)} {value}")
+            for (name, labels), hist in sorted(self._histograms.items()):
+                if name not in seen:
+                    lines.append(f"# TYPE kee_{name} histogram")
+                    seen.add(name)
+                cumulative = 0
+                for bound, count in zip(hist.buckets + (float("inf"),), hist.bucket_counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"kee_{name}_bucket{fmt_labels(labels, [('le', le)])} {cumulative}")
+                lines.append(f"kee_{name}_sum{fmt_labels(labels)} {hist.sum:.6f}")
+                lines.append(f"kee_{name}_count{fmt_labels(labels)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry()
+_server = None
+_server_lock = threading.Lock()
+
+
+def get_registry():
+    """Process-wide metrics registry"""
+    return _registry
+
+
+@contextmanager
+def timed(name, **labels):
+    """Record the duration of a block in histogram ``name``
+
+    Exceptions are counted in ``<name minus _seconds>_errors_total``; Streamlit's
+    st.stop()/st.rerun() control flow (BaseException) is not an error.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        _registry.inc(name.replace("_seconds", "") + "_errors_total", **labels)
+        raise
+    finally:
+        _registry.observe(name, time.perf_counter() - start, **labels)
+
+
+def timed_function(name, **labels):
+    """Decorator form of ``timed``"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(name, **labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = _registry.render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep scrapes out of the app log
+
+
+def start_metrics_server(port=None, host="127.0.0.1"):
+    """Serve /metrics on localhost once per process; no-op without a port"""
+    global _server
+    if port is None:
+        port = os.environ.get(PORT_ENV_VAR)
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, int(port)), _MetricsHandler)
+            except OSError:
+                return None  # Port taken (e.g. another replica on this host)
+            threading.Thread(target=_server.serve_forever, name="kee-metrics", daemon=True).start()
+    return _server
+
+
+def format_duration(seconds):
+    """Compact human duration, e.g. '3d 4h', '2h 5m', '42s'"""
+    seconds = int(seconds)
+    days, rem = divmod(seconds, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, secs = divmod(rem, 60)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
+def format_ms(seconds):
+    """Seconds -> 'NN ms' (or 'n/a' when there is no sample yet)"""
+    return "n/a" if seconds is None else f"{seconds * 1000:,.0f} ms"
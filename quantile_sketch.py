@@ -0,0 +1,145 @@
+"""
+Quantile Sketch
+===============
+
+Mergeable KLL quantile sketch (Karnin, Lang & Liberty) on NumPy arrays.
+A sketch keeps a few hundred weighted samples of a column in compactor
+levels; level ``h`` items stand for ``2**h`` values. Batches are added
+whole, sketches built on separate ingestion chunks are merged level by
+level, and only the small compactor buffers are ever sorted, never the
+full column.
+
+Rank and quantile queries run against a sorted, cumulative-weight view of
+the retained items (built once after the last update), so a percentile
+lookup is a binary search over O(k) items. Rank error is roughly 2 / k of
+the portfolio (~0.5% at the default k=400).
+
+Usage:
+    sketch = KLLSketch()
+    for chunk in chunks:
+        sketch.update(chunk["account_value"].to_numpy())
+    sketch.rank([54_300])          # share of values at or below
+    sketch.quantile([0.5, 0.95])
+
+    merged = sketch_a.merge(sketch_b)
+"""
+
+import math
+
+import numpy as np
+
+
+DEFAULT_K = 400
+CAPACITY_DECAY = 2 / 3
+MIN_CAPACITY = 2
+
+
+class KLLSketch:
+    """KLL quantile sketch over float values"""
+
+    def __init__(self, k=DEFAULT_K, seed=None):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+        self._view = None  # (sorted items, cumulative weights)
+
+    def __len__(self):
+        return self.n
+
+    def capacity(self, level):
+        """Buffer size at which ``level`` is compacted"""
+        depth = len(self.levels) - level - 1
+        return max(MIN_CAPACITY, int(math.ceil(self.k * CAPACITY_DECAY ** depth)))
+
+    def update(self, values):
+        """Add a batch of values (NaNs are skipped)"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.n += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """New sketch summarising both inputs (neither is modified)"""
+        merged = KLLSketch(max(self.k, other.k))
+        merged._rng = np.random.default_rng(self._rng.integers(2 ** 63))
+        depth = max(len(self.levels), len(other.levels))
+        merged.levels = [
+            np.concatenate([s.levels[h] for s in (self, other) if h < len(s.levels)])
+            for h in range(depth)
+        ]
+        merged.n = self.n + other.n
+        merged._compress()
+        return merged
+
+    def _compress(self):
+        self._view = None
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) < self.capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0, dtype=np.float64))
+            items = np.sort(items)
+            # Keep one item back when odd so total weight is preserved exactly
+            keep = items[:len(items) % 2]
+            pairs = items[len(keep):]
+            promoted = pairs[self._rng.integers(2)::2]
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            # Capacities shrink when a level is added; recheck from the bottom
+            level = 0
+
+    def _sorted_view(self):
+        if self._view is None:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(lv), 2.0 ** h) for h, lv in enumerate(self.levels)])
+            order = np.argsort(items, kind="stable")
+            self._view = (items[order], np.cumsum(weights[order]))
+        return self._view
+
+    def rank(self, values):
+        """Estimated share of values at or below each of ``values`` (0-1)"""
+        values = np.asarray(values, dtype=np.float64)
+        if self.n == 0:
+            return np.full(values.shape, np.nan)
+        items, cumulative = self._sorted_view()
+        pos = np.searchsorted(items, values, side="right")
+        below = np.where(pos > 0, cumulative[np.maximum(pos - 1, 0)], 0.0)
+        return below / cumulative[-1]
+
+    def quantile(self, q):
+        """Estimated value at each quantile in ``q`` (0-1)"""
+        q = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        items, cumulative = self._sorted_view()
+        pos = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return items[np.minimum(pos, len(items) - 1)]
+
+    def size(self):
+        """Number of retained items"""
+        return sum(len(lv) for lv in self.levels)
+
+
+def build_sketches(columns, chunk_rows=100_000, k=DEFAULT_K, seed=0):
+    """KLL sketch per column, built on ``chunk_rows`` slices and merged
+
+    ``columns`` maps name -> 1-D array. Each chunk gets its own sketch (as
+    a parallel ingestion worker would) and the chunk sketches are merged.
+    """
+    sketches = {}
+    for i, (name, values) in enumerate(columns.items()):
+        merged = KLLSketch(k, seed=seed + i)
+        for start in range(0, len(values), chunk_rows):
+            chunk = KLLSketch(k, seed=seed + i + start + 1).update(values[start:start + chunk_rows])
+            merged = merged.merge(chunk)
+        merged._sorted_view()  # build the lookup view before the sketch is shared
+        sketches[name] = merged
+    return sketches
@@ -0,0 +1,80 @@
+"""
+Query Planner
+=============
+
+Resolves compound customer filters - a bitmap over categorical/flag
+columns plus numeric range conditions - against the customer store's
+indexes. Conditions on the same column are merged into one interval,
+each interval is sized with two binary searches on its sorted range
+index, and the most selective input (a range slice or the bitmap) drives
+the plan. The remaining predicates are then checked on the driver's rows
+only (gathered values for ranges, bit probes for the bitmap), so a
+selective filter never touches the full columns.
+
+Usage:
+    plan = plan_rows(store, store.bitmaps.get("risk_level", "High"),
+                     [("account_value", ">", 50_000), ("days_since_last_order", "<=", 90)])
+    plan.rows      # ascending row positions
+    plan.steps     # e.g. ['range account_value: 312', 'range days_since_last_order: 95', 'bitmap: 9']
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+
+Range = namedtuple("Range", "column low high low_inclusive high_inclusive")
+Plan = namedtuple("Plan", "rows steps")
+
+
+def to_ranges(conditions):
+    """Merge ``(column, op, value)`` conditions into one interval per column"""
+    bounds = {}
+    for column, op, value in conditions:
+        low, high, low_inc, high_inc = bounds.get(column, (-np.inf, np.inf, True, True))
+        if op in (">", ">="):
+            inclusive = op == ">="
+            if value > low or (value == low and not inclusive):
+                low, low_inc = value, inclusive
+        elif op in ("<", "<="):
+            inclusive = op == "<="
+            if value < high or (value == high and not inclusive):
+                high, high_inc = value, inclusive
+        else:
+            raise ValueError(f"Unsupported operator: {op}")
+        bounds[column] = (low, high, low_inc, high_inc)
+    return [Range(column, *b) for column, b in bounds.items()]
+
+
+def in_range(values, r):
+    """Boolean mask of ``values`` inside interval ``r``"""
+    above = values >= r.low if r.low_inclusive else values > r.low
+    below = values <= r.high if r.high_inclusive else values < r.high
+    return above & below
+
+
+def plan_rows(store, bitmap=None, conditions=()):
+    """Rows matching ``bitmap`` (None = all) AND every condition, ascending"""
+    ranges = to_ranges(conditions)
+    slices = [store.range_rows(*r) for r in ranges]
+    bitmap_count = bitmap.count() if bitmap is not None else store.size
+
+    sizes = [len(s) for s in slices]
+    if slices and min(sizes) < bitmap_count:
+        driver = int(np.argmin(sizes))
+        rows = np.sort(slices[driver]).astype(np.int64)
+        steps = [f"range {ranges[driver].column}: {len(rows)}"]
+        if bitmap is not None:
+            rows = rows[bitmap.contains(rows)]
+            steps.append(f"bitmap: {len(rows)}")
+    else:
+        driver = None
+        rows = bitmap.rows() if bitmap is not None else np.arange(store.size)
+        steps = [f"bitmap: {len(rows)}" if bitmap is not None else f"all: {len(rows)}"]
+
+    for i, r in enumerate(ranges):
+        if i == driver:
+            continue
+        rows = rows[in_range(store.column(r.column)[rows], r)]
+        steps.append(f"range {r.column}: {len(rows)}")
+    return Plan(rows, steps)
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store
+==============
+
+Keeps every daily customer file instead of overwriting it. Each day is
+stored either as a full base or as a column-wise delta against the
+previous day, keyed by customer_id:
+
+    snapshots/
+        manifest.json                 dates, kinds and each base's column schema
+        2026-10-01/                   base: <column>.npy, rows sorted by customer_id
+                                      (text as codes + offsets + UTF-8 bytes)
+        2026-10-02/                   delta:
+            removed.npy               customer_ids gone since the previous day
+            added/<column>.npy        full rows for new customer_ids
+            changed/<column>.ids.npy  customer_ids whose value changed
+            changed/<column>.values.npy
+
+A new base is written every REBASE_EVERY snapshots (or when more than
+half the values change), so rebuilding any date replays at most that many
+deltas. Time-travel queries (``history``) memory-map the base and read the
+small per-column change lists, so a customer's scores over the last 90
+days touch only that customer's rows.
+
+Usage:
+    python snapshot_store.py add                       # today's dashboard_data.csv
+    python snapshot_store.py add --date 2026-10-01 --file old.csv
+    python snapshot_store.py list
+    python snapshot_store.py history 8697 --days 90
+
+    store = SnapshotStore()
+    store.table("2026-10-01")                          # DataFrame as of that date
+    store.history([8697], ["risk_score_30d"], start="2026-07-21")
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from customer_data import SCRIPT_DIR, find_dashboard_data, get_data_version
+
+
+SNAPSHOT_DIR = os.path.join(SCRIPT_DIR, "snapshots")
+MANIFEST = "manifest.json"
+KEY = "customer_id"
+REBASE_EVERY = 30
+REBASE_CHANGE_SHARE = 0.5
+HISTORY_DAYS = 90
+
+
+def _to_arrays(df):
+    """Column arrays sorted by customer_id (strings as fixed-width unicode, NaN -> '')"""
+    if df[KEY].duplicated().any():
+        raise ValueError(f"Duplicate {KEY} values in snapshot")
+    df = df.sort_values(KEY, kind="stable")
+    arrays = {}
+    for column in df.columns:
+        values = df[column]
+        if values.dtype == object:
+            arrays[column] = values.fillna("").astype(str).to_numpy(dtype=str)
+        else:
+            arrays[column] = values.to_numpy()
+    return arrays
+
+
+def _changed(old, new):
+    """Mask of positions where ``new`` differs from ``old`` (NaN == NaN)"""
+    if old.dtype.kind == "f":
+        return ~((old == new) | (np.isnan(old) & np.isnan(new)))
+    return old != new
+
+
+def _schema(arrays):
+    return {column: values.dtype.kind for column, values in arrays.items()}
+
+
+def _assign(target, positions, values):
+    """``target[positions] = values``, widening fixed-width strings so nothing is truncated"""
+    if values.dtype.kind == "U" and values.dtype.itemsize > target.dtype.itemsize:
+        target = target.astype(values.dtype)
+    target[positions] = values
+    return target
+
+
+def _to_frame(arrays, columns):
+    data = {}
+    for column in columns:
+        values = arrays[column]
+        if values.dtype.kind == "U":
+            missing = values == ""
+            values = values.astype(object)
+            values[missing] = np.nan
+        data[column] = values
+    return pd.DataFrame(data)
+
+
+class SnapshotStore:
+    """Daily customer snapshots as bases plus column-wise deltas"""
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        path = os.path.join(root, MANIFEST)
+        if os.path.exists(path):
+            with open(path) as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {"snapshots": []}
+
+    @property
+    def snapshots(self):
+        return self.manifest["snapshots"]
+
+    def dates(self):
+        return [s["date"] for s in self.snapshots]
+
+    def _dir(self, day, *parts):
+        return os.path.join(self.root, day, *parts)
+
+    def _save_manifest(self):
+        path = os.path.join(self.root, MANIFEST)
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _write(self, day, arrays, *parts):
+        directory = self._dir(day, *parts[:-1])
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, parts[-1] + ".npy"), arrays)
+
+    def _load(self, day, *parts, mmap=False):
+        return np.load(self._dir(day, *parts) + ".npy", mmap_mode="r" if mmap else None)
+
+    def _write_base(self, day, arrays):
+        for column, values in arrays.items():
+            if values.dtype.kind == "U":
+                # Text: dictionary codes + UTF-8 blob of the distinct values (fixed-width
+                # unicode costs 4 bytes per character of the longest value, per row)
+                codes, categories = pd.factorize(values)
+                encoded = [value.encode() for value in categories]
+                offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+                np.cumsum([len(b) for b in encoded], out=offsets[1:])
+                self._write(day, codes.astype(np.int32), column + ".codes")
+                self._write(day, offsets, column + ".offsets")
+                self._write(day, np.frombuffer(b"".join(encoded), dtype=np.uint8), column + ".text")
+            else:
+                self._write(day, values, column)
+
+    def _load_base(self, day, column, rows=None):
+        """Base column, or only ``rows`` of it (memory-mapped)"""
+        mmap = rows is not None
+        if not os.path.exists(self._dir(day, column + ".codes.npy")):
+            values = self._load(day, column, mmap=mmap)
+            return values if rows is None else np.array(values[rows])
+        codes = self._load(day, column + ".codes", mmap=mmap)
+        codes = np.asarray(codes if rows is None else codes[rows])
+        offsets = self._load(day, column + ".offsets", mmap=mmap)
+        text = self._load(day, column + ".text", mmap=mmap)
+        if rows is None:
+            blob, bounds = text.tobytes(), offsets.tolist()
+            decoded = [blob[bounds[i]:bounds[i + 1]].decode() for i in range(len(bounds) - 1)]
+            return np.array(decoded, dtype=str)[codes] if decoded else np.full(len(codes), "")
+        needed = np.unique(codes)
+        decoded = [bytes(text[offsets[c]:offsets[c + 1]]).decode() for c in needed]
+        return np.array(decoded, dtype=str)[np.searchsorted(needed, codes)] if decoded else np.full(len(codes), "")
+
+    def _base(self, day):
+        """Base snapshot that ``day`` is stored against"""
+        return self._chain(day)[0]
+
+    def add(self, df, day=None):
+        """Record ``df`` as the snapshot for ``day`` (ISO date, default today)"""
+        day = day or date.today().isoformat()
+        if self.snapshots and day <= self.snapshots[-1]["date"]:
+            raise ValueError(f"Snapshot dates must increase: {day} <= {self.snapshots[-1]['date']}")
+        arrays = _to_arrays(df)
+        schema = _schema(arrays)
+
+        since_base = 0
+        for entry in reversed(self.snapshots):
+            if entry["kind"] == "base":
+                break
+            since_base += 1
+        rebase = (not self.snapshots or schema != self._base(self.snapshots[-1]["date"])["schema"]
+                  or since_base + 1 >= REBASE_EVERY)
+
+        entry = {"date": day, "rows": len(df)}
+        if not rebase:
+            entry.update(self._write_delta(day, arrays))
+            if entry["changed_values"] > REBASE_CHANGE_SHARE * len(df) * len(schema):
+                shutil.rmtree(self._dir(day))
+                rebase = True
+        if rebase:
+            self._write_base(day, arrays)
+            entry = {"date": day, "rows": len(df), "kind": "base", "schema": schema}
+
+        self.snapshots.append(entry)
+        self._save_manifest()
+        return entry
+
+    def _write_delta(self, day, arrays):
+        previous = self._arrays(self.snapshots[-1]["date"])
+        old_ids, new_ids = previous[KEY], arrays[KEY]
+        common, old_pos, new_pos = np.intersect1d(old_ids, new_ids, assume_unique=True, return_indices=True)
+        removed = np.setdiff1d(old_ids, new_ids, assume_unique=True)
+        added = np.setdiff1d(np.arange(len(new_ids)), new_pos, assume_unique=True)
+
+        os.makedirs(self._dir(day), exist_ok=True)
+        self._write(day, removed, "removed")
+        changed_values = 0
+        for column, values in arrays.items():
+            self._write(day, values[added], "added", column)
+            if column == KEY:
+                continue
+            mask = _changed(previous[column][old_pos], values[new_pos])
+            self._write(day, common[mask], "changed", column + ".ids")
+            self._write(day, values[new_pos][mask], "changed", column + ".values")
+            changed_values += int(mask.sum())
+        return {"kind": "delta", "added": int(len(added)), "removed": int(len(removed)),
+                "changed_values": changed_values}
+
+    def _chain(self, day):
+        """Snapshots to replay for ``day``: the latest base at or before it, then its deltas"""
+        upto = [s for s in self.snapshots if s["date"] <= day]
+        if not upto:
+            raise KeyError(f"No snapshot on or before {day}")
+        start = max(i for i, s in enumerate(upto) if s["kind"] == "base")
+        return upto[start:]
+
+    def _arrays(self, day):
+        chain = self._chain(day)
+        columns = list(chain[0]["schema"])
+        arrays = {column: self._load_base(chain[0]["date"], column) for column in columns}
+        for entry in chain[1:]:
+            d = entry["date"]
+            ids = arrays[KEY]
+            for column in columns:
+                if column == KEY:
+                    continue
+                changed_ids = self._load(d, "changed", column + ".ids")
+                arrays[column] = _assign(arrays[column], np.searchsorted(ids, changed_ids),
+                                         self._load(d, "changed", column + ".values"))
+            if entry["added"] or entry["removed"]:
+                keep = ~np.isin(ids, self._load(d, "removed"), assume_unique=True)
+                added = {column: self._load(d, "added", column) for column in columns}
+                merged = {column: np.concatenate([arrays[column][keep], added[column]]) for column in columns}
+                order = np.argsort(merged[KEY], kind="stable")
+                arrays = {column: values[order] for column, values in merged.items()}
+        return arrays
+
+    def table(self, day=None):
+        """Customer table as of ``day`` (default: latest snapshot)"""
+        day = day or self.dates()[-1]
+        return _to_frame(self._arrays(day), list(self._base(day)["schema"]))
+
+    def history(self, customer_ids, columns, start=None, end=None):
+        """Long table (date, customer_id, *columns) for a few customers between two dates"""
+        if not self.snapshots:
+            return pd.DataFrame(columns=["date", KEY, *columns])
+        end = end or self.dates()[-1]
+        start = start or self.dates()[0]
+        wanted = np.unique(np.asarray(customer_ids, dtype=np.int64))
+        chain = self._chain(max(start, self.dates()[0]))
+        chain += [s for s in self.snapshots if chain[-1]["date"] < s["date"] <= end]
+
+        present = np.zeros(len(wanted), dtype=bool)
+        values = {}
+        frames = []
+        for entry in chain:
+            d = entry["date"]
+            if entry["kind"] == "base":
+                # Binary search the memory-mapped id column, gather only those rows
+                base_ids = self._load(d, KEY, mmap=True)
+                pos = np.minimum(np.searchsorted(base_ids, wanted), len(base_ids) - 1)
+                present = base_ids[pos] == wanted
+                for column in columns:
+                    values[column] = self._load_base(d, column, pos)
+            else:
+                present &= ~np.isin(wanted, self._load(d, "removed"))
+                added_ids = self._load(d, "added", KEY)
+                new_pos = np.flatnonzero(np.isin(wanted, added_ids))
+                present[new_pos] = True
+                for column in columns:
+                    if len(new_pos):
+                        added = self._load(d, "added", column)[np.searchsorted(added_ids, wanted[new_pos])]
+                        values[column] = _assign(values[column], new_pos, added)
+                    changed_ids = self._load(d, "changed", column + ".ids")
+                    hit = np.flatnonzero(np.isin(wanted, changed_ids))
+                    if len(hit):
+                        changed = self._load(d, "changed", column + ".values")
+                        values[column] = _assign(values[column], hit,
+                                                 changed[np.searchsorted(changed_ids, wanted[hit])])
+            if d >= start and present.any():
+                frame = {"date": np.full(int(present.sum()), d), KEY: wanted[present]}
+                frame.update({column: values[column][present].copy() for column in columns})
+                frames.append(_to_frame(frame, ["date", KEY, *columns]))
+        if not frames:
+            return pd.DataFrame(columns=["date", KEY, *columns])
+        return pd.concat(frames, ignore_index=True)
+
+
+@st.cache_data
+def load_history(customer_id, columns, days, manifest_version):
+    """Recent history for one customer (``manifest_version`` keys the cache)"""
+    if manifest_version == "missing":
+        return None
+    store = SnapshotStore()
+    end = store.dates()[-1]
+    start = (date.fromisoformat(end) - timedelta(days=days)).isoformat()
+    return store.history([customer_id], list(columns), start=start, end=end)
+
+
+def get_history(customer_id, columns, days=HISTORY_DAYS):
+    """Snapshot history for one customer, or None if no snapshots exist"""
+    path = os.path.join(SNAPSHOT_DIR, MANIFEST)
+    return load_history(int(customer_id), tuple(columns), days,
+                        get_data_version(path if os.path.exists(path) else None))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Versioned daily customer snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="Record a customer file as a snapshot")
+    add.add_argument("--file", help="Customer file (default: dashboard_data.csv)")
+    add.add_argument("--date", help="Snapshot date, YYYY-MM-DD (default: today)")
+    commands.add_parser("list", help="List snapshots")
+    history = commands.add_parser("history", help="Kee scores of one customer over time")
+    history.add_argument("customer_id", type=int)
+    history.add_argument("--days", type=int, default=HISTORY_DAYS)
+    parser.add_argument("--root", default=SNAPSHOT_DIR, help="Snapshot directory")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.root)
+    print("=" * 60)
+    print("🗂️ Customer Snapshot Store")
+    print("=" * 60)
+
+    if args.command == "add":
+        path = args.file or find_dashboard_data()
+        if path is None:
+            print("❌ dashboard_data.csv not found")
+            return 1
+        start = time.perf_counter()
+        entry = store.add(pd.read_csv(path), args.date)
+        print(f"✅ {entry['date']}: {entry['kind']} with {entry['rows']:,} customers "
+              f"({time.perf_counter() - start:.2f}s)")
+        if entry["kind"] == "delta":
+            print(f"   📝 {entry['changed_values']:,} changed values, "
+                  f"{entry['added']:,} added, {entry['removed']:,} removed")
+    elif args.command == "list":
+        if not store.snapshots:
+            print("📭 No snapshots yet")
+        for entry in store.snapshots:
+            detail = "" if entry["kind"] == "base" else f" ({entry['changed_values']:,} changed values)"
+            print(f"   {entry['date']}  {entry['kind']:<5}  {entry['rows']:,} customers{detail}")
+    else:
+        if not store.snapshots:
+            print("📭 No snapshots yet")
+            return 0
+        end = store.dates()[-1]
+        start = (date.fromisoformat(end) - timedelta(days=args.days)).isoformat()
+        scores = ["risk_score_30d", "risk_score_60d", "risk_score_90d"]
+        print(store.history([args.customer_id], scores, start=start, end=end).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
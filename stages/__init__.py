@@ -0,0 +1,34 @@
+"""
+Dashboard Stages
+================
+
+One module per navigation stage, each exposing ``render()``. A stage module
+is imported the first time it is selected, so heavy dependencies (plotly,
+the Credit Officer dashboard) are only loaded for pages that need them and
+each rerun only executes the code of the selected stage.
+"""
+
+import importlib
+
+
+# Navigation label -> module name within this package (in sidebar order)
+STAGES = {
+    "🏠 Overview": "overview",
+    "📥 1. Data Ingestion": "data_ingestion",
+    "📊 2. EDA & Data Profiling": "eda",
+    "🔧 3. Feature Engineering": "feature_engineering",
+    "🤖 4. Model Training": "model_training",
+    "🚀 5. Model Deployment": "model_deployment",
+    "📈 6. Dashboards": "dashboards",
+    "💬 AI Assistant": "ai_assistant",
+}
+
+
+def load_stage(stage):
+    """Import (once per process) and return the module for a stage label"""
+    return importlib.import_module(f"{__name__}.{STAGES[stage]}")
+
+
+def render_stage(stage):
+    """Render the selected stage"""
+    load_stage(stage).render()
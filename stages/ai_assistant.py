@@ -0,0 +1,100 @@
+"""
+AI Assistant: credit risk Q&A chat
+"""
+
+import streamlit as st
+
+from assistant_engine import cached_stream
+from chat_history import get_chat_history, message_content
+from customer_store import get_current_store
+
+
+def render():
+    """Render the AI Assistant stage"""
+    st.markdown('<div class="stage-header">💬 AI Assistant</div>', unsafe_allow_html=True)
+    st.markdown("### Intelligent Credit Risk Analysis Assistant")
+    
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
+        <h3 style='color: white; margin: 0;'>💡 Ask me anything about credit risk analysis!</h3>
+        <p style='color: #f0f0f0; margin: 10px 0 0 0;'>I can help you find customer profiles, analyze risk patterns, explain model predictions, and more.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Initialize chat history
+    history = get_chat_history()
+    
+    # Example queries
+    st.markdown("#### 🎯 Try These Example Queries:")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("🔍 Find high-risk customers", use_container_width=True):
+            st.session_state.example_query = "Show me all high-risk customers with their key risk factors"
+    
+    with col2:
+        if st.button("📊 Analyze customer profile", use_container_width=True):
+            st.session_state.example_query = "Analyze the risk profile for customer ID 8697"
+    
+    with col3:
+        if st.button("💰 Premium customers analysis", use_container_width=True):
+            st.session_state.example_query = "Find all premium customers with low Kee scores"
+    
+    col4, col5, col6 = st.columns(3)
+    
+    with col4:
+        if st.button("📈 Risk trends", use_container_width=True):
+            st.session_state.example_query = "What are the main risk trends in our customer base?"
+    
+    with col5:
+        if st.button("🎯 Feature importance", use_container_width=True):
+            st.session_state.example_query = "Which features are most important for risk prediction?"
+    
+    with col6:
+        if st.button("🔄 Compare customers", use_container_width=True):
+            st.session_state.example_query = "Compare risk profiles of customers 8697 and 48"
+    
+    st.markdown("---")
+    
+    # Chat interface
+    st.markdown("#### 💬 Chat with AI Assistant")
+    
+    # Display the latest messages; older ones load on demand
+    if history.hidden_count():
+        st.button(f"⬆️ Show earlier messages ({history.hidden_count()} hidden)",
+                  key="chat_show_earlier", on_click=history.show_earlier)
+    store = get_current_store()
+    data_version = store.data_version if store is not None else None
+    for message in history.visible():
+        with st.chat_message(message["role"]):
+            st.markdown(message_content(message))
+            if message["role"] == "assistant" and message.get("data_version") != data_version:
+                st.caption("🕒 Answered from an earlier version of the customer data")
+    
+    # Chat input
+    if "example_query" in st.session_state:
+        prompt = st.session_state.example_query
+        del st.session_state.example_query
+    else:
+        prompt = st.chat_input("Ask me anything about credit risk analysis...")
+    
+    if prompt:
+        # Add user message to chat history
+        history.add_user(prompt)
+        
+        # Display user message
+        with st.chat_message("user"):
+            st.markdown(prompt)
+        
+        # Stream the AI response: headline first, then sections and table rows
+        with st.chat_message("assistant"):
+            response = st.write_stream(cached_stream(prompt, store))
+        
+        # Add assistant response to chat history
+        history.add_assistant(response, data_version)
+    
+    # Clear chat button
+    if st.button("🗑️ Clear Chat History"):
+        history.clear()
+        st.rerun()
@@ -0,0 +1,659 @@
+"""
+Stage 6: Role-based dashboards
+"""
+
+import streamlit as st
+import pandas as pd
+
+from customer_compare import FACTOR_COLUMNS, risk_factors
+from customer_data import load_customer_data
+from customer_store import SKETCH_COLUMNS, credit_limit, get_current_store
+from customer_segments import SEGMENT_NAMES, get_segmentation
+from early_warning import ALERT_LABELS, get_alerts
+from formatting import COLUMN_LABELS, format_aed, format_value, percentile_label
+from leaderboards import get_leaderboards, top_k
+from metrics import format_duration, format_ms, get_registry, timed
+from snapshot_store import HISTORY_DAYS, get_history
+
+
+EXECUTIVE_TOP_N = 10
+DRILLDOWN_ROWS = 50
+DRILLDOWN_SORTS = {
+    "Exposure (highest)": ("account_value", True),
+    "Kee score (highest)": ("risk_score_30d", True),
+    "Days inactive (longest)": ("days_since_last_order", True),
+    "GMV slope (lowest)": ("gmv_slope", False),
+}
+LEADERBOARD_FORMATS = {
+    "exposure": format_aed,
+    "growth": "{:+,.1f}".format,
+    "deterioration": "{:+.3f}".format,
+    "premium": format_aed,
+}
+ALERT_ROWS = 20
+HISTORY_COLUMNS = ["risk_score_30d", "risk_score_60d", "risk_score_90d"]
+
+
+def render():
+    """Render the 6. Dashboards stage"""
+    customer_df = load_customer_data()
+    
+    st.markdown('<div class="stage-header">📈 Stage 6: Dashboards</div>', unsafe_allow_html=True)
+    st.markdown("### Role-Based Dashboards")
+    
+    # Dashboard selection
+    dashboard_type = st.selectbox(
+        "Select Dashboard to Preview",
+        [
+            "🎯 Executive Dashboard",
+            "🔬 Technical Dashboard",
+            "📊 Customer Risk Dashboard",
+            "💼 Credit Officer Dashboard"
+        ]
+    )
+    
+    if dashboard_type == "🎯 Executive Dashboard":
+        # Executive Dashboard Implementation
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
+            <h3 style='color: white; margin: 0;'>🎯 Executive Dashboard</h3>
+            <p style='color: #f0f0f0; margin: 10px 0 0 0;'>High-level portfolio overview and strategic insights</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Key Executive Metrics
+        st.markdown("#### 📊 Portfolio Overview")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Total Customers", "4,525", "+125 this month")
+        with col2:
+            st.metric("Total Credit Exposure", "AED 58.4M", "+8.2%")
+        with col3:
+            st.metric("Portfolio Kee Score", "0.34", "-0.05 (Improving)")
+        with col4:
+            st.metric("Default Rate", "2.1%", "-0.3% (Better)")
+        
+        st.markdown("---")
+        
+        # Risk Distribution
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 🎯 Risk Distribution")
+            risk_dist = pd.DataFrame({
+                "Risk Category": ["Very Low Risk", "Low Risk", "Medium Risk", "High Risk", "Very High Risk"],
+                "Customers": [3210, 845, 320, 115, 35],
+                "Percentage": ["70.9%", "18.7%", "7.1%", "2.5%", "0.8%"],
+                "Exposure (AED M)": ["41.4", "12.8", "3.2", "0.8", "0.2"]
+            })
+            st.dataframe(risk_dist, use_container_width=True, hide_index=True)
+        
+        with col2:
+            st.markdown("#### 📈 Monthly Trend")
+            trend_data = pd.DataFrame({
+                "Month": ["Jul", "Aug", "Sep", "Oct", "Nov"],
+                "Avg Kee Score": [0.42, 0.39, 0.37, 0.35, 0.34],
+                "Default Rate %": [2.8, 2.6, 2.4, 2.3, 2.1]
+            })
+            st.dataframe(trend_data, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        
+        # Strategic Insights
+        st.markdown("#### 💡 Strategic Insights")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            <div style='background: #d4edda; padding: 15px; border-radius: 8px; border-left: 4px solid #28a745;'>
+                <h4 style='color: #155724; margin: 0 0 10px 0;'>✅ Positive Trends</h4>
+                <ul style='color: #155724; margin: 0;'>
+                    <li>Portfolio risk improving by 12.8% YoY</li>
+                    <li>Premium segment growing 15% monthly</li>
+                    <li>Default rate at 3-year low</li>
+                    <li>Customer engagement up 18%</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div style='background: #fff3cd; padding: 15px; border-radius: 8px; border-left: 4px solid #ffc107;'>
+                <h4 style='color: #856404; margin: 0 0 10px 0;'>⚠️ Areas of Focus</h4>
+                <ul style='color: #856404; margin: 0;'>
+                    <li>150 high-risk customers need attention</li>
+                    <li>3.3% concentration risk in top 10 customers</li>
+                    <li>125 inactive customers (90+ days)</li>
+                    <li>Seasonal volatility in Q4</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Top Opportunities (leaderboards over the live portfolio, per data version)
+        st.markdown("#### 🎯 Top Business Opportunities")
+        store = get_current_store()
+        boards = get_leaderboards(store.data_version, store)
+        board_tabs = st.tabs([board.title for board in boards.values()])
+        for tab, board in zip(board_tabs, boards.values()):
+            with tab:
+                top = board.rows[:EXECUTIVE_TOP_N]
+                opportunities = pd.DataFrame({
+                    "Customer ID": store.ids[top],
+                    "Customer": store.names[top],
+                    board.metric: [LEADERBOARD_FORMATS[board.name](v) for v in board.scores[:EXECUTIVE_TOP_N]],
+                    "Kee Score": [f"{v:.3f}" for v in store.column("risk_score_30d")[top]],
+                    "Recommended Limit": [format_aed(v) for v in credit_limit(
+                        store.column("risk_score_30d")[top], store.column("account_value")[top])],
+                })
+                st.caption(f"Top {len(top)} of {board.eligible:,} eligible customers")
+                st.dataframe(opportunities, use_container_width=True, hide_index=True)
+
+        st.markdown("---")
+
+        # Early-warning alerts from the last snapshot scan (early_warning.py)
+        st.markdown("#### 🚨 Early-Warning Alerts")
+        alerts = get_alerts()
+        if alerts is None or alerts.empty:
+            st.info("No early-warning alerts yet. Run `python early_warning.py` after each data refresh "
+                    "to compare the customer file with the previous snapshot.")
+        else:
+            counts = alerts["alert"].value_counts()
+            alert_cols = st.columns(len(ALERT_LABELS))
+            for col, (alert, label) in zip(alert_cols, ALERT_LABELS.items()):
+                col.metric(label, f"{int(counts.get(alert, 0)):,}")
+            top_alerts = alerts.head(ALERT_ROWS).rename(columns={
+                "customer_id": "Customer ID", "customer_name": "Customer", "alert": "Alert",
+                "severity": "Severity", "previous": "Previous", "current": "Current",
+                "change": "Change", "account_value": "Account Value", "detected_at": "Detected",
+            })
+            top_alerts["Alert"] = top_alerts["Alert"].map(ALERT_LABELS)
+            top_alerts["Account Value"] = top_alerts["Account Value"].map(format_aed)
+            st.caption(f"Top {len(top_alerts)} of {len(alerts):,} alerts, most severe and largest accounts first "
+                       f"(detected {alerts['detected_at'].iloc[0]})")
+            st.dataframe(top_alerts, use_container_width=True, hide_index=True)
+    
+    elif dashboard_type == "🔬 Technical Dashboard":
+        # Technical Dashboard Implementation
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
+            <h3 style='color: white; margin: 0;'>🔬 Technical Dashboard</h3>
+            <p style='color: #f0f0f0; margin: 10px 0 0 0;'>Model performance, data quality, and system health</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Model Performance Metrics
+        st.markdown("#### 🎯 Model Performance")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("ROC AUC", "98.7%", "+0.3%")
+        with col2:
+            st.metric("Precision", "96.2%", "+0.5%")
+        with col3:
+            st.metric("Recall", "94.8%", "+0.2%")
+        with col4:
+            st.metric("F1 Score", "95.5%", "+0.4%")
+        
+        st.markdown("---")
+        
+        # Feature Performance
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 🎯 Top 10 Features by Importance")
+            features = pd.DataFrame({
+                "Feature": [
+                    "Volatility", "Days Since Last Order", "GMV Slope",
+                    "Sales 12M", "Sales 6M", "AECB Credit Score",
+                    "Sales 3M", "Monthly GMV", "Active Months", "Order Frequency"
+                ],
+                "Importance": ["15.6%", "14.2%", "12.8%", "11.5%", "9.8%", "6.5%", "8.7%", "7.6%", "6.5%", "4.2%"],
+                "Category": [
+                    "Behavioral", "Behavioral", "Financial",
+                    "Financial", "Financial", "External",
+                    "Financial", "Financial", "Stability", "Behavioral"
+                ]
+            })
+            st.dataframe(features, use_container_width=True, hide_index=True)
+        
+        with col2:
+            st.markdown("#### 📊 Data Quality Metrics")
+            data_quality = pd.DataFrame({
+                "Data Source": [
+                    "Distribution Partner", "Payment Partner",
+                    "Bank Transactions", "AECB Data",
+                    "LOS Data", "DEWA Bills"
+                ],
+                "Completeness": ["99.8%", "100%", "95.2%", "98.5%", "97.8%", "96.5%"],
+                "Freshness": ["Real-time", "Weekly", "Monthly", "Monthly", "Real-time", "Monthly"],
+                "Status": ["✅", "✅", "✅", "✅", "✅", "✅"]
+            })
+            st.dataframe(data_quality, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        
+        # System Health
+        st.markdown("#### 🖥️ System Health & Performance")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        # Measured in-process since this replica started
+        registry = get_registry()
+        renders = registry.overall("stage_render_seconds")
+        render_errors = registry.counter("stage_render_errors_total")
+        success_rate = 100.0 * (1 - render_errors / renders["count"]) if renders["count"] else 100.0
+        
+        with col1:
+            st.markdown(f"""
+            <div style='background: #e3f2fd; padding: 15px; border-radius: 8px;'>
+                <h4 style='color: #1976d2; margin: 0 0 10px 0;'>⚡ App Performance</h4>
+                <ul style='color: #1976d2; margin: 0; list-style: none; padding: 0;'>
+                    <li>Avg Render: {format_ms(renders["mean"])}</li>
+                    <li>P95 Render: {format_ms(renders["p95"])}</li>
+                    <li>Uptime: {format_duration(registry.uptime_seconds())} ({success_rate:.2f}% OK)</li>
+                    <li>Renders: {renders["count"]:,}</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div style='background: #f3e5f5; padding: 15px; border-radius: 8px;'>
+                <h4 style='color: #7b1fa2; margin: 0 0 10px 0;'>🔄 Batch Processing</h4>
+                <ul style='color: #7b1fa2; margin: 0; list-style: none; padding: 0;'>
+                    <li>Daily Runs: 100%</li>
+                    <li>Avg Duration: 12min</li>
+                    <li>Records/day: 4,525</li>
+                    <li>Success Rate: 99.8%</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown("""
+            <div style='background: #e8f5e9; padding: 15px; border-radius: 8px;'>
+                <h4 style='color: #388e3c; margin: 0 0 10px 0;'>💾 Data Pipeline</h4>
+                <ul style='color: #388e3c; margin: 0; list-style: none; padding: 0;'>
+                    <li>Sources: 6 active</li>
+                    <li>ETL Success: 99.5%</li>
+                    <li>Data Lag: <5min</li>
+                    <li>Storage: 2.4TB</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Measured timings from the in-process metrics registry
+        st.markdown("#### ⏱️ Measured Timings (this replica)")
+        timing_rows = []
+        for metric, label in [
+            ("stage_render_seconds", "Stage render"),
+            ("data_load_seconds", "Data load"),
+            ("customer_lookup_seconds", "Customer lookup"),
+            ("figure_build_seconds", "Figure build"),
+            ("assistant_query_seconds", "Assistant query"),
+            ("assistant_first_chunk_seconds", "Assistant first chunk"),
+            ("leaderboard_build_seconds", "Leaderboard build"),
+            ("segmentation_build_seconds", "Segmentation build"),
+            ("rollup_build_seconds", "GMV rollup build"),
+            ("ingest_source_seconds", "Source ingestion"),
+        ]:
+            for row in registry.summary(metric):
+                timing_rows.append({
+                    "Operation": label,
+                    "Target": ", ".join(str(v) for v in row["labels"].values()),
+                    "Count": row["count"],
+                    "Mean": format_ms(row["mean"]),
+                    "P50": format_ms(row["p50"]),
+                    "P95": format_ms(row["p95"]),
+                    "P99": format_ms(row["p99"]),
+                })
+        if timing_rows:
+            st.dataframe(pd.DataFrame(timing_rows), use_container_width=True, hide_index=True)
+        else:
+            st.info("No timings recorded yet")
+        
+        cache_notes = []
+        for metric, label in [
+            ("figure_cache_lookups_total", "Figure cache"),
+            ("assistant_cache_lookups_total", "Assistant answer cache"),
+        ]:
+            hits = registry.counter(metric, result="hit")
+            lookups = hits + registry.counter(metric, result="miss")
+            if lookups:
+                cache_notes.append(f"{label}: {hits / lookups:.0%} hit rate ({lookups:,} lookups)")
+        if cache_notes:
+            st.caption(" · ".join(cache_notes))
+        
+        st.markdown("---")
+        
+        # Model Monitoring
+        st.markdown("#### 📈 Model Monitoring")
+        monitoring = pd.DataFrame({
+            "Metric": [
+                "Prediction Drift", "Feature Drift", "Data Quality Score",
+                "Model Accuracy", "False Positive Rate", "False Negative Rate"
+            ],
+            "Current Value": ["2.3%", "1.8%", "98.2%", "96.5%", "3.8%", "5.2%"],
+            "Threshold": ["<5%", "<5%", ">95%", ">95%", "<5%", "<5%"],
+            "Status": ["✅ Normal", "✅ Normal", "✅ Healthy", "✅ Good", "✅ Normal", "⚠️ Monitor"]
+        })
+        st.dataframe(monitoring, use_container_width=True, hide_index=True)
+    
+    elif dashboard_type == "📊 Customer Risk Dashboard":
+        # Customer Risk Dashboard Implementation
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
+            <h3 style='color: white; margin: 0;'>📊 Customer Risk Dashboard</h3>
+            <p style='color: #f0f0f0; margin: 10px 0 0 0;'>Detailed customer risk analysis and segmentation</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Customer Search
+        st.markdown("#### 🔍 Customer Lookup")
+        
+        if customer_df is not None:
+            # Get list of available customer IDs
+            available_customers = customer_df['customer_id'].astype(str).tolist()
+            
+            col1, col2, col3 = st.columns([2, 2, 1])
+            
+            with col1:
+                customer_id_input = st.selectbox(
+                    "Select Customer ID",
+                    options=[""] + available_customers,
+                    format_func=lambda x: "Choose a customer..." if x == "" else f"Customer {x}"
+                )
+            
+            with col2:
+                if customer_id_input:
+                    customer_name = customer_df[customer_df['customer_id'].astype(str) == customer_id_input]['customer_name'].values[0]
+                    st.markdown(f"<br><strong>Name:</strong> {customer_name}", unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown("<br>", unsafe_allow_html=True)
+                search_btn = st.button("🔍 Analyze", use_container_width=True)
+        else:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                customer_id_input = st.text_input("Enter Customer ID", placeholder="e.g., 24")
+            with col2:
+                st.markdown("<br>", unsafe_allow_html=True)
+                search_btn = st.button("🔍 Search", use_container_width=True)
+        
+        if customer_id_input and customer_id_input != "":
+            st.markdown("---")
+            
+            # Initialize variables
+            customer_data = None
+            cust = None
+            
+            # Get customer data
+            if customer_df is not None:
+                with timed("customer_lookup_seconds", view="customer_risk"):
+                    customer_data = customer_df[customer_df['customer_id'].astype(str) == customer_id_input]
+                
+                if not customer_data.empty:
+                    cust = customer_data.iloc[0]
+                    
+                    st.markdown(f"#### 👤 Customer Profile: {cust['customer_name']} (ID: {cust['customer_id']})")
+                    
+                    # Customer Overview
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    # Determine risk level and color
+                    risk_score = cust['risk_score_30d']
+                    if risk_score < 0.3:
+                        risk_label = "Very Low Risk ✅"
+                        risk_delta = "Excellent"
+                    elif risk_score < 0.5:
+                        risk_label = "Low Risk ✅"
+                        risk_delta = "Good"
+                    elif risk_score < 0.7:
+                        risk_label = "Medium Risk ⚠️"
+                        risk_delta = "Monitor"
+                    else:
+                        risk_label = "High Risk 🔴"
+                        risk_delta = "Caution"
+                    
+                    with col1:
+                        st.metric("Kee Score (30d)", f"{risk_score:.3f}", risk_label)
+                    with col2:
+                        account_value = cust['account_value']
+                        st.metric("Account Value", f"AED {account_value:,.2f}", f"{cust['risk_level_30d']}")
+                    with col3:
+                        active_months = int(cust['active_months'])
+                        st.metric("Active Months", f"{active_months}/36", f"{(active_months/36*100):.0f}% Active")
+                    with col4:
+                        # Recommended credit limit (shared rule with the assistant)
+                        recommended_limit = float(credit_limit(risk_score, account_value))
+                        st.metric("Credit Limit", f"AED {recommended_limit:,.0f}", "Recommended")
+                    
+                    # Portfolio percentiles from the store's quantile sketches
+                    store = get_current_store()
+                    pcts = [float(store.percentile(col, float(cust[col]))) for col in SKETCH_COLUMNS]
+                    position = pd.DataFrame({
+                        "Metric": [COLUMN_LABELS[col] for col in SKETCH_COLUMNS],
+                        "Value": [format_value(col, cust[col]) for col in SKETCH_COLUMNS],
+                        "Portfolio Percentile": [f"p{pct:.0f}" for pct in pcts],
+                        "Position": [percentile_label(pct) for pct in pcts],
+                    })
+                    st.markdown("#### 📍 Portfolio Position")
+                    st.dataframe(position, use_container_width=True, hide_index=True)
+                else:
+                    st.warning(f"Customer ID {customer_id_input} not found in database.")
+                    st.stop()
+            else:
+                st.markdown("#### 👤 Customer Profile: Sample Customer")
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Kee Score", "N/A", "Data not available")
+                with col2:
+                    st.metric("Total GMV", "N/A", "")
+                with col3:
+                    st.metric("Active Months", "N/A", "")
+                with col4:
+                    st.metric("Credit Limit", "N/A", "")
+            
+            st.markdown("---")
+            
+            # Detailed Metrics
+            if customer_df is not None and customer_data is not None and not customer_data.empty:
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("#### 📊 Financial Metrics")
+                    
+                    # Calculate monthly average
+                    monthly_avg = cust['account_value'] / max(cust['active_months'], 1) if cust['active_months'] > 0 else 0
+                    
+                    # Volatility status
+                    vol_status = "✅" if cust['volatility'] < 0.3 else ("⚠️" if cust['volatility'] < 0.6 else "🔴")
+                    vol_label = "Stable" if cust['volatility'] < 0.3 else ("Moderate" if cust['volatility'] < 0.6 else "Volatile")
+                    
+                    # Days since last order status
+                    days_status = "✅" if cust['days_since_last_order'] < 30 else ("⚠️" if cust['days_since_last_order'] < 90 else "🔴")
+                    
+                    # GMV slope status
+                    slope_status = "✅" if cust['gmv_slope'] > 100 else ("⚠️" if cust['gmv_slope'] > 0 else "🔴")
+                    slope_label = f"+{cust['gmv_slope']:.1f}%" if cust['gmv_slope'] > 0 else f"{cust['gmv_slope']:.1f}%"
+                    
+                    financial = pd.DataFrame({
+                        "Metric": [
+                            "Account Value", "Monthly Average",
+                            "Active Months", "GMV Growth Rate",
+                            "Volatility Score", "Days Since Last Order"
+                        ],
+                        "Value": [
+                            f"AED {cust['account_value']:,.2f}",
+                            f"AED {monthly_avg:,.2f}",
+                            f"{int(cust['active_months'])}/36",
+                            slope_label,
+                            f"{cust['volatility']:.3f} ({vol_label})",
+                            f"{int(cust['days_since_last_order'])} days"
+                        ],
+                        "Status": [
+                            "✅" if cust['account_value'] > 1000 else "⚠️",
+                            "✅" if monthly_avg > 100 else "⚠️",
+                            "✅" if cust['active_months'] > 12 else "⚠️",
+                            slope_status,
+                            vol_status,
+                            days_status
+                        ]
+                    })
+                    st.dataframe(financial, use_container_width=True, hide_index=True)
+                
+                with col2:
+                    st.markdown("#### 📈 Risk Trend Analysis")
+                    
+                    # Kee scores over time
+                    risk_trend = pd.DataFrame({
+                        "Period": ["30 Days", "60 Days", "90 Days"],
+                        "Kee Score": [
+                            f"{cust['risk_score_30d']:.3f}",
+                            f"{cust['risk_score_60d']:.3f}",
+                            f"{cust['risk_score_90d']:.3f}"
+                        ],
+                        "Risk Level": [
+                            cust['risk_level_30d'],
+                            "Medium" if cust['risk_score_60d'] > 0.5 else "Low",
+                            "High" if cust['risk_score_90d'] > 0.7 else ("Medium" if cust['risk_score_90d'] > 0.5 else "Low")
+                        ],
+                        "Trend": [
+                            "→",
+                            "↑" if cust['risk_score_60d'] > cust['risk_score_30d'] else "↓",
+                            "↑" if cust['risk_score_90d'] > cust['risk_score_60d'] else "↓"
+                        ]
+                    })
+                    st.dataframe(risk_trend, use_container_width=True, hide_index=True)
+                    
+                    # Kee scores across the stored daily snapshots (snapshot_store.py)
+                    history = get_history(cust['customer_id'], HISTORY_COLUMNS)
+                    if history is not None and len(history) > 1:
+                        st.caption(f"📅 Kee scores over the last {HISTORY_DAYS} days "
+                                   f"({len(history)} snapshots)")
+                        trend = history.assign(date=pd.to_datetime(history["date"])).set_index("date")
+                        st.line_chart(trend[HISTORY_COLUMNS].rename(columns=COLUMN_LABELS))
+                    
+                    # Additional context
+                    st.markdown("**Intervention Status:**")
+                    if pd.notna(cust['intervention_status']) and cust['intervention_status']:
+                        st.info(f"📋 {cust['intervention_status']}")
+                    else:
+                        st.success("✅ No intervention required")
+            else:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("#### 📊 Financial Metrics")
+                    st.info("Data not available")
+                with col2:
+                    st.markdown("#### 🏦 External Data")
+                    st.info("Data not available")
+            
+            st.markdown("---")
+            
+            # Risk Factors
+            if customer_df is not None and customer_data is not None and not customer_data.empty:
+                st.markdown("#### 🎯 Key Risk Factors Analysis")
+                
+                # Analyze key factors (shared rules with the assistant's comparison)
+                factors = risk_factors({col: [float(cust[col])] for col in FACTOR_COLUMNS})
+                factors["Impact"] = factors["Impact"].map("{:+.2f}".format)
+                risk_factors_df = factors[["Feature", "Impact", "Effect", "Status"]]
+                st.dataframe(risk_factors_df, use_container_width=True, hide_index=True)
+                
+                st.markdown("---")
+                
+                # Recommendation based on Kee score
+                if risk_score < 0.3:
+                    st.markdown(f"""
+                    <div style='background: #d4edda; padding: 20px; border-radius: 10px; border-left: 4px solid #28a745;'>
+                        <h4 style='color: #155724; margin: 0 0 10px 0;'>✅ Credit Decision: APPROVED</h4>
+                        <p style='color: #155724; margin: 0;'><strong>Recommended Credit Limit:</strong> AED {recommended_limit:,.0f}</p>
+                        <p style='color: #155724; margin: 10px 0 0 0;'><strong>Rationale:</strong> Excellent customer with low Kee score ({risk_score:.3f}), {int(cust['active_months'])} active months, and account value of AED {cust['account_value']:,.2f}. Strong candidate for credit extension.</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                elif risk_score < 0.5:
+                    st.markdown(f"""
+                    <div style='background: #d4edda; padding: 20px; border-radius: 10px; border-left: 4px solid #28a745;'>
+                        <h4 style='color: #155724; margin: 0 0 10px 0;'>✅ Credit Decision: APPROVED (with conditions)</h4>
+                        <p style='color: #155724; margin: 0;'><strong>Recommended Credit Limit:</strong> AED {recommended_limit:,.0f}</p>
+                        <p style='color: #155724; margin: 10px 0 0 0;'><strong>Rationale:</strong> Good customer with acceptable Kee score ({risk_score:.3f}). Recommend standard credit terms with regular monitoring.</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                elif risk_score < 0.7:
+                    st.markdown(f"""
+                    <div style='background: #fff3cd; padding: 20px; border-radius: 10px; border-left: 4px solid #ffc107;'>
+                        <h4 style='color: #856404; margin: 0 0 10px 0;'>⚠️ Credit Decision: CONDITIONAL APPROVAL</h4>
+                        <p style='color: #856404; margin: 0;'><strong>Recommended Credit Limit:</strong> AED {recommended_limit:,.0f}</p>
+                        <p style='color: #856404; margin: 10px 0 0 0;'><strong>Rationale:</strong> Medium risk customer (score: {risk_score:.3f}). Recommend limited credit with enhanced monitoring and possible collateral requirements.</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown(f"""
+                    <div style='background: #f8d7da; padding: 20px; border-radius: 10px; border-left: 4px solid #dc3545;'>
+                        <h4 style='color: #721c24; margin: 0 0 10px 0;'>🔴 Credit Decision: DECLINED</h4>
+                        <p style='color: #721c24; margin: 0;'><strong>Maximum Credit Limit:</strong> AED {recommended_limit:,.0f} (if approved)</p>
+                        <p style='color: #721c24; margin: 10px 0 0 0;'><strong>Rationale:</strong> High risk customer (score: {risk_score:.3f}). Recommend declining credit or requiring substantial collateral and guarantees. Close monitoring required if approved.</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+            else:
+                st.info("Risk analysis not available")
+        
+        else:
+            st.markdown("---")
+            st.markdown("#### 📊 Customer Segments")
+            
+            store = get_current_store()
+            segmentation = get_segmentation(store.data_version, store)
+            summary = segmentation.summary
+            segments = pd.DataFrame({
+                "Segment": summary["Segment"],
+                "Count": summary["Count"].map("{:,}".format),
+                "Share": summary["Share"].map("{:.1%}".format),
+                "Exposure": summary["Exposure"].map(format_aed),
+                "Avg GMV": [format_aed(v) if pd.notna(v) else "-" for v in summary["Avg Account Value"]],
+                "Avg Kee Score": [f"{v:.2f}" if pd.notna(v) else "-" for v in summary["Avg Kee Score"]],
+                "Recommended Action": summary["Recommended Action"],
+            })
+            st.dataframe(segments, use_container_width=True, hide_index=True)
+            
+            # Drill-down: members come from the cached row-id arrays / bitmaps
+            st.markdown("#### 🔎 Segment Drill-Down")
+            col1, col2, col3 = st.columns([2, 2, 1])
+            with col1:
+                segment = st.selectbox("Segment", SEGMENT_NAMES, key="segment_drilldown")
+            with col2:
+                sort_label = st.selectbox("Sort by", list(DRILLDOWN_SORTS), key="segment_sort")
+            with col3:
+                st.markdown("<br>", unsafe_allow_html=True)
+                exclude_zero = st.checkbox("Exclude zero value", key="segment_exclude_zero")
+            
+            members = segmentation.bitmaps[segment]
+            if exclude_zero:
+                members = members - store.bitmaps.get("zero_value")
+            column, largest = DRILLDOWN_SORTS[sort_label]
+            top = top_k(store.column(column), DRILLDOWN_ROWS, members.rows(), largest)
+            risk = store.column("risk_score_30d")[top]
+            account = store.column("account_value")[top]
+            drilldown = pd.DataFrame({
+                "Customer ID": store.ids[top],
+                "Customer": store.names[top],
+                "Kee Score": [f"{v:.3f}" for v in risk],
+                "Account Value": [format_aed(v) for v in account],
+                "Days Since Last Order": store.column("days_since_last_order")[top].astype(int),
+                "GMV Slope": [f"{v:+,.1f}" for v in store.column("gmv_slope")[top]],
+                "Recommended Limit": [format_aed(v) for v in credit_limit(risk, account)],
+            })
+            st.caption(f"{segment}: showing {len(top)} of {members.count():,} customers")
+            st.dataframe(drilldown, use_container_width=True, hide_index=True)
+    
+    elif dashboard_type == "💼 Credit Officer Dashboard":
+        # Heavy module (plotly, SHAP helpers) - only imported when first opened
+        from credit_officer_enhanced_section import render_credit_officer_dashboard
+        render_credit_officer_dashboard()
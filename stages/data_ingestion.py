@@ -0,0 +1,239 @@
+"""
+Stage 1: Multi-source data ingestion
+"""
+
+import streamlit as st
+import pandas as pd
+
+from ingestion import get_current_ingestion, report_frame
+
+
+def render():
+    """Render the 1. Data Ingestion stage"""
+    st.markdown('<div class="stage-header">📥 Stage 1: Data Ingestion</div>', unsafe_allow_html=True)
+    st.markdown("### Multi-Source Data Integration Pipeline")
+    
+    # Data sources overview
+    st.markdown("#### 📊 Data Sources")
+    
+    # Local source files, read concurrently with declared schemas into ingested/ (ingestion.py)
+    reports, wall = get_current_ingestion()
+    report = report_frame(reports)
+    stored = sum(r.status == "ok" for r in reports)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        sources_data = report[["Source", "Records", "Status"]].assign(
+            Records=[f"{r.rows:,}" if r.status == "ok" else "-" for r in reports]
+        )
+        st.dataframe(sources_data, use_container_width=True, hide_index=True)
+    
+    with col2:
+        st.markdown("**⏱️ Ingestion Timing**")
+        if stored:
+            timing = report[["Source", "Columns"]].assign(
+                **{"Size (MB)": report["Size (MB)"].map("{:.1f}".format),
+                   "Seconds": report["Seconds"].map("{:.3f}".format),
+                   "Rows/sec": report["Rows/sec"].map("{:,.0f}".format)}
+            )
+            st.dataframe(timing, use_container_width=True, hide_index=True)
+            busy = sum(r.seconds for r in reports)
+            st.caption(f"{stored} of {len(reports)} sources in {wall:.2f}s wall time "
+                       f"({busy:.2f}s across {len(reports)} parallel readers)")
+        else:
+            st.info("No source files found in data/. Run `python ingestion.py --write-samples` "
+                    "to create sample files, or set KEE_INGEST_DIR.")
+        problems = [r for r in reports if r.status not in ("ok", "missing")]
+        for r in problems:
+            st.warning(f"{r.title}: {r.status} - {r.error}")
+    
+    # with col2:
+    #     # Data source pie chart
+    #     fig = go.Figure(data=[go.Pie(
+    #         labels=["Distribution Partner", "Payment Partner", "Bank", "AECB"],
+    #         values=[4525, 4525, 3200, 4100],
+    #         hole=0.4,
+    #         marker_colors=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
+    #     )])
+    #     fig.update_layout(title="Data Source Coverage", height=300)
+    #     st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Detailed data source information
+    st.markdown("#### 📋 Data Source Details")
+    
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["🏢 Distribution Partner Data", "💳 Payment Partner", "🏦 Bank Transactions", "📊 AECB Data", "🏢 LOS Data", "⚡ Dewa Bills"])
+    
+    with tab1:
+        st.markdown("**Distribution Partner Transactional Data**")
+        st.markdown("""
+        - **Source**: Internal transaction database
+        - **Records**: 4,525 unique customers
+        - **Time Period**: Last 36 months
+        - **Key Fields**:
+          - Customer ID, Outlet Name
+          - Order history (dates, amounts, SKUs)
+          - GMV (Gross Merchandise Value)
+          - Order frequency and recency
+          - Product categories and diversity
+        - **Update Frequency**: Real-time
+        - **Data Quality**: 99.8% complete
+        """)
+        
+        # conektr_metrics = {
+        #     "Metric": ["Total Customers", "Total Orders", "Total GMV", "Avg Orders/Customer", "Data Completeness"],
+        #     "Value": ["4,525", "125,430", "AED 58.4M", "27.7", "99.8%"]
+        # }
+        # st.dataframe(pd.DataFrame(conektr_metrics), use_container_width=True, hide_index=True)
+    
+    with tab2:
+        st.markdown("**Payment Partner (Kee Score & Payment Intelligence)**")
+        st.markdown("""
+        - **Source**: Payment Partner API integration
+        - **Records**: 4,525 customers (matched)
+        - **Key Fields**:
+          - Payment behavior scores
+          - Transaction velocity indicators
+          - Fraud risk indicators
+          - Spending patterns
+          - Credit utilization metrics
+        - **Update Frequency**: Weekly
+        - **Match Rate**: 100% (all Distribution Partner customers matched)
+        """)
+        
+        # mc_metrics = {
+        #     "Metric": ["Matched Customers", "Avg Kee Score", "High Risk %", "Medium Risk %", "Low Risk %"],
+        #     "Value": ["4,525", "72.3/100", "8.2%", "23.5%", "68.3%"]
+        # }
+        # st.dataframe(pd.DataFrame(mc_metrics), use_container_width=True, hide_index=True)
+    
+    with tab3:
+        st.markdown("**Bank Transaction Data**")
+        st.markdown("""
+        - **Source**: Bank statement parsing (PDF/CSV)
+        - **Records**: 3,200 customers (70.7% coverage)
+        - **Time Period**: Last 12 months
+        - **Key Fields**:
+          - Account balance trends
+          - Cash flow patterns
+          - Income stability
+          - Expense categories
+          - Bounce/NSF incidents
+        - **Update Frequency**: Monthly
+        - **Data Quality**: 95.2% complete
+        """)
+        
+        # bank_metrics = {
+        #     "Metric": ["Customers with Data", "Avg Monthly Balance", "Avg Monthly Income", "Bounce Rate", "Coverage"],
+        #     "Value": ["3,200", "AED 45,230", "AED 12,450", "2.3%", "70.7%"]
+        # }
+        # st.dataframe(pd.DataFrame(bank_metrics), use_container_width=True, hide_index=True)
+    
+    with tab4:
+        st.markdown("**AECB (Al Etihad Credit Bureau) Data**")
+        st.markdown("""
+        - **Source**: AECB API integration
+        - **Records**: 4,100 customers (90.6% coverage)
+        - **Key Fields**:
+          - Credit score
+          - Credit history length
+          - Active loans and credit cards
+          - Payment history
+          - Delinquency records
+          - Credit inquiries
+        - **Update Frequency**: Monthly
+        - **Match Rate**: 90.6%
+        """)
+        
+        # aecb_metrics = {
+        #     "Metric": ["Customers with Data", "Avg Credit Score", "Active Loans %", "Delinquency Rate", "Coverage"],
+        #     "Value": ["4,100", "685", "45.2%", "5.8%", "90.6%"]
+        # }
+        # st.dataframe(pd.DataFrame(aecb_metrics), use_container_width=True, hide_index=True)
+    
+    with tab5:
+        st.markdown("**LOS (Loan Origination System) Data**")
+        st.markdown("""
+        - **Source**: Internal LOS system integration
+        - **Records**: 4,200 loan applications (matched)
+        - **Key Fields**:
+          - Loan amount requested and approved
+          - Employment details and tenure
+          - Monthly income and obligations
+          - Loan purpose and risk category
+          - Collateral and guarantor information
+          - Application status and decision timeline
+        - **Update Frequency**: Real-time
+        - **Match Rate**: 92.8% (4,200 out of 4,525 customers)
+        """)
+        # los_metrics = {
+        #     "Metric": ["Matched Customers", "Avg Loan Amount", "Approval Rate", "Avg Income", "Employment Rate"],
+        #     "Value": ["4,200", "AED 125K", "68%", "AED 8,500", "94%"]
+        # }
+        # st.dataframe(pd.DataFrame(los_metrics), use_container_width=True, hide_index=True)
+    
+    with tab6:
+        st.markdown("**Dewa Bills (Utility Payment History)**")
+        st.markdown("""
+        - **Source**: DEWA API integration
+        - **Records**: 3,800 customers (matched)
+        - **Key Fields**:
+          - Monthly electricity bill amounts
+          - Payment consistency and timeliness
+          - Late payment incidents and patterns
+          - Account age and history length
+          - Seasonal consumption patterns
+          - Disconnection/reconnection history
+        - **Update Frequency**: Monthly
+        - **Match Rate**: 84.0% (3,800 out of 4,525 customers)
+        """)
+        # dewa_metrics = {
+        #     "Metric": ["Matched Customers", "Avg Monthly Bill", "Payment Rate", "Late Payments", "Avg Account Age"],
+        #     "Value": ["3,800", "AED 285", "96.5%", "2.1%", "4.2 years"]
+        # }
+        # st.dataframe(pd.DataFrame(dewa_metrics), use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Data integration process
+    st.markdown("#### 🔄 Data Integration Process")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**Integration Steps**")
+        st.markdown("""
+        1. **Extract**: Pull data from 6 sources
+        2. **Transform**: Standardize formats and schemas
+        3. **Match**: Link records using customer IDs
+        4. **Validate**: Check data quality and completeness
+        5. **Load**: Store in unified data warehouse
+        6. **Audit**: Log all transformations
+        """)
+    
+    with col2:
+        st.markdown("**Data Quality Checks**")
+        st.markdown("""
+        - ✅ Duplicate detection and removal
+        - ✅ Missing value imputation
+        - ✅ Outlier detection and handling
+        - ✅ Schema validation
+        - ✅ Referential integrity checks
+        - ✅ Temporal consistency validation
+        """)
+    
+    # Final unified dataset
+    st.markdown("---")
+    st.markdown("#### 📦 Unified Dataset")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Customers", "4,525")
+    with col2:
+        st.metric("Total Fields", "156")
+    with col3:
+        st.metric("Data Completeness", "96.8%")
+    # with col4:
+    #     st.metric("Processing Time", "2 hours")
@@ -0,0 +1,179 @@
+"""
+Stage 2: Exploratory data analysis and data profiling
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.express as px
+import numpy as np
+
+from figure_cache import cached_figure
+
+
+def render():
+    """Render the 2. EDA & Data Profiling stage"""
+    st.markdown('<div class="stage-header">📊 Stage 2: EDA & Data Profiling</div>', unsafe_allow_html=True)
+    st.markdown("### Exploratory Data Analysis & Quality Assessment")
+    
+    # Data profile summary
+    st.markdown("#### 📋 Data Profile Summary")
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("Customers", "4,525")
+    with col2:
+        st.metric("Features", "156")
+    with col3:
+        st.metric("Completeness", "96.8%")
+    with col4:
+        st.metric("Outliers", "3.2%")
+    with col5:
+        st.metric("Duplicates", "0")
+    
+    st.markdown("---")
+    
+    # Key distributions
+    st.markdown("#### 📈 Key Data Distributions")
+    
+    tab1, tab3, tab4 = st.tabs(["GMV Distribution",  "Customer Segments", "Temporal Patterns"])
+    
+    with tab1:
+        # GMV distribution (seeded so the chart is stable across reruns)
+        gmv_data = np.random.default_rng(42).lognormal(9, 1.5, 4525)
+        
+        def build_gmv_histogram():
+            fig = px.histogram(x=gmv_data, nbins=50, title="Customer GMV Distribution")
+            fig.update_layout(
+                xaxis_title="GMV (AED)", 
+                yaxis_title="Number of Customers", 
+                height=400,
+                showlegend=False
+            )
+            return fig
+        
+        fig = cached_figure("eda_gmv_histogram", build_gmv_histogram, gmv_data, nbins=50, height=400)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Mean GMV", "AED 12,912")
+        with col2:
+            st.metric("Median GMV", "AED 1,606")
+        with col3:
+            st.metric("Max GMV", "AED 1.9M")
+    
+    # with tab2:
+    #     # Risk categories
+    #     risk_data = pd.DataFrame({
+    #         "Risk Category": ["Very Low Risk", "Low Risk", "Medium Risk", "High Risk", "Very High Risk"],
+    #         "Count": [3210, 845, 320, 115, 35],
+    #         "Percentage": [70.9, 18.7, 7.1, 2.5, 0.8]
+    #     })
+        
+    #     fig = px.bar(risk_data, x="Risk Category", y="Count", 
+    #                  title="Risk Category Distribution",
+    #                  color="Risk Category",
+    #                  color_discrete_map={
+    #                      "Very Low Risk": "#28a745",
+    #                      "Low Risk": "#90ee90",
+    #                      "Medium Risk": "#ffc107",
+    #                      "High Risk": "#ff7f0e",
+    #                      "Very High Risk": "#dc3545"
+    #                  })
+    #     fig.update_layout(height=400)
+    #     st.plotly_chart(fig, use_container_width=True)
+        
+    #     st.dataframe(risk_data, use_container_width=True, hide_index=True)
+    
+    with tab3:
+        # Customer segments
+        segment_data = pd.DataFrame({
+            "Segment": ["Premium", "Standard", "Growing", "At-Risk", "Inactive"],
+            "Count": [450, 2100, 1200, 650, 125],
+            "Avg GMV": [85000, 15000, 8000, 5000, 2000]
+        })
+        
+        def build_segment_pie():
+            fig = px.pie(segment_data, values="Count", names="Segment", 
+                         title="Customer Segmentation",
+                         hole=0.4)
+            fig.update_layout(height=500)
+            return fig
+        
+        fig = cached_figure("eda_segment_pie", build_segment_pie, segment_data, hole=0.4, height=500)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.dataframe(segment_data, use_container_width=True, hide_index=True)
+    
+    with tab4:
+        # Temporal patterns
+        months = pd.date_range('2022-01-01', '2025-06-01', freq='M')
+        orders = np.random.default_rng(42).poisson(3500, len(months)) + np.linspace(3000, 4500, len(months))
+        
+        def build_order_trend():
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=months, y=orders, mode='lines+markers', name='Monthly Orders'))
+            fig.update_layout(title="Order Volume Trend", xaxis_title="Month", yaxis_title="Orders", height=400)
+            return fig
+        
+        fig = cached_figure("eda_order_trend", build_order_trend, months, orders, height=400)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Data quality metrics
+    st.markdown("#### ✅ Data Quality Metrics")
+    
+    quality_data = {
+        "Metric": [
+            "Completeness",
+            "Accuracy",
+            "Consistency",
+            "Timeliness",
+            "Validity",
+            "Uniqueness"
+        ],
+        "Score": [96.8, 98.2, 97.5, 99.1, 95.8, 100.0],
+        "Status": ["✅ Pass", "✅ Pass", "✅ Pass", "✅ Pass", "✅ Pass", "✅ Pass"],
+        "Issues": [
+            "3.2% missing values",
+            "1.8% potential errors",
+            "2.5% inconsistencies",
+            "0.9% delayed updates",
+            "4.2% invalid formats",
+            "0 duplicates"
+        ]
+    }
+    
+    df_quality = pd.DataFrame(quality_data)
+    st.dataframe(df_quality, use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Key insights
+    # st.markdown("#### 💡 Key Insights from EDA")
+    
+    col1, col2 = st.columns(2)
+    
+    # with col1:
+    #     st.markdown("**Positive Findings**")
+    #     st.markdown("""
+    #     - ✅ 70.9% customers are Very Low Risk
+    #     - ✅ Strong data quality (96.8% complete)
+    #     - ✅ No duplicate records
+    #     - ✅ Clear segmentation patterns
+    #     - ✅ Positive growth trend in orders
+    #     - ✅ High AECB coverage (90.6%)
+    #     """)
+    
+    # with col2:
+    #     st.markdown("**Areas for Improvement**")
+    #     st.markdown("""
+    #     - ⚠️ Bank data coverage at 70.7%
+    #     - ⚠️ High GMV variance (skewed distribution)
+    #     - ⚠️ 3.2% outliers need investigation
+    #     - ⚠️ Some missing AECB scores
+    #     - ⚠️ Seasonal patterns in order volume
+    #     - ⚠️ 125 inactive customers
+    #     """)
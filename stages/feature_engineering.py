@@ -0,0 +1,286 @@
+"""
+Stage 3: Feature engineering and selection
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from figure_cache import cached_figure
+
+
+def render():
+    """Render the 3. Feature Engineering stage"""
+    st.markdown('<div class="stage-header">🔧 Stage 3: Feature Engineering</div>', unsafe_allow_html=True)
+    st.markdown("### Advanced Feature Creation & Selection")
+    
+    # Feature engineering overview
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Raw Features", "156")
+    with col2:
+        st.metric("Engineered Features", "58")
+    with col3:
+        st.metric("Feature Reduction", "62.8%")
+    # with col4:
+    #     st.metric("Model Performance", "+15.7%")
+    
+    st.markdown("---")
+    
+    # Feature categories
+    st.markdown("#### 📊 Feature Categories")
+    
+    feature_categories = pd.DataFrame({
+        "Category": [
+            "Behavioral Features",
+            "Financial Features",
+            "Temporal Features",
+            "Engagement Features",
+            "Stability Features",
+            "Growth Features"
+        ],
+        "Count": [8, 7, 6, 5, 4, 2],
+        "Examples": [
+            "volatility, recency, frequency",
+            "GMV, sales_3m, sales_6m, sales_12m",
+            "days_since_last_order, active_months",
+            "total_orders, order_frequency",
+            "volatility, consistency_score",
+            "gmv_slope, mom_growth_3m"
+        ]
+    })
+    
+    st.dataframe(feature_categories, use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Detailed feature list
+    st.markdown("#### 📋 Complete Feature List (58 Features)")
+    
+    st.markdown("""
+    <div style='background: #f8f9fa; padding: 15px; border-radius: 10px; margin-bottom: 15px;'>
+        <p style='color: #666; margin: 0; font-size: 0.9rem;'>
+            Features engineered from <strong>6 data sources</strong>: Distribution Partner, Payment Partner, 
+            Bank Transactions, AECB Credit Bureau, LOS (Loan Origination), and Dewa Bills
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    features_data = {
+        "Feature Name": [
+            # Distribution Partner Features (12)
+            "volatility", "gmv_slope", "days_since_last_order", "active_months",
+            "total_orders", "total_gmv", "monthly_gmv", "sales_3m",
+            "sales_6m", "sales_12m", "mom_growth_3m", "top3_sku_share",
+            
+            # Payment Partner Features (10)
+            "rspi_risk_score", "payment_velocity", "transaction_frequency", "avg_transaction_amount",
+            "payment_consistency", "fraud_indicator_score", "spending_trend_3m", "credit_utilization_ratio",
+            "payment_method_diversity", "cross_border_txn_ratio",
+            
+            # Bank Transaction Features (10)
+            "avg_monthly_balance", "balance_volatility", "income_stability_score", "cash_flow_ratio",
+            "bounce_rate", "nsf_incidents", "deposit_frequency", "withdrawal_pattern_score",
+            "savings_ratio", "overdraft_frequency",
+            
+            # AECB Credit Bureau Features (10)
+            "aecb_credit_score", "credit_history_length", "active_loans_count", "total_credit_limit",
+            "credit_utilization", "delinquency_count", "payment_history_score", "credit_inquiry_count_6m",
+            "debt_to_income_ratio", "longest_delinquency_days",
+            
+            # LOS (Loan Origination) Features (8)
+            "loan_amount_requested", "loan_purpose_risk_score", "employment_tenure_months", "monthly_income",
+            "existing_obligations", "loan_to_income_ratio", "collateral_value", "guarantor_score",
+            
+            # Dewa Bills Features (5)
+            "avg_monthly_dewa_bill", "dewa_payment_consistency", "dewa_bill_trend", "late_payment_count_dewa",
+            "dewa_account_age_months",
+            
+            # Derived & Interaction Features (3)
+            "multi_source_risk_score", "financial_health_index", "risk_indicator"
+        ],
+        "Data Source": [
+            # Distribution Partner
+            "Distribution Partner", "Distribution Partner", "Distribution Partner", "Distribution Partner",
+            "Distribution Partner", "Distribution Partner", "Distribution Partner", "Distribution Partner",
+            "Distribution Partner", "Distribution Partner", "Distribution Partner", "Distribution Partner",
+            
+            # Payment Partner (RSPI)
+            "Payment Partner", "Payment Partner", "Payment Partner", "Payment Partner",
+            "Payment Partner", "Payment Partner", "Payment Partner", "Payment Partner",
+            "Payment Partner", "Payment Partner",
+            
+            # Bank
+            "Bank", "Bank", "Bank", "Bank",
+            "Bank", "Bank", "Bank", "Bank",
+            "Bank", "Bank",
+            
+            # AECB
+            "AECB", "AECB", "AECB", "AECB",
+            "AECB", "AECB", "AECB", "AECB",
+            "AECB", "AECB",
+            
+            # LOS
+            "LOS", "LOS", "LOS", "LOS",
+            "LOS", "LOS", "LOS", "LOS",
+            
+            # Dewa
+            "Dewa Bills", "Dewa Bills", "Dewa Bills", "Dewa Bills",
+            "Dewa Bills",
+            
+            # Derived
+            "Multi-Source", "Multi-Source", "Target"
+        ],
+        "Type": [
+            # Distribution Partner
+            "Behavioral", "Growth", "Temporal", "Engagement",
+            "Engagement", "Financial", "Financial", "Financial",
+            "Financial", "Financial", "Growth", "Behavioral",
+            
+            # Payment Partner
+            "Kee Score", "Behavioral", "Engagement", "Financial",
+            "Stability", "Kee Score", "Growth", "Financial",
+            "Behavioral", "Behavioral",
+            
+            # Bank
+            "Financial", "Stability", "Financial", "Financial",
+            "Risk Indicator", "Risk Indicator", "Behavioral", "Behavioral",
+            "Financial", "Risk Indicator",
+            
+            # AECB
+            "Credit Score", "Temporal", "Financial", "Financial",
+            "Financial", "Risk Indicator", "Credit Score", "Behavioral",
+            "Financial", "Risk Indicator",
+            
+            # LOS
+            "Financial", "Kee Score", "Temporal", "Financial",
+            "Financial", "Financial", "Financial", "Kee Score",
+            
+            # Dewa
+            "Financial", "Stability", "Growth", "Risk Indicator",
+            "Temporal",
+            
+            # Derived
+            "Composite", "Composite", "Target"
+        ],
+        "Importance": [
+            # Distribution Partner
+            "High", "High", "High", "Medium",
+            "Medium", "High", "High", "High",
+            "High", "Medium", "Medium", "Medium",
+            
+            # Payment Partner
+            "Very High", "High", "High", "Medium",
+            "High", "High", "Medium", "High",
+            "Medium", "Low",
+            
+            # Bank
+            "High", "High", "High", "High",
+            "Very High", "Very High", "Medium", "Medium",
+            "Medium", "High",
+            
+            # AECB
+            "Very High", "High", "High", "Medium",
+            "Very High", "Very High", "High", "Medium",
+            "Very High", "High",
+            
+            # LOS
+            "High", "High", "Medium", "Very High",
+            "High", "Very High", "Medium", "Medium",
+            
+            # Dewa
+            "Medium", "High", "Low", "High",
+            "Low",
+            
+            # Derived
+            "Very High", "Very High", "Target"
+        ]
+    }
+    
+    df_features = pd.DataFrame(features_data)
+    
+    # Filter by category
+    category_filter = st.selectbox(
+        "Filter by Category",
+        ["All"] + list(df_features["Type"].unique())
+    )
+    
+    if category_filter != "All":
+        df_filtered = df_features[df_features["Type"] == category_filter]
+    else:
+        df_filtered = df_features
+    
+    st.dataframe(df_filtered, use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Feature importance
+    st.markdown("#### 🎯 Top 15 Most Important Features")
+    
+    importance_data = pd.DataFrame({
+        "Rank": range(1, 16),
+        "Feature": [
+            "volatility", "days_since_last_order", "gmv_slope", "sales_12m",
+            "sales_6m", "sales_3m", "monthly_gmv", "active_months",
+            "consistency_score", "recency_score", "total_orders", "mom_growth_3m",
+            "engagement_score", "order_frequency", "top3_sku_share"
+        ],
+        "Importance Score": [
+            0.156, 0.142, 0.128, 0.115,
+            0.098, 0.087, 0.076, 0.065,
+            0.054, 0.048, 0.042, 0.038,
+            0.035, 0.031, 0.028
+        ],
+        "Impact": [
+            "↑ Higher = Higher Risk", "↑ Higher = Higher Risk", "↑ Higher = Lower Risk",
+            "↑ Higher = Lower Risk", "↑ Higher = Lower Risk", "↑ Higher = Lower Risk",
+            "↑ Higher = Lower Risk", "↑ Higher = Lower Risk", "↑ Higher = Lower Risk",
+            "↑ Higher = Lower Risk", "↑ Higher = Lower Risk", "↑ Higher = Lower Risk",
+            "↑ Higher = Lower Risk", "↑ Higher = Lower Risk", "↑ Higher = Lower Risk"
+        ]
+    })
+    
+    def build_importance_bar():
+        fig = px.bar(importance_data, x="Importance Score", y="Feature", 
+                     orientation='h', title="Feature Importance Ranking",
+                     color="Importance Score", color_continuous_scale="Blues")
+        fig.update_layout(height=500, yaxis={'categoryorder':'total ascending'})
+        return fig
+    
+    fig = cached_figure("feature_importance_bar", build_importance_bar, importance_data, height=500)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    st.dataframe(importance_data, use_container_width=True, hide_index=True)
+    
+    # st.markdown("---")
+    
+    # Feature engineering techniques
+    # st.markdown("#### 🛠️ Feature Engineering Techniques Applied")
+    
+    # col1, col2 = st.columns(2)
+    
+    # with col1:
+    #     st.markdown("**Transformation Techniques**")
+    #     st.markdown("""
+    #     1. **Log Transformation**: For skewed distributions
+    #        - `sales_3m_log = log(1 + sales_3m)`
+    #     2. **Polynomial Features**: Capture non-linear relationships
+    #        - `gmv_slope_squared = gmv_slope²`
+    #     3. **Interaction Features**: Combine related features
+    #        - `volatility_x_recency = volatility * days_since_last_order`
+    #     4. **Normalization**: Scale features to [0, 1]
+    #        - StandardScaler for all numeric features
+    #     5. **Binning**: Discretize continuous variables
+    #        - Risk categories from continuous scores
+    #     """)
+    
+    # with col2:
+    #     st.markdown("**Domain-Specific Features**")
+    #     st.markdown("""
+    #     1. **Recency Score**: `1 / (1 + days_since_last_order)`
+    #     2. **Consistency Score**: `1 - volatility`
+    #     3. **Engagement Score**: Composite of orders, frequency, recency
+    #     4. **Growth Score**: Weighted average of MoM growth rates
+    #     5. **Volatility**: `Std(orders) / Mean(orders)`
+    #     6. **GMV Slope**: Linear regression coefficient
+    #     """)
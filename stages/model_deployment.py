@@ -0,0 +1,287 @@
+"""
+Stage 5: Model deployment and serving
+"""
+
+import streamlit as st
+import pandas as pd
+
+
+def render():
+    """Render the 5. Model Deployment stage"""
+    st.markdown('<div class="stage-header">🚀 Stage 5: Model Deployment</div>', unsafe_allow_html=True)
+    
+    # Professional header with description
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
+        <h3 style='color: white; margin: 0 0 10px 0;'>Production Deployment & Serving Infrastructure</h3>
+        <p style='color: #f0f0f0; margin: 0; font-size: 0.95rem;'>Enterprise-grade ML deployment with real-time and batch prediction capabilities</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Key metrics with enhanced styling
+    st.markdown("#### 📊 Deployment Metrics")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown("""
+        <div style='background: #e3f2fd; padding: 20px; border-radius: 10px; border-left: 4px solid #2196F3;'>
+            <p style='color: #666; margin: 0; font-size: 0.85rem;'>Deployment Type</p>
+            <h2 style='color: #2196F3; margin: 5px 0 0 0;'>REST API + Batch</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown("""
+        <div style='background: #e8f5e9; padding: 20px; border-radius: 10px; border-left: 4px solid #4CAF50;'>
+            <p style='color: #666; margin: 0; font-size: 0.85rem;'>Avg Latency</p>
+            <h2 style='color: #4CAF50; margin: 5px 0 0 0;'>< 100ms</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown("""
+        <div style='background: #fff3e0; padding: 20px; border-radius: 10px; border-left: 4px solid #FF9800;'>
+            <p style='color: #666; margin: 0; font-size: 0.85rem;'>Throughput</p>
+            <h2 style='color: #FF9800; margin: 5px 0 0 0;'>1000 req/s</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    with col4:
+        st.markdown("""
+        <div style='background: #f3e5f5; padding: 20px; border-radius: 10px; border-left: 4px solid #9C27B0;'>
+            <p style='color: #666; margin: 0; font-size: 0.85rem;'>Uptime SLA</p>
+            <h2 style='color: #9C27B0; margin: 5px 0 0 0;'>99.9%</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Deployment Architecture with professional cards
+    # st.markdown("#### 🏗️ Deployment Architecture")
+    
+    # # Architecture layers
+    # arch_layers = [
+    #     ("🌐 Client Layer", "Web Dashboard • Mobile App • Credit Officer Portal", "#e3f2fd", "#2196F3"),
+    #     ("🔐 API Gateway", "Authentication • Rate Limiting • Load Balancing • Logging", "#fff3e0", "#FF9800"),
+    #     ("⚡ Serving Layer", "Real-time API (Flask) • Batch Pipeline (Airflow)", "#e8f5e9", "#4CAF50"),
+    #     ("🤖 Model Layer", "MLflow Registry • Version Control • A/B Testing", "#f3e5f5", "#9C27B0"),
+    #     ("💾 Data Layer", "Feature Store (Delta Lake) • Caching (Redis)", "#e1f5fe", "#03A9F4"),
+    #     ("📊 Monitoring", "Prometheus • Grafana • Alerting • Logging", "#fce4ec", "#E91E63")
+    # ]
+    
+    # for title, desc, bg_color, border_color in arch_layers:
+    #     st.markdown(f"""
+    #     <div style='background: {bg_color}; padding: 15px 20px; border-radius: 8px; border-left: 4px solid {border_color}; margin-bottom: 10px;'>
+    #         <h4 style='color: {border_color}; margin: 0 0 5px 0; font-size: 1.1rem;'>{title}</h4>
+    #         <p style='color: #666; margin: 0; font-size: 0.9rem;'>{desc}</p>
+    #     </div>
+    #     """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Deployment modes with enhanced tabs
+    st.markdown("#### 🔄 Deployment Modes")
+    
+    tab1, tab2 = st.tabs(["⚡ Real-time API", "📦 Batch Processing"])
+    
+    with tab1:
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            st.markdown("""
+            <div style='background: #f8f9fa; padding: 20px; border-radius: 10px; height: 100%;'>
+                <h4 style='color: #2196F3; margin-top: 0;'>🎯 Real-time Prediction API</h4>
+                <p style='color: #666; font-size: 0.9rem;'><strong>Endpoint:</strong> <code>POST /api/v1/predict</code></p>
+                <p style='color: #666; font-size: 0.9rem;'><strong>Authentication:</strong> Bearer Token (JWT)</p>
+                <p style='color: #666; font-size: 0.9rem;'><strong>Rate Limit:</strong> 1000 requests/minute</p>
+                <p style='color: #666; font-size: 0.9rem;'><strong>Response Time:</strong> < 100ms (P95)</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("**Request Example:**")
+            st.code("""
+{
+  "customer_id": "12345",
+  "features": {
+    "volatility": 0.25,
+    "days_since_last_order": 5,
+    "gmv_slope": 1234.5,
+    "sales_12m": 50000
+  }
+}
+            """, language="json")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Performance metrics
+        perf_col1, perf_col2, perf_col3, perf_col4 = st.columns(4)
+        with perf_col1:
+            st.metric("Avg Latency", "85ms", "-5ms")
+        with perf_col2:
+            st.metric("P95 Latency", "120ms", "-8ms")
+        with perf_col3:
+            st.metric("P99 Latency", "180ms", "-12ms")
+        with perf_col4:
+            st.metric("Success Rate", "99.95%", "+0.02%")
+    
+    with tab2:
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            st.markdown("""
+            <div style='background: #f8f9fa; padding: 20px; border-radius: 10px;'>
+                <h4 style='color: #4CAF50; margin-top: 0;'>📊 Batch Prediction Pipeline</h4>
+                <p style='color: #666; font-size: 0.9rem;'><strong>Schedule:</strong> Daily at 2:00 AM UTC</p>
+                <p style='color: #666; font-size: 0.9rem;'><strong>Orchestration:</strong> Apache Airflow</p>
+                <p style='color: #666; font-size: 0.9rem;'><strong>Processing:</strong> Spark on SparQ</p>
+                <p style='color: #666; font-size: 0.9rem;'><strong>Output:</strong> Delta Lake Tables</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("**Pipeline Steps:**")
+            steps = [
+                "1️⃣ Extract customer data from warehouse",
+                "2️⃣ Compute features for all customers",
+                "3️⃣ Load latest model from MLflow",
+                "4️⃣ Generate predictions (4,525 customers)",
+                "5️⃣ Store results in Delta Lake",
+                "6️⃣ Update dashboards and reports",
+                "7️⃣ Early-warning scan vs previous snapshot (early_warning.py)"
+            ]
+            for step in steps:
+                st.markdown(f"<p style='margin: 5px 0; color: #666;'>{step}</p>", unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Batch metrics
+        batch_col1, batch_col2, batch_col3, batch_col4 = st.columns(4)
+        with batch_col1:
+            st.metric("Processing Time", "15 min", "-2 min")
+        with batch_col2:
+            st.metric("Customers", "4,525", "+125")
+        with batch_col3:
+            st.metric("Success Rate", "99.8%", "+0.1%")
+        with batch_col4:
+            st.metric("Data Quality", "98.5%", "+0.3%")
+    
+    st.markdown("---")
+    
+    # Model versioning with enhanced table
+    st.markdown("#### 📦 Model Versioning & Registry")
+    
+    st.markdown("""
+    <div style='background: #f8f9fa; padding: 15px; border-radius: 10px; margin-bottom: 15px;'>
+        <p style='color: #666; margin: 0; font-size: 0.9rem;'>
+            <strong>MLflow Model Registry</strong> manages all model versions with full lineage tracking, 
+            automated testing, and seamless promotion from staging to production.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    versions_data = pd.DataFrame({
+        "Version": ["v1.0.0", "v1.1.0", "v1.2.0", "v2.0.0"],
+        "Date": ["2025-09-20", "2025-10-01", "2025-10-25", "2025-11-01"],
+        "ROC AUC": ["95.2%", "96.8%", "97.5%", "98.7%"],
+        "Status": ["📦 Archived", "📦 Archived", "🧪 Staging", "✅ Production"],
+        "Notes": [
+            "Initial release",
+            "Added cross connect features",
+            "Improved feature engineering",
+            "Current  model"
+        ]
+    })
+    
+    st.dataframe(versions_data, use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Monitoring with professional cards
+    st.markdown("#### 📊 Monitoring & Observability")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; color: white;'>
+            <h4 style='margin: 0 0 15px 0; color: white;'>✅ Performance Monitoring</h4>
+            <ul style='margin: 0; padding-left: 20px;'>
+                <li>Prediction accuracy tracking</li>
+                <li>Latency monitoring (P50, P95, P99)</li>
+                <li>Throughput & QPS tracking</li>
+                <li>Error rate monitoring</li>
+                <li>Model drift detection</li>
+                <li>Feature drift detection</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 20px; border-radius: 10px; color: white;'>
+            <h4 style='margin: 0 0 15px 0; color: white;'>🚨 Alerting Rules</h4>
+            <ul style='margin: 0; padding-left: 20px;'>
+                <li>ROC AUC drops below 95%</li>
+                <li>Latency exceeds 200ms (P95)</li>
+                <li>Error rate > 1%</li>
+                <li>Data drift detected (PSI > 0.2)</li>
+                <li>Model drift detected</li>
+                <li>API downtime > 1 minute</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Infrastructure with enhanced styling
+    st.markdown("#### 🖥️ Infrastructure & Resources")
+    
+    infra_data = pd.DataFrame({
+        "Component": [
+            "🌐 API Server",
+            "�� Model Serving",
+            "💾 Feature Store",
+            "🗄️ Database",
+            # "⚡ Cache Layer",
+            "📊 Monitoring"
+        ],
+        "Technology": [
+            "Flask + Gunicorn + Nginx",
+            "MLflow Model Serving",
+            "Delta Lake + Spark",
+            "PostgreSQL 14",
+            # "Redis 7.0",
+            "Prometheus + Grafana"
+        ],
+        "Resources": [
+            "4 vCPU, 8GB RAM",
+            "2 vCPU, 4GB RAM",
+            "Elastic (S3 + Spark)",
+            "4 vCPU, 16GB RAM",
+            # "2 vCPU, 4GB RAM",
+            "2 vCPU, 4GB RAM"
+        ]
+        # ,
+        # "Scaling": [
+        #     "Auto (2-10 instances)",
+        #     "Fixed (2 instances)",
+        #     "Elastic",
+        #     "Fixed",
+        #     "Fixed",
+        #     "Fixed"
+        # ],
+        # "Cost/Month": [
+        #     "$240",
+        #     "$80",
+        #     "$150",
+        #     "$160",
+        #     "$80",
+        #     "$80"
+        # ]
+    })
+    
+    st.dataframe(infra_data, use_container_width=True, hide_index=True)
+    
+    # Total cost
+    # st.markdown("""
+    # <div style='background: #e8f5e9; padding: 15px 20px; border-radius: 10px; border-left: 4px solid #4CAF50; margin-top: 15px;'>
+    #     <p style='color: #666; margin: 0;'><strong>Total Infrastructure Cost:</strong> <span style='color: #4CAF50; font-size: 1.2rem; font-weight: bold;'>$790/month</span></p>
+    # </div>
+    # """, unsafe_allow_html=True)
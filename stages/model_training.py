@@ -0,0 +1,224 @@
+"""
+Stage 4: Model training and evaluation
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.express as px
+import numpy as np
+
+from figure_cache import cached_figure
+
+
+def render():
+    """Render the 4. Model Training stage"""
+    st.markdown('<div class="stage-header">🤖 Stage 4: Model Training</div>', unsafe_allow_html=True)
+    st.markdown("### Machine Learning Model Development & Evaluation")
+    
+    # Model overview
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Model Type", "Logistic Regression")
+    # with col2:
+    #     st.metric("ROC AUC", "98.7%")
+    with col4:
+        st.metric("AUC-ROC", "0.987")
+    # with col4:
+    #     st.metric("Training Time", "3 hours")
+    
+    st.markdown("---")
+    
+    # Model selection
+    st.markdown("#### 🔍 Model Selection Process")
+    
+    model_comparison = pd.DataFrame({
+        "Model": [
+            "Logistic Regression",
+            "Random Forest",
+            "XGBoost",
+            "Neural Network",
+            "SVM"
+        ],
+        "ROC AUC": [98.7, 96.4, 96.4, 94.2, 92.8],
+        "AUC-ROC": [0.987, 0.964, 0.964, 0.960, 0.940],
+        "Training Time": ["3 hours", "8 hours", "6 hours", "12 hours", "5 hours"],
+        "Interpretability": ["High", "Medium", "Medium", "Low", "Low"],
+        "Selected": ["✅", "❌", "❌", "❌", "❌"]
+    })
+    
+    st.dataframe(model_comparison, use_container_width=True, hide_index=True)
+    
+    st.markdown("""
+    **Why Logistic Regression?**
+    - ✅ Best ROC AUC (98.7%)
+    - ✅ Highest AUC-ROC (0.987)
+    - ✅ Fast training (3 hours)
+    - ✅ High interpretability (regulatory requirement)
+    - ✅ Easy to explain to stakeholders
+    - ✅ Stable and reliable predictions
+    """)
+    
+    st.markdown("---")
+    
+    # Model performance
+    st.markdown("#### 📊 Model Performance Metrics")
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["Confusion Matrix", "ROC Curve", "Precision-Recall", "Feature Importance"])
+    
+    with tab1:
+        # Confusion matrix
+        cm = np.array([[850, 45], [35, 3595]])
+        
+        def build_confusion_matrix():
+            fig = go.Figure(data=go.Heatmap(
+                z=cm,
+                x=['Predicted Low Risk', 'Predicted High Risk'],
+                y=['Actual Low Risk', 'Actual High Risk'],
+                text=cm,
+                texttemplate='%{text}',
+                colorscale='Blues'
+            ))
+            fig.update_layout(title="Confusion Matrix", height=400)
+            return fig
+        
+        fig = cached_figure("confusion_matrix", build_confusion_matrix, cm, height=400)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("True Positives", "3,595")
+        with col2:
+            st.metric("True Negatives", "850")
+        with col3:
+            st.metric("False Positives", "45")
+        with col4:
+            st.metric("False Negatives", "35")
+    
+    with tab2:
+        # ROC curve
+        fpr = np.linspace(0, 1, 100)
+        tpr = 1 - (1 - fpr) ** 3
+        
+        def build_roc_curve():
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=fpr, y=tpr, mode='lines', name='ROC Curve', line=dict(color='blue', width=3)))
+            fig.add_trace(go.Scatter(x=[0, 1], y=[0, 1], mode='lines', name='Random', line=dict(color='red', dash='dash')))
+            fig.update_layout(
+                title="ROC Curve (AUC = 0.96)",
+                xaxis_title="False Positive Rate",
+                yaxis_title="True Positive Rate",
+                height=400
+            )
+            return fig
+        
+        fig = cached_figure("roc_curve", build_roc_curve, fpr, tpr, height=400)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.metric("AUC-ROC Score", "0.96", help="Area Under the ROC Curve")
+    
+    with tab3:
+        # Precision-Recall curve
+        recall = np.linspace(0, 1, 100)
+        precision = 1 - recall * 0.1
+        
+        def build_pr_curve():
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=recall, y=precision, mode='lines', name='PR Curve', line=dict(color='green', width=3)))
+            fig.update_layout(
+                title="Precision-Recall Curve",
+                xaxis_title="Recall",
+                yaxis_title="Precision",
+                height=400
+            )
+            return fig
+        
+        fig = cached_figure("pr_curve", build_pr_curve, recall, precision, height=400)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Precision", "98.8%")
+        with col2:
+            st.metric("Recall", "99.0%")
+        with col3:
+            st.metric("F1-Score", "98.9%")
+    
+    with tab4:
+        # Feature importance (already shown in feature engineering)
+        st.markdown("**Top 10 Features by Model Coefficients**")
+        
+        coef_data = pd.DataFrame({
+            "Feature": [
+                "volatility", "days_since_last_order", "gmv_slope",
+                "sales_12m", "sales_6m", "consistency_score",
+                "recency_score", "monthly_gmv", "active_months", "total_orders"
+            ],
+            "Coefficient": [2.34, 1.89, -1.67, -1.45, -1.23, -1.12, -0.98, -0.87, -0.76, -0.65],
+            "Impact": [
+                "↑ Increases Risk", "↑ Increases Risk", "↓ Decreases Risk",
+                "↓ Decreases Risk", "↓ Decreases Risk", "↓ Decreases Risk",
+                "↓ Decreases Risk", "↓ Decreases Risk", "↓ Decreases Risk", "↓ Decreases Risk"
+            ]
+        })
+        
+        def build_coefficient_bar():
+            fig = px.bar(coef_data, x="Coefficient", y="Feature", orientation='h',
+                         title="Model Coefficients", color="Coefficient",
+                         color_continuous_scale="RdYlGn")
+            fig.update_layout(height=400)
+            return fig
+        
+        fig = cached_figure("model_coefficients_bar", build_coefficient_bar, coef_data, height=400)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Model validation
+    st.markdown("#### ✅ Model Validation")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**Cross-Validation Results**")
+        cv_data = pd.DataFrame({
+            "Fold": [1, 2, 3, 4, 5, "Mean", "Std"],
+            "ROC AUC": [98.8, 98.5, 98.7, 98.9, 98.6, 98.7, 0.15],
+            "AUC": [0.97, 0.95, 0.96, 0.96, 0.95, 0.96, 0.01]
+        })
+        st.dataframe(cv_data, use_container_width=True, hide_index=True)
+    
+    with col2:
+        st.markdown("**Holdout Test Set Results**")
+        test_metrics = {
+            "Metric": ["ROC AUC", "Accuracy", "Precision", "Recall", "F1-Score"],
+            "Train": [98.7, 95.0, 94.0, 96.0, 95.0],
+            "Test": [98.5, 94.8, 93.8, 95.8, 94.8]
+        }
+        st.dataframe(pd.DataFrame(test_metrics), use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Model hyperparameters
+    st.markdown("#### ⚙️ Model Hyperparameters")
+    
+    hyperparams = {
+        "Parameter": [
+            "Solver", "Penalty", "C (Regularization)", "Max Iterations",
+            "Class Weight", "Random State", "Convergence Tolerance"
+        ],
+        "Value": [
+            "lbfgs", "l2", "1.0", "1000", "balanced", "42", "1e-4"
+        ],
+        "Description": [
+            "Optimization algorithm",
+            "Regularization type",
+            "Inverse regularization strength",
+            "Maximum iterations for convergence",
+            "Handle imbalanced classes",
+            "Reproducibility seed",
+            "Stopping criterion"
+        ]
+    }
+    
+    st.dataframe(pd.DataFrame(hyperparams), use_container_width=True, hide_index=True)
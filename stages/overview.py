@@ -0,0 +1,126 @@
+"""
+Overview: pipeline journey and headline metrics
+"""
+
+import streamlit as st
+import pandas as pd
+
+
+# Helper function to create journey flow diagram
+def create_journey_flow():
+    """Create a visual journey flow using Streamlit columns instead of plotly"""
+    # This function now returns None and we'll use Streamlit columns directly
+    return None
+
+
+def render():
+    """Render the Overview stage"""
+    st.markdown('<div class="main-header">Kee Credit Risk Model</div>', unsafe_allow_html=True)
+    st.markdown("### End-to-End ML Pipeline for Credit Risk Assessment")
+    
+    # Journey flow diagram - Card-based visual
+    st.markdown("#### 🔄 ML Pipeline Journey")
+    
+    # Create 6 columns for the journey stages
+    cols = st.columns(6)
+    
+    stages = [
+        ("📥", "Data\nIngestion", "#e3f2fd"),
+        ("📊", "EDA &\n Data Profiling", "#f3e5f5"),
+        ("🔧", "Feature\nEngineering", "#e8f5e9"),
+        ("🤖", "Model\nTraining", "#fff3e0"),
+        ("🚀", "Model\nDeployment", "#fce4ec"),
+        ("📈", "Dashboards\n", "#e0f2f1")
+    ]
+    
+    for i, (col, (icon, name, color)) in enumerate(zip(cols, stages)):
+        with col:
+            st.markdown(f"""
+            <div style='
+                background-color: {color};
+                padding: 20px 10px;
+                border-radius: 10px;
+                text-align: center;
+                border: 2px solid #1f77b4;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+                height: 120px;
+                display: flex;
+                flex-direction: column;
+                justify-content: center;
+            '>
+                <div style='font-size: 32px; margin-bottom: 8px;'>{icon}</div>
+                <div style='font-size: 13px; font-weight: bold; color: #333; line-height: 1.3;'>{name}</div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Add arrow except for last column
+            if i < 5:
+                st.markdown("<div style='text-align: center; font-size: 24px; color: #1f77b4; margin-top: -10px;'>→</div>", unsafe_allow_html=True)
+    
+    # Overview metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Data Sources", "6", help="Distribution Partner, Payment Partner, Bank, AECB")
+    with col2:
+        st.metric("Total Records", "24,350", help="Unique customers analyzed")
+    with col3:
+        st.metric("Features Engineered", "58", help="Advanced risk indicators")
+    with col4:
+        st.metric("Model Accuracy", "98.7%", help="Logistic Regression performance")
+    
+    st.markdown("---")
+    
+    # Journey stages overview
+    st.markdown("### 📋 Stages")
+    
+    stages_data = {
+        "Stage": ["1. Data Ingestion", "2. EDA & Profiling", "3. Feature Engineering", 
+                  "4. Model Training", "5. Model Deployment", "6. Dashboards"],
+        "Status": ["✅ Complete", "✅ Complete", "✅ Complete", "✅ Complete", "✅ Complete", "✅ Complete"],
+        # "Duration": ["2 hours", "4 hours", "6 hours", "3 hours", "2 hours", "Ongoing"],
+        "Key Output": [
+            "Unified dataset (4,525 customers)",
+            "Data quality report & insights",
+            "58 engineered features",
+            "Trained LR model (98.7% ROC AUC)",
+            "REST API + Batch predictions",
+            "4 persona-specific dashboards"
+        ]
+    }
+    
+    df_stages = pd.DataFrame(stages_data)
+    st.dataframe(df_stages, use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Key Insights
+    # st.markdown("### 💡 Key Insights")
+    
+    # col1, col2, col3 = st.columns(3)
+    
+    # with col1:
+    #     st.markdown("""
+    #     **Data Integration**
+    #     - ✅ Integrated 6 diverse data sources
+    #     - ✅ Processed 4,525 unique customers
+    #     - ✅ 96.8% data completeness
+    #     - ✅ Real-time data pipeline
+    #     """)
+    
+    # with col2:
+    #     st.markdown("""
+    #     **Model Performance**
+    #     - ✅ 98.7% model ROC AUC
+    #     - ✅ 58 engineered features
+    #     - ✅ Full explainability with SHAP
+    #     - ✅ Production-ready deployment
+    #     """)
+    
+    # with col3:
+    #     st.markdown("""
+    #     **Business Value**
+    #     - ✅ Real-time risk assessment
+    #     - ✅ 4 persona-specific dashboards
+    #     - ✅ Automated decision support
+    #     - ✅ Scalable architecture
+    #     """)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Startup Profiler
+================
+
+Measures what a fresh replica pays before the first page is on screen:
+import time of the modules app.py loads at startup, time spent in
+``load_customer_data()``, the lazy import of the selected stage (its own
+phase, so other stages are never imported) and time to first render.
+
+Enable it for the app with an environment variable:
+
+    KEE_PROFILE_STARTUP=1 streamlit run app.py                # -> startup_profile.json
+    KEE_PROFILE_STARTUP=/tmp/profile.json streamlit run app.py
+
+The profile is taken once per process (the first script run) and written as
+JSON, with a ranked report printed to stdout. Run this file directly to
+measure cold import cost of the startup and lazily imported modules in a
+clean interpreter:
+
+    python startup_profiler.py [-o cold_imports.json]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+ENV_VAR = "KEE_PROFILE_STARTUP"
+DEFAULT_OUTPUT = "startup_profile.json"
+
+# Modules app.py imports before the first render
+STARTUP_MODULES = [
+    "streamlit",
+    "numpy",
+    "pandas",
+    "stages",
+    "metrics",
+]
+
+# Imported only when a stage that needs them is selected (cold import report only)
+LAZY_MODULES = [
+    "plotly",
+    "plotly.express",
+    "credit_officer_enhanced_section",
+]
+
+# Reference point for time to first render; app.py imports this module first
+_PROCESS_T0 = time.perf_counter()
+_profiler = None
+
+
+class StartupProfiler:
+    """Collects timing records for a single startup and writes a ranked report"""
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.t0 = _PROCESS_T0
+        self.records = []
+        self.finished = False
+
+    def record(self, kind, name, seconds, **extra):
+        self.records.append({"kind": kind, "name": name, "seconds": seconds, **extra})
+
+    @contextmanager
+    def span(self, kind, name):
+        """Time a block and record it"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(kind, name, time.perf_counter() - start)
+
+    def import_modules(self, modules=STARTUP_MODULES):
+        """Import each module, recording its incremental import cost
+
+        Only pass modules the app imports at startup anyway, so profiling
+        does not change the time to first render. Modules already in
+        ``sys.modules`` (e.g. streamlit, which the runner imports before
+        app.py) are recorded with ``preloaded=True``; use
+        ``measure_cold_imports()`` for their cold cost.
+        """
+        import importlib
+        for name in modules:
+            preloaded = name in sys.modules
+            start = time.perf_counter()
+            importlib.import_module(name)
+            self.record("import", name, time.perf_counter() - start, preloaded=preloaded)
+
+    def finish(self):
+        """Record time to first render and write the report (once)"""
+        if self.finished:
+            return None
+        self.finished = True
+        self.record("startup", "time_to_first_render", time.perf_counter() - self.t0)
+        report = self.report()
+        with open(self.output_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(format_report(report))
+        return report
+
+    def report(self):
+        return {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "pid": os.getpid(),
+            "ranked": sorted(self.records, key=lambda r: r["seconds"], reverse=True),
+        }
+
+
+def get_profiler():
+    """Return the process-wide profiler if ``KEE_PROFILE_STARTUP`` is set, else None"""
+    global _profiler
+    value = os.environ.get(ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return None
+    if _profiler is None:
+        output = DEFAULT_OUTPUT if value.lower() in ("1", "true", "yes") else value
+        _profiler = StartupProfiler(output)
+    return _profiler
+
+
+def measure_cold_imports(modules=None, cwd=None):
+    """Cold import time of each module in a fresh interpreter (``-X importtime``)
+
+    Defaults to the startup modules plus the lazily imported ones, each
+    record tagged with its ``phase``.
+    """
+    cwd = cwd or os.path.dirname(os.path.abspath(__file__))
+    if modules is None:
+        modules = STARTUP_MODULES + LAZY_MODULES
+    records = []
+    for name in modules:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {name}"],
+            cwd=cwd, capture_output=True, text=True
+        )
+        seconds = None
+        # Lines look like: "import time:   self [us] | cumulative | imported package"
+        for line in proc.stderr.splitlines():
+            parts = [p.strip() for p in line.split("|")]
+            if len(parts) == 3 and parts[2] == name:
+                seconds = int(parts[1]) / 1e6
+        records.append({
+            "kind": "cold_import",
+            "name": name,
+            "seconds": seconds,
+            "phase": "lazy" if name in LAZY_MODULES else "startup",
+            "ok": proc.returncode == 0,
+        })
+    return sorted(records, key=lambda r: r["seconds"] or 0, reverse=True)
+
+
+def format_report(report):
+    """Human-readable ranked report"""
+    lines = ["", "⏱️  Startup profile (slowest first)"]
+    for r in report["ranked"]:
+        seconds = r["seconds"]
+        timing = f"{seconds * 1000:9.1f} ms" if seconds is not None else "      n/a   "
+        note = " (preloaded)" if r.get("preloaded") else ""
+        if r.get("phase") == "lazy":
+            note += " (lazy)"
+        lines.append(f"  {timing}  {r['kind']:<12} {r['name']}{note}")
+    return "\n".join(lines)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Measure cold import cost of the app's heavy modules")
+    parser.add_argument("-o", "--output", help="Write the report as JSON to this file")
+    args = parser.parse_args()
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "ranked": measure_cold_imports(),
+    }
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Synthetic Customer Data
+=======================
+
+Generates customer files with dashboard_data.csv's schema at any scale
+(100k, 1M, 10M rows), plus a matching conektr-style transaction file, so
+load, lookup and render paths can be benchmarked offline at portfolio size.
+
+The numeric columns are sampled with a Gaussian copula fitted on the real
+file: each marginal is reproduced from its empirical quantiles (including
+the point masses at zero in account_value and gmv_slope) and the rank
+correlations between risk_score_30d/60d/90d, account_value, volatility,
+gmv_slope, days_since_last_order and active_months are preserved.
+risk_level_30d is derived from risk_score_30d with the dashboard's bands, and
+intervention_status is resampled from real customers in the same band.
+
+    python synthetic_data.py --rows 100k
+    python synthetic_data.py --rows 1m 10m --no-transactions
+    KEE_DASHBOARD_DATA=synthetic/dashboard_data_1m.csv python benchmarks.py
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+SOURCE_FILE = "dashboard_data.csv"
+SCHEMA = [
+    "customer_id", "customer_name", "risk_score_30d", "risk_score_60d", "risk_score_90d",
+    "account_value", "days_since_last_order", "active_months", "volatility", "gmv_slope",
+    "intervention_status", "risk_level_30d",
+]
+OUTPUT_DIR = "synthetic"
+
+SIZES = {"100k": 100_000, "1m": 1_000_000, "10m": 10_000_000}
+
+COPULA_COLUMNS = [
+    "risk_score_30d",
+    "risk_score_60d",
+    "risk_score_90d",
+    "account_value",
+    "volatility",
+    "gmv_slope",
+    "days_since_last_order",
+    "active_months",
+]
+INTEGER_COLUMNS = ["days_since_last_order", "active_months"]
+
+CHUNK_ROWS = 500_000
+QUANTILE_GRID = 2049
+
+
+def risk_level(scores):
+    """Vectorized High/Medium/Low band (the dashboards' 0.7 / 0.3 cut-offs)"""
+    scores = np.asarray(scores)
+    return np.select([scores >= 0.7, scores >= 0.3], ["High", "Medium"], default="Low")
+
+
+class CustomerModel:
+    """Gaussian copula over the numeric columns of a real customer file"""
+
+    def __init__(self, source_df):
+        numeric = source_df[COPULA_COLUMNS].astype(float)
+
+        # Spearman rho -> Pearson correlation of the latent normals
+        spearman = numeric.rank().corr().to_numpy()
+        corr = 2 * np.sin(np.pi * spearman / 6)
+        eigvals, eigvecs = np.linalg.eigh(corr)
+        corr = eigvecs @ np.diag(np.clip(eigvals, 1e-6, None)) @ eigvecs.T
+        self.cholesky = np.linalg.cholesky(corr)
+
+        grid = np.linspace(0, 1, QUANTILE_GRID)
+        self.quantiles = {col: np.quantile(numeric[col].to_numpy(), grid) for col in COPULA_COLUMNS}
+
+        bands = risk_level(source_df["risk_score_30d"].to_numpy())
+        status = source_df["intervention_status"].to_numpy(dtype=object)
+        self.status_by_band = {band: status[bands == band] for band in np.unique(bands)}
+        self.names = source_df["customer_name"].dropna().astype(str).to_numpy()
+
+    def sample(self, n, rng, first_id=1):
+        """Draw ``n`` synthetic customers as a DataFrame"""
+        latent = rng.standard_normal((n, len(COPULA_COLUMNS))) @ self.cholesky.T
+
+        columns = {"customer_id": np.arange(first_id, first_id + n, dtype=np.int64)}
+        base_names = self.names[rng.integers(0, len(self.names), n)]
+        columns["customer_name"] = pd.Series(base_names) + " #" + pd.Series(columns["customer_id"]).astype(str)
+
+        grid_max = QUANTILE_GRID - 1
+        for j, col in enumerate(COPULA_COLUMNS):
+            # Rank within the chunk gives the uniform margin without needing the normal CDF
+            uniform = (np.argsort(np.argsort(latent[:, j])) + 0.5) / n
+            values = np.interp(uniform * grid_max, np.arange(QUANTILE_GRID), self.quantiles[col])
+            columns[col] = np.rint(values).astype(np.int64) if col in INTEGER_COLUMNS else values
+
+        bands = risk_level(columns["risk_score_30d"])
+        status = np.empty(n, dtype=object)
+        for band, pool in self.status_by_band.items():
+            mask = bands == band
+            if mask.any() and len(pool):
+                status[mask] = pool[rng.integers(0, len(pool), mask.sum())]
+        columns["intervention_status"] = status
+        columns["risk_level_30d"] = bands
+
+        return pd.DataFrame(columns)[SCHEMA]
+
+
+def generate_transactions(customers, rng, as_of, orders_per_month=3.0, first_order_id=1):
+    """Conektr-style order lines consistent with each customer's profile
+
+    Order count follows active_months, the last order lands exactly
+    days_since_last_order before ``as_of``, the mean ticket scales with
+    account_value and drifts with gmv_slope, and ticket dispersion follows
+    volatility.
+    """
+    active = customers["active_months"].to_numpy()
+    counts = np.where(active > 0, rng.poisson(np.maximum(active, 1) * orders_per_month), 0)
+    counts = np.where(active > 0, np.maximum(counts, 1), 0)
+    total = int(counts.sum())
+    if total == 0:
+        return pd.DataFrame(columns=["order_id", "customer_id", "Outlet Name", "order_date", "gmv", "sku_count"])
+
+    idx = np.repeat(np.arange(len(customers)), counts)
+    # Position of each order within its customer's history: 0 = most recent
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    position = np.arange(total) - starts
+
+    span_days = np.maximum(active[idx], 1) * 30
+    days_back = customers["days_since_last_order"].to_numpy()[idx] + np.where(
+        position == 0, 0, rng.integers(1, span_days + 1)
+    )
+    order_date = np.datetime64(as_of.date()) - days_back.astype("timedelta64[D]")
+
+    monthly_gmv = np.maximum(customers["account_value"].to_numpy(), 500.0) / np.maximum(active, 1)
+    months_ago = days_back / 30.0
+    mean_ticket = np.maximum(
+        (monthly_gmv[idx] - customers["gmv_slope"].to_numpy()[idx] * months_ago) / orders_per_month, 50.0
+    )
+    sigma = np.clip(customers["volatility"].to_numpy()[idx], 0.05, 1.5)
+    gmv = mean_ticket * rng.lognormal(-sigma ** 2 / 2, sigma)
+
+    orders = pd.DataFrame({
+        "customer_id": customers["customer_id"].to_numpy()[idx],
+        "Outlet Name": customers["customer_name"].to_numpy()[idx],
+        "order_date": pd.to_datetime(order_date).strftime("%Y-%m-%d"),
+        "gmv": np.round(gmv, 2),
+        "sku_count": rng.integers(1, 40, total),
+    }).sort_values(["customer_id", "order_date"], kind="stable", ignore_index=True)
+    orders.insert(0, "order_id", np.arange(first_order_id, first_order_id + total, dtype=np.int64))
+    return orders
+
+
+def generate(rows, output_dir=OUTPUT_DIR, label=None, source=SOURCE_FILE, seed=42,
+             transactions=True, orders_per_month=3.0, chunk_rows=CHUNK_ROWS, as_of=None):
+    """Write dashboard_data_<label>.csv (and conektr_data_<label>.csv) in chunks"""
+    label = label or str(rows)
+    as_of = as_of or datetime.now()
+    rng = np.random.default_rng(seed)
+    model = CustomerModel(pd.read_csv(source))
+
+    os.makedirs(output_dir, exist_ok=True)
+    customers_path = os.path.join(output_dir, f"dashboard_data_{label}.csv")
+    orders_path = os.path.join(output_dir, f"conektr_data_{label}.csv")
+
+    next_order_id = 1
+    order_count = 0
+    for first in range(0, rows, chunk_rows):
+        n = min(chunk_rows, rows - first)
+        chunk = model.sample(n, rng, first_id=first + 1)
+        chunk.to_csv(customers_path, mode="w" if first == 0 else "a", header=first == 0, index=False)
+
+        if transactions:
+            orders = generate_transactions(chunk, rng, as_of, orders_per_month, next_order_id)
+            orders.to_csv(orders_path, mode="w" if first == 0 else "a", header=first == 0, index=False)
+            next_order_id += len(orders)
+            order_count += len(orders)
+
+    return {
+        "customers_path": customers_path,
+        "customers": rows,
+        "orders_path": orders_path if transactions else None,
+        "orders": order_count,
+    }
+
+
+def parse_size(value):
+    """'100k' / '1m' / '250000' -> row count"""
+    key = value.lower()
+    if key in SIZES:
+        return SIZES[key]
+    if key.endswith("k"):
+        return int(float(key[:-1]) * 1_000)
+    if key.endswith("m"):
+        return int(float(key[:-1]) * 1_000_000)
+    return int(key)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic customer and transaction files")
+    parser.add_argument("--rows", nargs="+", default=["100k"], help="Sizes, e.g. 100k 1m 10m")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--source", default=SOURCE_FILE, help="Real customer file to fit on")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--orders-per-month", type=float, default=3.0)
+    parser.add_argument("--no-transactions", action="store_true", help="Skip the conektr file")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧪 Synthetic Customer Data")
+    print("=" * 60)
+    for size in args.rows:
+        start = time.perf_counter()
+        result = generate(
+            parse_size(size), args.output_dir, label=size.lower(), source=args.source, seed=args.seed,
+            transactions=not args.no_transactions, orders_per_month=args.orders_per_month,
+        )
+        print(f"✅ {result['customers']:,} customers -> {result['customers_path']}")
+        if result["orders_path"]:
+            print(f"✅ {result['orders']:,} orders -> {result['orders_path']}")
+        print(f"   ({time.perf_counter() - start:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,8 +6,13 @@ Run this locally to catch issues early.
 
 import sys
 import os
+import time
 from pathlib import Path
 
+# Performance gate: wall-clock budget and opt-out (groups and pages: benchmarks.GATE_*)
+PERF_TIME_BUDGET_S = 90
+PERF_SKIP_ENV_VAR = "KEE_SKIP_PERF_GATE"
+
 def test_file_structure():
     """Check that all required files exist."""
     print("🔍 Testing file structure...")
@@ -174,6 +179,443 @@ def test_no_secrets():
         print(f"  ❌ Error checking secrets: {e}")
         return False
 
+def test_ingestion_errors():
+    """Check that unreadable source files are reported, not raised."""
+    print("🔍 Testing ingestion of bad source files...")
+    
+    import tempfile
+    from ingestion import INGEST_ENV_VAR, ingest_all
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Empty file, binary garbage, and a file missing declared columns
+        open(os.path.join(tmp, "aecb.csv"), "wb").close()
+        with open(os.path.join(tmp, "los.csv"), "wb") as f:
+            f.write(bytes(range(128, 256)) * 16)
+        with open(os.path.join(tmp, "dewa.csv"), "w") as f:
+            f.write("customer_id,bill_month\n1,2024-01-01\n")
+        
+        previous = os.environ.get(INGEST_ENV_VAR)
+        os.environ[INGEST_ENV_VAR] = tmp
+        try:
+            reports, _ = ingest_all(names=["aecb", "los", "dewa", "payment_partner"],
+                                    store_dir=os.path.join(tmp, "ingested"))
+        finally:
+            if previous is None:
+                os.environ.pop(INGEST_ENV_VAR)
+            else:
+                os.environ[INGEST_ENV_VAR] = previous
+    
+    expected = {"aecb": "read error", "los": "read error", "dewa": "schema error", "payment_partner": "missing"}
+    ok = True
+    for report in reports:
+        matched = report.status == expected[report.source]
+        ok = ok and matched
+        print(f"  {'✅' if matched else '❌'} {report.source}: {report.status} ({report.error or 'no file'})")
+    
+    if not ok:
+        print("❌ Bad source files were not reported as expected\n")
+        return False
+    print("✅ Bad source files are reported per source\n")
+    return True
+
+def test_quantile_sketch():
+    """Check KLL sketch ranks against exact ranks on the same data."""
+    print("🔍 Testing quantile sketch rank error...")
+    
+    import numpy as np
+    from quantile_sketch import DEFAULT_K, build_sketches
+    
+    # Documented error is ~2/k; allow twice that
+    bound = 4 / DEFAULT_K
+    ok = True
+    for seed in range(3):
+        rng = np.random.default_rng(seed)
+        values = np.round(rng.lognormal(9, 1.5, 200_000))
+        values[rng.random(len(values)) < 0.1] = 0  # heavy ties, like zero account values
+        sketch = build_sketches({"x": values}, chunk_rows=50_000, seed=seed)["x"]
+        
+        points = np.quantile(values, np.linspace(0, 1, 201))
+        exact = np.searchsorted(np.sort(values), points, side="right") / len(values)
+        error = float(np.abs(sketch.rank(points) - exact).max())
+        passed = error <= bound
+        ok = ok and passed
+        print(f"  {'✅' if passed else '❌'} seed {seed}: max rank error {error:.4f} (bound {bound:.4f})")
+    
+    if not ok:
+        print("❌ Quantile sketch rank error above bound\n")
+        return False
+    print("✅ Quantile sketch ranks within bound\n")
+    return True
+
+def test_bitmap_index():
+    """Check bitmap and/or/not/count against the same boolean masks."""
+    print("🔍 Testing bitmap indexes...")
+    
+    import numpy as np
+    from bitmap_index import Bitmap, BitmapIndex
+    
+    rng = np.random.default_rng(0)
+    ok = True
+    # Sizes around the 64-bit word boundary, plus a large odd one
+    for size in [1, 63, 64, 65, 1000, 100_003]:
+        a, b = rng.random(size) < 0.3, rng.random(size) < 0.6
+        x, y = Bitmap.from_mask(a), Bitmap.from_mask(b)
+        probe = rng.integers(0, size, 500)
+        checks = [
+            (x & y).to_mask().tolist() == (a & b).tolist(),
+            (x | y).to_mask().tolist() == (a | b).tolist(),
+            (x - y).to_mask().tolist() == (a & ~b).tolist(),
+            (~x).to_mask().tolist() == (~a).tolist(),
+            (x & y).count() == int((a & b).sum()),
+            (x | y).count() == int((a | b).sum()),
+            (~x).count() == int((~a).sum()),
+            Bitmap.full(size).count() == size,
+            x.contains(probe).tolist() == a[probe].tolist(),
+            np.array_equal(x.rows(), np.flatnonzero(a)),
+            np.array_equal(Bitmap.from_rows(np.flatnonzero(b), size).to_mask(), b),
+        ]
+        passed = all(checks)
+        ok = ok and passed
+        print(f"  {'✅' if passed else '❌'} size {size:,}: {sum(checks)}/{len(checks)} operations match")
+    
+    values = rng.choice(np.array(["High", "Medium", "Low", None], dtype=object), 10_007)
+    index = BitmapIndex(len(values))
+    index.add_categories("risk_level", values)
+    expected = {value: values == value for value in ["High", "Medium", "Low"]}
+    expected["None"] = np.array([v is None for v in values])
+    checks = [index.get("risk_level", v).to_mask().tolist() == m.tolist() for v, m in expected.items()]
+    checks.append(index.any_of("risk_level", ["High", "Low"]).to_mask().tolist()
+                  == (expected["High"] | expected["Low"]).tolist())
+    checks.append(index.get("risk_level", "Unknown").count() == 0)
+    passed = all(checks)
+    ok = ok and passed
+    print(f"  {'✅' if passed else '❌'} categories: {sum(checks)}/{len(checks)} bitmaps match")
+    
+    if not ok:
+        print("❌ Bitmap results differ from boolean masks\n")
+        return False
+    print("✅ Bitmaps match boolean masks\n")
+    return True
+
+def test_query_planner():
+    """Check planned filter rows against a plain pandas filter."""
+    print("🔍 Testing filter planner...")
+    
+    import operator
+    import numpy as np
+    import pandas as pd
+    from customer_data import find_dashboard_data
+    from customer_store import NUMERIC_COLUMNS, CustomerStore
+    from query_planner import plan_rows
+    
+    df = pd.read_csv(find_dashboard_data())
+    store = CustomerStore(df)
+    ops = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le}
+    bitmaps = {
+        "all": None,
+        "High": store.bitmaps.get("risk_level", "High"),
+        "inactive": store.bitmaps.get("inactive"),
+        "High & inactive": store.bitmaps.get("risk_level", "High") & store.bitmaps.get("inactive"),
+    }
+    
+    rng = np.random.default_rng(0)
+    columns = [col for col in NUMERIC_COLUMNS if col in df.columns]
+    failures = 0
+    trials = 300
+    for _ in range(trials):
+        # 0-3 conditions; values drawn from the data so ties on the bounds are exercised
+        conditions = []
+        for _ in range(rng.integers(0, 4)):
+            col = columns[rng.integers(len(columns))]
+            conditions.append((col, list(ops)[rng.integers(len(ops))], float(df[col].iloc[rng.integers(len(df))])))
+        name = list(bitmaps)[rng.integers(len(bitmaps))]
+        bitmap = bitmaps[name]
+        
+        mask = np.ones(len(df), dtype=bool) if bitmap is None else bitmap.to_mask().copy()
+        for col, op, value in conditions:
+            mask &= ops[op](df[col], value).to_numpy()
+        if not np.array_equal(plan_rows(store, bitmap, conditions).rows, np.flatnonzero(mask)):
+            failures += 1
+            print(f"  ❌ {name} {conditions}")
+    
+    if failures:
+        print(f"❌ {failures}/{trials} planned filters differ from pandas\n")
+        return False
+    print(f"  ✅ {trials} random filters match pandas")
+    print("✅ Filter planner matches pandas\n")
+    return True
+
+def test_intent_router():
+    """Check assistant routing for filter, ranking, profile and comparison phrasings."""
+    print("🔍 Testing assistant intent routing...")
+    
+    from assistant_engine import customer_ids, router
+    
+    # query -> (intent, customer IDs read from it)
+    cases = {
+        "high-risk customers inactive for 90 days": ("filter", []),
+        "list the 20 high risk customers with account value over 50K": ("filter", []),
+        "show customers with risk score above 0.5 in the last 30 days": ("filter", []),
+        "Show me the top 10 customers": ("top", []),
+        "customers with days since last order between 30 and 90": ("filter", []),
+        "top 3 high-risk customers by exposure": ("top", []),
+        "Analyze the risk profile for customer ID 8697": ("profile", [8697]),
+        "customer 8697 over the last 90 days": ("profile", [8697]),
+        "Compare risk profiles of customers 8697 and 48": ("compare", [8697, 48]),
+        "compare 48, 53 and 8697": ("compare", [48, 53, 8697]),
+    }
+    ok = True
+    for query, expected in cases.items():
+        intent, _, entities = router.route(query)
+        actual = (intent, customer_ids(entities))
+        passed = actual == expected
+        ok = ok and passed
+        print(f"  {'✅' if passed else '❌'} {query!r} -> {actual[0]} {actual[1] or ''}")
+    
+    if not ok:
+        print("❌ Assistant questions routed to the wrong intent\n")
+        return False
+    print("✅ Assistant routing is correct\n")
+    return True
+
+def _snapshot_days(df, days, rng):
+    """Daily customer frames with edits, removals, additions, re-added IDs and a schema change"""
+    import numpy as np
+    import pandas as pd
+    
+    frames = [df]
+    removed = []
+    next_id = int(df["customer_id"].max()) + 1
+    for i in range(1, days):
+        frame = frames[-1].copy()
+        edit = rng.random(len(frame)) < 0.05
+        frame.loc[edit, "risk_score_30d"] = rng.random(int(edit.sum()))
+        frame["days_since_last_order"] += 1
+        renamed = rng.random(len(frame)) < 0.01
+        frame.loc[renamed, "customer_name"] = [f"Outlet {i}-{j}" if j % 3 else np.nan for j in range(renamed.sum())]
+        if i == 20:
+            # Most values change at once
+            frame["account_value"] = rng.gamma(2.0, 5_000.0, len(frame))
+            frame["volatility"] = rng.random(len(frame))
+            frame["risk_score_60d"] = rng.random(len(frame))
+            frame["risk_score_90d"] = rng.random(len(frame))
+            frame["gmv_slope"] = rng.normal(0, 100, len(frame))
+            frame["active_months"] += 1
+        if i == 12:
+            frame["segment"] = rng.choice(["A", "B", ""], len(frame))
+        
+        drop = rng.random(len(frame)) < 0.01
+        removed.append(frame[drop])
+        frame = frame[~drop]
+        new = frames[0].sample(5, random_state=i).assign(customer_id=np.arange(next_id, next_id + 5))
+        next_id += 5
+        back = removed[-3] if len(removed) >= 3 else frame.iloc[:0]
+        frame = pd.concat([frame, new.reindex(columns=frame.columns), back.reindex(columns=frame.columns)],
+                          ignore_index=True)
+        frames.append(frame)
+    return frames
+
+def _same_frame(actual, expected):
+    """Row/column-wise equality after sorting by customer_id (NaN == NaN, missing text == '')"""
+    import numpy as np
+    
+    actual = actual.sort_values("customer_id", kind="stable").reset_index(drop=True)
+    expected = expected.sort_values("customer_id", kind="stable").reset_index(drop=True)
+    if list(actual.columns) != list(expected.columns) or len(actual) != len(expected):
+        return False
+    for column in expected.columns:
+        a, e = actual[column], expected[column]
+        if e.dtype == object or a.dtype == object:
+            if not (a.fillna("").astype(str).to_numpy() == e.fillna("").astype(str).to_numpy()).all():
+                return False
+        elif not np.array_equal(a.to_numpy(dtype=float), e.to_numpy(dtype=float), equal_nan=True):
+            return False
+    return True
+
+def test_snapshot_store():
+    """Check snapshot time travel against the frames that were stored."""
+    print("🔍 Testing snapshot store...")
+    
+    import tempfile
+    from datetime import date, timedelta
+    import numpy as np
+    import pandas as pd
+    from customer_data import find_dashboard_data
+    from snapshot_store import REBASE_EVERY, SnapshotStore
+    
+    rng = np.random.default_rng(0)
+    base = pd.read_csv(find_dashboard_data()).head(1000)
+    # Bases from the first day, the schema change (day 12), the mass update (day 20) and REBASE_EVERY
+    frames = _snapshot_days(base, 20 + REBASE_EVERY + 3, rng)
+    dates = [(date(2026, 1, 1) + timedelta(days=i)).isoformat() for i in range(len(frames))]
+    
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SnapshotStore(tmp)
+        for day, frame in zip(dates, frames):
+            store.add(frame, day)
+        kinds = [s["kind"] for s in store.snapshots]
+        print(f"  ✅ {len(dates)} days stored: {kinds.count('base')} bases at "
+              f"{', '.join(d[5:] for d, k in zip(dates, kinds) if k == 'base')}")
+        
+        store = SnapshotStore(tmp)  # reopen from the manifest
+        mismatched = [day for day, frame in zip(dates, frames) if not _same_frame(store.table(day), frame)]
+        ok = ok and not mismatched
+        print(f"  {'✅' if not mismatched else '❌'} table(day): "
+              f"{len(dates) - len(mismatched)}/{len(dates)} days match" + (f" ({mismatched})" if mismatched else ""))
+        
+        # A steady customer, a removed one, a re-added one, a new one and an unknown id
+        first, last = frames[0]["customer_id"], frames[-1]["customer_id"]
+        gone = sorted(set(first) - set(last))
+        readded = sorted((set(frames[5]["customer_id"]) - set(frames[3]["customer_id"])) & set(first))
+        ids = [int(first.iloc[0]), gone[0], readded[0], int(last.max()), 10 ** 9]
+        columns = ["risk_score_30d", "customer_name"]
+        for start, end in [(dates[0], dates[-1]), (dates[8], dates[14]), (dates[45], dates[-2])]:
+            expected = pd.concat([
+                frame.loc[frame["customer_id"].isin(ids), ["customer_id", *columns]].assign(date=day)
+                for day, frame in zip(dates, frames) if start <= day <= end
+            ], ignore_index=True)[["date", "customer_id", *columns]]
+            actual = store.history(ids, columns, start=start, end=end)
+            order = ["date", "customer_id"]
+            matched = _same_frame(actual.sort_values(order).reset_index(drop=True),
+                                  expected.sort_values(order).reset_index(drop=True))
+            ok = ok and matched
+            print(f"  {'✅' if matched else '❌'} history {start} .. {end}: {len(actual)} rows")
+    
+    if not ok:
+        print("❌ Snapshot store differs from the stored frames\n")
+        return False
+    print("✅ Snapshot store matches the stored frames\n")
+    return True
+
+def test_feature_pipeline():
+    """Check that incremental feature runs equal a full run over the same orders."""
+    print("🔍 Testing feature pipeline (full vs. incremental)...")
+    
+    import tempfile
+    from datetime import date, datetime
+    import numpy as np
+    import pandas as pd
+    from customer_data import find_dashboard_data
+    from feature_pipeline import FEATURE_COLUMNS, run_full, run_incremental
+    from synthetic_data import generate_transactions
+    
+    customers = pd.read_csv(find_dashboard_data()).head(500)
+    orders = generate_transactions(customers, np.random.default_rng(0), datetime(2025, 7, 31))
+    # Only the columns the pipeline reads, so the run does not touch the ingestion store
+    orders = orders[["customer_id", "order_date", "gmv"]]
+    order_dates = pd.to_datetime(orders["order_date"])
+    
+    ok = True
+    cases = [
+        ("same month", date(2025, 4, 10), date(2025, 4, 24)),
+        ("next month", date(2025, 4, 10), date(2025, 5, 20)),
+        ("no new orders", date(2025, 4, 10), date(2025, 4, 28)),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        def write(name, mask):
+            path = os.path.join(tmp, name)
+            orders[mask.to_numpy()].to_csv(path, index=False)
+            return path
+        
+        for label, first, second in cases:
+            before = order_dates <= pd.Timestamp(first)
+            after = (order_dates > pd.Timestamp(first)) & (order_dates <= pd.Timestamp(second))
+            after &= label != "no new orders"
+            old, new, everything = write("old.csv", before), write("new.csv", after), write("all.csv", before | after)
+            
+            totals, features = run_full(old, first)
+            _, incremental, recomputed = run_incremental(new, second, totals, features, first)
+            _, full = run_full(everything, second)
+            matched = (list(incremental["customer_id"]) == list(full["customer_id"]) and all(
+                np.allclose(incremental[c].to_numpy(dtype=float), full[c].to_numpy(dtype=float))
+                for c in FEATURE_COLUMNS))
+            ok = ok and matched
+            print(f"  {'✅' if matched else '❌'} {label}: {recomputed:,} of {len(full):,} customers recomputed")
+        
+        # A back-dated full run only sees orders up to its as-of date
+        as_of = date(2025, 1, 15)
+        _, backdated = run_full(write("all.csv", order_dates.notna()), as_of)
+        seen = orders[(order_dates <= pd.Timestamp(as_of)).to_numpy()]
+        months = pd.to_datetime(seen["order_date"]).dt.to_period("M")
+        expected = months.groupby(seen["customer_id"]).nunique()
+        matched = (list(backdated["customer_id"]) == list(expected.index)
+                   and (backdated["active_months"].to_numpy() == expected.to_numpy()).all()
+                   and (backdated["days_since_last_order"] >= 0).all())
+        ok = ok and matched
+        print(f"  {'✅' if matched else '❌'} back-dated to {as_of}: {len(backdated):,} customers")
+    
+    if not ok:
+        print("❌ Incremental features differ from a full run\n")
+        return False
+    print("✅ Incremental features match a full run\n")
+    return True
+
+def test_performance():
+    """Compare a gate benchmark run against benchmark_baseline.json."""
+    print("🔍 Testing performance against baseline...")
+    
+    if os.environ.get(PERF_SKIP_ENV_VAR):
+        print(f"  ⚠️  Skipped ({PERF_SKIP_ENV_VAR} is set)")
+        print("✅ Performance gate skipped\n")
+        return True
+    
+    try:
+        from benchmarks import BASELINE_FILE, compare_to_baseline, load_baseline, same_workload, speed_ratio
+    except ImportError as e:
+        print(f"  ❌ Could not import benchmarks: {e}")
+        return False
+    
+    baseline = load_baseline()
+    if baseline is None:
+        print(f"  ⚠️  No {BASELINE_FILE} found - run: python benchmarks.py --gate --update-baseline")
+        print("✅ Performance gate skipped\n")
+        return True
+    
+    # A separate process, so memory figures are not inflated by the other checks in this one
+    import json
+    import subprocess
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "gate_results.json")
+        start = time.perf_counter()
+        try:
+            script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks.py")
+            subprocess.run([sys.executable, script, "--gate", "--output", output],
+                           check=True, capture_output=True, text=True, timeout=PERF_TIME_BUDGET_S)
+        except subprocess.TimeoutExpired:
+            print(f"  ❌ Benchmarks took over {PERF_TIME_BUDGET_S}s (budget)")
+            print("\n❌ Performance regressed: time budget")
+            return False
+        except subprocess.CalledProcessError as e:
+            print(f"  ❌ Benchmarks failed: {(e.stderr or e.stdout).strip().splitlines()[-1:]}")
+            return False
+        elapsed = time.perf_counter() - start
+        with open(output) as f:
+            results = json.load(f)
+    
+    print(f"  ✅ Machine speed vs. baseline: {speed_ratio(results, baseline):.2f}x calibration time "
+          f"(timing limits scaled)")
+    if not same_workload(results, baseline):
+        print("  ⚠️  Baseline was taken with other groups/pages; memory not compared "
+              "- run: python benchmarks.py --gate --update-baseline")
+    
+    rows = compare_to_baseline(results, baseline)
+    for row in rows:
+        unit, scale = ("MB", 1) if row["name"].startswith("memory.") else ("ms", 1000)
+        status = "✅" if row["ok"] else "❌"
+        print(f"  {status} {row['name']}: {row['current'] * scale:.1f} {unit} "
+              f"(baseline {row['baseline'] * scale:.1f}, limit {row['limit'] * scale:.1f})")
+    
+    failed = [row["name"] for row in rows if not row["ok"]]
+    if failed:
+        print(f"\n❌ Performance regressed: {', '.join(failed)}")
+        print(f"  💡 If the slowdown is expected, run: python benchmarks.py --gate --update-baseline")
+        return False
+    
+    print(f"✅ No performance regressions ({elapsed:.0f}s)\n")
+    return True
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -187,7 +629,15 @@ def main():
         ("Imports", test_imports),
         ("App Syntax", test_app_syntax),
         ("Config", test_config),
-        ("Security", test_no_secrets)
+        ("Security", test_no_secrets),
+        ("Ingestion Errors", test_ingestion_errors),
+        ("Intent Router", test_intent_router),
+        ("Quantile Sketch", test_quantile_sketch),
+        ("Bitmap Index", test_bitmap_index),
+        ("Query Planner", test_query_planner),
+        ("Snapshot Store", test_snapshot_store),
+        ("Feature Pipeline", test_feature_pipeline),
+        ("Performance", test_performance)
     ]
     
     results = []